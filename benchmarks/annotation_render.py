@@ -0,0 +1,160 @@
+"""
+Compares rendering of typing annotations with wrappers created for every
+nested node and with memoized renderer
+
+Usage:
+    python -m benchmarks.annotation_render [--repeat N] [SOURCE_PATH ...]
+"""
+import argparse
+import ast
+import os
+import time
+from typing import List, Optional
+
+import pymdocs
+from pymdocs.parsers.annotation import render
+from pymdocs.parsers.ast import AstWrapper, Typing
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+DEFAULT_PATHS = (
+    os.path.join(DEFAULT_SOURCE_PATH, 'typing.py'),
+    os.path.join(DEFAULT_SOURCE_PATH, 'importlib'),
+    os.path.join(DEFAULT_SOURCE_PATH, 'tomllib'),
+    os.path.dirname(pymdocs.__file__)
+)
+
+
+class LegacyTyping(AstWrapper):
+    """Typing wrapper rendering annotation on every access"""
+
+    @property
+    def annotation(self) -> str:
+        """Returns annotation, creating wrapper for every nested node"""
+        node = self.ast_element
+        if isinstance(node, ast.Name):
+            return node.id
+        elif isinstance(node, ast.Constant):
+            return str(node.value)
+        elif isinstance(node, ast.Subscript):
+            value = LegacyTyping(node.value, self.path).annotation
+            value_slice = LegacyTyping(node.slice, self.path).annotation
+            return f'{value}[{value_slice}]'
+        elif isinstance(node, ast.Attribute):
+            value = LegacyTyping(node.value, self.path).annotation
+            return f'{value}.{node.attr}'
+        elif isinstance(node, ast.Tuple):
+            return ', '.join(
+                LegacyTyping(element, self.path).annotation
+                for element in node.elts
+            )
+        elif isinstance(node, ast.BinOp):
+            left = LegacyTyping(node.left, self.path).annotation
+            right = LegacyTyping(node.right, self.path).annotation
+            return '(' + ' '.join((left, '|', right)) + ')'
+
+        raise ValueError(f'Unknown annotation type: {node}')
+
+
+def collect(paths: List[str]) -> List[ast.AST]:
+    """Returns arguments and return annotations of modules"""
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            files.append(path)
+            continue
+
+        for root, _, names in os.walk(path):
+            files.extend(
+                os.path.join(root, name)
+                for name in names
+                if name.endswith('.py')
+            )
+
+    annotations: List[ast.AST] = []
+    for file in files:
+        with open(file, 'rb') as f:
+            tree = ast.parse(f.read())
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.arg) and node.annotation is not None:
+                annotations.append(node.annotation)
+            elif (
+                isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and node.returns is not None
+            ):
+                annotations.append(node.returns)
+
+    return annotations
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='*',
+        default=[path for path in DEFAULT_PATHS if os.path.exists(path)],
+        help='Paths to Python modules or packages'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of timed runs, the best one is reported'
+    )
+    args = parser.parse_args(argv)
+
+    annotations = collect(args.SOURCE_PATH)
+    if not annotations:
+        parser.error('no annotations found')
+
+    legacy_wrappers = [LegacyTyping(node, '') for node in annotations]
+    failures = 0
+    for wrapper in legacy_wrappers:
+        try:
+            wrapper.annotation
+        except ValueError:
+            failures += 1
+
+    rendered = [render(node) for node in annotations]
+    print(
+        f'{len(annotations)} annotations, {len(set(rendered))} distinct, '
+        f'{failures} unsupported by legacy rendering'
+    )
+
+    def legacy() -> None:
+        for wrapper in legacy_wrappers:
+            try:
+                wrapper.annotation
+            except ValueError:
+                pass
+
+    def first_access() -> None:
+        for node in annotations:
+            Typing(node, '').annotation
+
+    wrappers = [Typing(node, '') for node in annotations]
+    for wrapper in wrappers:
+        wrapper.annotation
+
+    def next_access() -> None:
+        for wrapper in wrappers:
+            wrapper.annotation
+
+    print(f'{"rendering":<24} {"us/annotation":>14}')
+    for name, function in (
+        ('legacy', legacy),
+        ('memoized, first access', first_access),
+        ('memoized, next access', next_access)
+    ):
+        best = float('inf')
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+
+        print(f'{name:<24} {best / len(annotations) * 1e6:>14.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+"""
+Generates deterministic synthetic Python packages for benchmarks, the same
+options and seed always give the same sources
+
+Usage:
+    python -m benchmarks.corpus [--depth N] [--packages N] [--modules N]
+        [--classes N] [--functions N] [--methods N]
+        [--styles google=1,numpy=1,plain=1] [--annotations 0-3]
+        [--seed N] OUTPUT_PATH
+"""
+import argparse
+import os
+import random
+from typing import Dict, List, Optional
+
+# Annotations by complexity level, level 0 means no annotations
+ANNOTATIONS: List[List[str]] = [
+    [],
+    ['int', 'str', 'float', 'bool', 'bytes'],
+    [
+        'List[int]',
+        'Optional[str]',
+        'Dict[str, int]',
+        'Tuple[int, ...]',
+        'Iterator[bytes]'
+    ],
+    [
+        'Dict[str, List[Tuple[int, Optional[str]]]]',
+        'Callable[[int, str], Union[str, bytes, None]]',
+        'Optional[Dict[Tuple[int, int], List[Set[str]]]]',
+        'Union[List[Dict[str, Any]], Tuple[Callable[..., int], ...]]',
+        "Iterable[Tuple[str, 'Node', Optional[Dict[str, float]]]]"
+    ]
+]
+
+WORDS = (
+    'value', 'index', 'record', 'buffer', 'source', 'target', 'node', 'path',
+    'limit', 'offset', 'config', 'result', 'item', 'handler', 'state', 'key'
+)
+
+
+class CorpusConfig:
+    """
+    Shape of synthetic package
+
+    Attributes:
+        depth: int, number of nested package levels below the root package
+        packages: int, number of subpackages of every package
+        modules: int, number of modules of every package besides __init__
+        classes: int, number of classes of every module
+        functions: int, number of functions of every module
+        methods: int, number of methods of every class besides __init__
+        styles: dict[str, int], weights of docstring styles: google, numpy
+            and plain docstrings without sections
+        annotations: int, annotations complexity from 0, no annotations,
+            to 3, deeply nested generic types
+        seed: int, random seed
+    """
+
+    def __init__(
+        self,
+        depth: int = 1,
+        packages: int = 2,
+        modules: int = 4,
+        classes: int = 3,
+        functions: int = 4,
+        methods: int = 4,
+        styles: Optional[Dict[str, int]] = None,
+        annotations: int = 2,
+        seed: int = 0
+    ):
+        self.depth = depth
+        self.packages = packages
+        self.modules = modules
+        self.classes = classes
+        self.functions = functions
+        self.methods = methods
+        self.styles = styles or {'google': 1, 'numpy': 1, 'plain': 1}
+        self.annotations = annotations
+        self.seed = seed
+
+    def as_dict(self) -> Dict[str, object]:
+        """Returns options, stored together with benchmark results"""
+        return {
+            'depth': self.depth,
+            'packages': self.packages,
+            'modules': self.modules,
+            'classes': self.classes,
+            'functions': self.functions,
+            'methods': self.methods,
+            'styles': dict(self.styles),
+            'annotations': self.annotations,
+            'seed': self.seed
+        }
+
+    def module_count(self) -> int:
+        """Returns number of generated modules, __init__ modules included"""
+        packages = sum(
+            self.packages ** level
+            for level in range(self.depth + 1)
+        )
+        return packages * (self.modules + 1)
+
+
+class _Generator:
+    """Writes sources of synthetic package with one random generator"""
+
+    def __init__(self, config: CorpusConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.styles = sorted(
+            style
+            for style, weight in config.styles.items()
+            if weight > 0
+        )
+        self.weights = [config.styles[style] for style in self.styles]
+
+    def words(self, n: int) -> str:
+        return ' '.join(self.random.choice(WORDS) for _ in range(n))
+
+    def annotation(self) -> Optional[str]:
+        choices = ANNOTATIONS[self.config.annotations]
+        return self.random.choice(choices) if choices else None
+
+    def docstring(
+        self,
+        indent: str,
+        arguments: List[str],
+        returns: bool
+    ) -> List[str]:
+        """Returns docstring lines in one of configured styles"""
+        style = self.random.choices(self.styles, self.weights)[0]
+        lines = [
+            f'{self.words(5).capitalize()}',
+            '',
+            f'{self.words(12).capitalize()}.',
+            f'{self.words(9).capitalize()}.'
+        ]
+
+        if style == 'google':
+            if arguments:
+                lines += ['', 'Args:']
+                lines += [
+                    f'    {name}: {self.annotation() or "Any"}, '
+                    f'{self.words(6)}'
+                    for name in arguments
+                ]
+            if returns:
+                lines += [
+                    '',
+                    'Returns:',
+                    f'    {self.annotation() or "Any"}: {self.words(5)}'
+                ]
+            if arguments or returns:
+                lines += ['', 'Raises:', f'    ValueError: {self.words(4)}']
+        elif style == 'numpy':
+            if arguments:
+                lines += ['', 'Parameters', '----------']
+                for name in arguments:
+                    lines += [
+                        f'{name} : {self.annotation() or "Any"}',
+                        f'    {self.words(6)}'
+                    ]
+            if returns:
+                lines += [
+                    '',
+                    'Returns',
+                    '-------',
+                    f'{self.annotation() or "Any"}',
+                    f'    {self.words(5)}'
+                ]
+            if arguments or returns:
+                lines += [
+                    '',
+                    'Raises',
+                    '------',
+                    'ValueError',
+                    f'    {self.words(4)}'
+                ]
+
+        return (
+            [f'{indent}"""']
+            + [f'{indent}{line}' if line else '' for line in lines]
+            + [f'{indent}"""']
+        )
+
+    def function(self, name: str, indent: str, method: bool) -> List[str]:
+        """Returns function source lines"""
+        arguments = [
+            f'{self.random.choice(WORDS)}_{i}'
+            for i in range(self.random.randint(0, 4))
+        ]
+        signature = ['self'] if method else []
+        for argument in arguments:
+            annotation = self.annotation()
+            signature.append(
+                f'{argument}: {annotation}' if annotation else argument
+            )
+
+        returns = self.annotation()
+        header = f'{indent}def {name}({", ".join(signature)})'
+        header += f' -> {returns}:' if returns else ':'
+
+        body_indent = indent + '    '
+        return (
+            [header]
+            + self.docstring(body_indent, arguments, returns is not None)
+            + [
+                f'{body_indent}{argument}_copy = {argument}'
+                for argument in arguments
+            ]
+            + [f'{body_indent}return None', '']
+        )
+
+    def module(self, name: str) -> str:
+        """Returns module source"""
+        config = self.config
+        lines = self.docstring('', [], False)
+        lines += [
+            'from typing import (',
+            '    Any, Callable, Dict, Iterable, Iterator, List, Optional, '
+            'Set, Tuple,',
+            '    Union',
+            ')',
+            '',
+            ''
+        ]
+
+        class_name = name.title().replace('_', '')
+        for i in range(config.classes):
+            base = f'({class_name}Base{i - 1})' if i else ''
+            lines += [f'class {class_name}Base{i}{base}:']
+            lines += self.docstring('    ', [], False)
+            lines += ['']
+            lines += self.function('__init__', '    ', True)
+            for j in range(config.methods):
+                lines += self.function(
+                    f'{self.random.choice(WORDS)}_method_{j}',
+                    '    ',
+                    True
+                )
+            lines += ['']
+
+        for i in range(config.functions):
+            lines += self.function(
+                f'{self.random.choice(WORDS)}_function_{i}',
+                '',
+                False
+            )
+            lines += ['']
+
+        lines += self.function('_private_helper', '', False)
+        return '\n'.join(lines).rstrip('\n') + '\n'
+
+    def package(self, path: str, level: int) -> None:
+        """Writes package and its subpackages recursively"""
+        os.makedirs(path, exist_ok=True)
+        self.write(os.path.join(path, '__init__.py'), self.module('package'))
+
+        for i in range(self.config.modules):
+            name = f'module_{i}'
+            self.write(os.path.join(path, f'{name}.py'), self.module(name))
+
+        if level < self.config.depth:
+            for i in range(self.config.packages):
+                self.package(
+                    os.path.join(path, f'subpackage_{level + 1}_{i}'),
+                    level + 1
+                )
+
+    def write(self, path: str, source: str) -> None:
+        with open(path, 'w') as f:
+            f.write(source)
+
+
+def generate(path: str, config: CorpusConfig) -> str:
+    """
+    Writes synthetic package to directory
+
+    Args:
+        path: str, path to directory, package directory is created inside
+        config: CorpusConfig, package shape
+
+    Returns:
+        str: path to package directory
+    """
+
+    package_path = os.path.join(path, 'synthetic')
+    _Generator(config).package(package_path, 0)
+    return package_path
+
+
+def parse_styles(value: str) -> Dict[str, int]:
+    """Parses style weights like "google=2,numpy=1,plain=0" """
+    styles = {}
+    for item in value.split(','):
+        style, _, weight = item.partition('=')
+        styles[style.strip()] = int(weight or 1)
+
+    return styles
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('OUTPUT_PATH', help='Directory to write package to')
+    parser.add_argument('--depth', type=int, default=1)
+    parser.add_argument('--packages', type=int, default=2)
+    parser.add_argument('--modules', type=int, default=4)
+    parser.add_argument('--classes', type=int, default=3)
+    parser.add_argument('--functions', type=int, default=4)
+    parser.add_argument('--methods', type=int, default=4)
+    parser.add_argument(
+        '--styles',
+        type=parse_styles,
+        default='google=1,numpy=1,plain=1',
+        help='Docstring style weights'
+    )
+    parser.add_argument(
+        '--annotations',
+        type=int,
+        choices=range(len(ANNOTATIONS)),
+        default=2,
+        help='Annotations complexity'
+    )
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = CorpusConfig(
+        depth=args.depth,
+        packages=args.packages,
+        modules=args.modules,
+        classes=args.classes,
+        functions=args.functions,
+        methods=args.methods,
+        styles=args.styles,
+        annotations=args.annotations,
+        seed=args.seed
+    )
+    path = generate(args.OUTPUT_PATH, config)
+    print(f'{config.module_count()} modules written to {path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Measures docstrings parsed per second with and without the parsed docstrings
+cache, docstrings are parsed once in source order like pymdocs does
+
+Usage:
+    python -m benchmarks.docstring_cache [--cache-size N] [--repeat N]
+        [SOURCE_PATH]
+"""
+import argparse
+import os
+import time
+from typing import List, Optional
+
+import pymdocs.parsers.docstring as doc
+from pymdocs.parsers.ast import _iter_docstrings
+from pymdocs.parsers.docstring.cache import DEFAULT_CACHE_SIZE
+from pymdocs.parsers.walker import SourceFile, SourceWalker
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+
+def measure(docstrings: List[str], cache_size: int, repeat: int) -> float:
+    """Returns the best number of parsed docstrings per second"""
+    best = float('inf')
+    for _ in range(repeat):
+        doc.cache_clear()
+        doc.docstring_cache().resize(cache_size)
+
+        start = time.perf_counter()
+        for docstring in docstrings:
+            try:
+                doc.parse(docstring)
+            except Exception:
+                continue
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(docstrings) / best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package with docstrings'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CACHE_SIZE,
+        help='Maximum number of cached docstrings'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs, the best one is reported'
+    )
+    args = parser.parse_args(argv)
+
+    tree = SourceWalker().walk(args.SOURCE_PATH)
+    if tree is None:
+        parser.error(f'{args.SOURCE_PATH} is not a python package or module')
+
+    files: List[SourceFile] = (
+        [tree] if isinstance(tree, SourceFile) else list(tree.iter_modules())
+    )
+    docstrings = []
+    for file in files:
+        try:
+            docstrings.extend(_iter_docstrings([file]))
+        except (SyntaxError, ValueError):
+            continue
+
+    print(
+        f'{len(docstrings)} docstrings, '
+        f'{len(set(docstrings))} distinct'
+    )
+
+    uncached = measure(docstrings, 0, args.repeat)
+    cached = measure(docstrings, args.cache_size, args.repeat)
+    info = doc.cache_info()
+    print(f'{"uncached":<10} {uncached:>10.0f} docstrings/s')
+    print(f'{"cached":<10} {cached:>10.0f} docstrings/s')
+    print(
+        f'hits {info["hits"]}, misses {info["misses"]}, '
+        f'evictions {info["evictions"]}, '
+        f'size {info["size"]}/{info["max_size"]}'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""
+Checks single pass docstring parsers against the previous regex parsers and
+compares their speed, exits with status 1 if any docstring is parsed
+differently
+
+Usage:
+    python -m benchmarks.docstring_oracle [--repeat N] [SOURCE_PATH ...]
+"""
+import argparse
+import inspect
+import os
+import re
+import sys
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import pymdocs
+import pymdocs.parsers.docstring as doc
+from pymdocs.parsers.ast import _iter_docstrings
+from pymdocs.parsers.docstring import google, numpy
+from pymdocs.parsers.walker import SourceFile, SourceWalker
+
+DEFAULT_SOURCE_PATHS = [
+    os.path.dirname(os.__file__),
+    os.path.dirname(pymdocs.__file__)
+]
+
+# Docstrings covering cases real code rarely has
+EDGE_CASES = [
+    '',
+    '\n\n',
+    'Summary only',
+    'Args:',
+    'Args: x (int): inline argument',
+    'Summary\n\n    Args:\n        x (int): first\n        y: second\n\n',
+    'Summary\n\tArgs:\n\t\tx (int): tab indented\n\t\t\tcontinued\n',
+    'Summary\n    Args:\n        x (Dict[str,\n            int]): wrapped\n',
+    'Summary\n    Raises:\n        ValueError\n            : colon below\n',
+    'Summary\n    Returns:\n        (int | None)\n\n        : spaced\n',
+    'Summary\n    Returns:\n        int: value\n    \n    Yields:\n  str: x\n',
+    'Args:\n    *args: positional\n    **kwargs (dict): keywords\nReturns:',
+    'Summary\n\n    Examples:\n        >>> f()\n        1\n\n    Notes:\n',
+    '  \n  Summary\n  \n    Args:\n  \n      x: described\n  \n',
+    '\v\f Summary\n    Args:\n    \f  x: form feed\n',
+    'Summary\n\nParameters\n----------\nx : int\n    first\ny\n    second\n',
+    'Parameters\n---\nx :\n    no type\nReturns\n-------\nint\n    value\n',
+    'Summary\n    Parameters  \n    ------\n    x : (int | None)\n',
+    'Summary\nRaises\n------ trailing\nValueError\n    invalid\nReturns\n',
+    'Summary\nYields\n------\nint\n    value\nExamples\n--------\n>>> f()',
+    'Summary\nNotes\n-----\ntext',
+    'Summary\nSee Also\n--------\nother',
+    'Args:\nParameters\n----------\nx : int\nReturns:\n    int: value\n',
+]
+
+
+# Previous regex parsers used as the correctness oracle, element patterns
+# are shared and matched at every line start like before
+
+def _legacy_iter_split(
+    pattern: re.Pattern,
+    text: str
+) -> Iterator[Tuple[Optional[re.Match], str]]:
+    pos = 0
+    last_group: Optional[re.Match] = None
+    for group in pattern.finditer(text):
+        yield last_group, text[pos:group.start()]
+        pos = group.end()
+        last_group = group
+
+    yield last_group, text[pos:]
+
+
+def _legacy_patterns(
+    module,
+    section_pattern: str,
+    element_prefix: str
+) -> Tuple[re.Pattern, Dict[str, re.Pattern]]:
+    element_patterns = {
+        section_type: re.compile(
+            element_prefix + pattern.pattern,
+            re.MULTILINE
+        )
+        for section_type, pattern
+        in module.SECTION_ELEMENT_PATTERN_MAP.items()
+    }
+    names = '|'.join(member.value for member in module.DocstringSections)
+    return (
+        re.compile(section_pattern.format(names), re.MULTILINE),
+        element_patterns
+    )
+
+
+_LEGACY_PATTERNS = {
+    google: _legacy_patterns(google, r'^(?P<type>({})):', '^'),
+    numpy: _legacy_patterns(numpy, r'^(?P<type>({}))[ \t]*\n----*', '^')
+}
+
+
+def _legacy_parse(module, docstring: str) -> doc.Docstring:
+    section_pattern, element_patterns = _LEGACY_PATTERNS[module]
+    description = None
+    sections = []
+    for group, text in _legacy_iter_split(
+        section_pattern,
+        inspect.cleandoc(docstring)
+    ):
+        if group is None:
+            description = inspect.cleandoc(text)
+            continue
+
+        section_type = group.group('type')
+        element_pattern = element_patterns[section_type]
+        section_element = module.SECTION_ELEMENT_CLASS_MAP[section_type]
+        attributes = []
+        for element, element_text in _legacy_iter_split(
+            element_pattern,
+            text
+        ):
+            description_text = inspect.cleandoc(element_text)
+            if section_type in module.SINGLE_SECTIONS:
+                attributes.append(
+                    section_element(description=description_text)
+                )
+            elif element is not None:
+                attributes.append(
+                    section_element(
+                        description=description_text,
+                        **element.groupdict()
+                    )
+                )
+
+        sections.append(
+            module.SECTION_CLASS_MAP[section_type](attributes=attributes)
+        )
+
+    return doc.Docstring(attributes=sections, description=description)
+
+
+def _legacy_detect_parse(docstring: str) -> doc.Docstring:
+    cleared_docstring = inspect.cleandoc(docstring)
+    best_fit = numpy
+    n_sections = 1
+    for module in (google, numpy):
+        section_pattern, _ = _LEGACY_PATTERNS[module]
+        module_sections = len(section_pattern.findall(cleared_docstring))
+        if module_sections >= n_sections:
+            best_fit = module
+            n_sections = module_sections
+
+    return _legacy_parse(best_fit, docstring)
+
+
+def dump(parse_func: Callable[[str], doc.Docstring], docstring: str):
+    """Returns comparable structure of parsed docstring or raised error"""
+    try:
+        result = parse_func(docstring)
+    except Exception as e:
+        return type(e).__name__
+
+    return (
+        result.description,
+        [
+            (
+                type(section).__name__,
+                [
+                    (type(element).__name__, sorted(vars(element).items()))
+                    for element in section._attributes
+                ]
+            )
+            for section in result._attributes
+        ]
+    )
+
+
+def collect_docstrings(paths: List[str]) -> List[str]:
+    """Returns docstrings of all modules under given paths"""
+    docstrings = []
+    for path in paths:
+        tree = SourceWalker().walk(path)
+        if tree is None:
+            continue
+
+        files: List[SourceFile] = (
+            [tree]
+            if isinstance(tree, SourceFile)
+            else list(tree.iter_modules())
+        )
+        for file in files:
+            try:
+                docstrings.extend(_iter_docstrings([file]))
+            except (SyntaxError, ValueError):
+                continue
+
+    return docstrings
+
+
+def measure(
+    parse_func: Callable[[str], object],
+    docstrings: List[str],
+    repeat: int
+) -> float:
+    """Returns the best number of parsed docstrings per second"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for docstring in docstrings:
+            try:
+                parse_func(docstring)
+            except Exception:
+                pass
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(docstrings) / best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='*',
+        default=DEFAULT_SOURCE_PATHS,
+        help='Paths to Python packages with docstrings'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs, the best one is reported'
+    )
+    args = parser.parse_args(argv)
+
+    # Cached results would hide differences and parsing time
+    doc.docstring_cache().resize(0)
+
+    docstrings = EDGE_CASES + collect_docstrings(args.SOURCE_PATH)
+
+    mismatches = 0
+    print(f'{"style":<8} {"docstrings":>10} {"mismatches":>10} '
+          f'{"legacy/s":>10} {"single pass/s":>14}')
+    modes = [
+        (
+            module.__name__.rsplit('.', 1)[-1],
+            lambda docstring, module=module: _legacy_parse(module, docstring),
+            module.parse
+        )
+        for module in (google, numpy)
+    ]
+    modes.append(('detect', _legacy_detect_parse, doc.parse))
+
+    for name, legacy, parse in modes:
+        style_mismatches = 0
+        for docstring in docstrings:
+            expected = dump(legacy, docstring)
+            if dump(parse, docstring) != expected:
+                style_mismatches += 1
+                if style_mismatches <= 5:
+                    print(f'mismatch: {docstring!r}', file=sys.stderr)
+
+        mismatches += style_mismatches
+        print(
+            f'{name:<8} '
+            f'{len(docstrings):>10} {style_mismatches:>10} '
+            f'{measure(legacy, docstrings, args.repeat):>10.0f} '
+            f'{measure(parse, docstrings, args.repeat):>14.0f}'
+        )
+
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
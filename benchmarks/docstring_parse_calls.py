@@ -0,0 +1,55 @@
+"""
+Counts docstring parser calls while formatting a package
+
+Usage:
+    python -m benchmarks.docstring_parse_calls [SOURCE_PATH]
+"""
+import argparse
+import os
+import time
+from typing import List, Optional
+
+import pymdocs.parsers.docstring as doc
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+
+DEFAULT_SOURCE_PATH = os.path.join(os.path.dirname(os.__file__), 'asyncio')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package to document'
+    )
+    args = parser.parse_args(argv)
+
+    calls = 0
+    docstrings = set()
+    parse_docstring = doc.parse
+
+    def counting_parse(docstring, *args, **kwargs):
+        nonlocal calls
+        calls += 1
+        docstrings.add(id(docstring))
+        return parse_docstring(docstring, *args, **kwargs)
+
+    definition = parse(args.SOURCE_PATH)
+    doc.parse = counting_parse
+    try:
+        start = time.perf_counter()
+        Formatter().format(definition).render()
+        elapsed = time.perf_counter() - start
+    finally:
+        doc.parse = parse_docstring
+
+    print(f'doc.parse calls:         {calls}')
+    print(f'distinct docstrings:     {len(docstrings)}')
+    print(f'calls per docstring:     {calls / max(len(docstrings), 1):.2f}')
+    print(f'format and render time:  {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Measures docstrings parsed per second with every docstring style mode
+
+Usage:
+    python -m benchmarks.docstring_styles [--repeat N] [SOURCE_PATH]
+"""
+import argparse
+import os
+import time
+from typing import Callable, List, Optional
+
+import pymdocs.parsers.docstring as doc
+from pymdocs.parsers.ast import _iter_docstrings, resolve_docstring_style
+from pymdocs.parsers.walker import SourceFile, SourceWalker
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+
+def best_fit_parse(docstring: str) -> doc.Docstring:
+    """Parses docstring with every style, keeps result with most sections"""
+    best_fit: doc.Docstring
+    n_sections = 0
+    for parse_func in doc.DOCSTRING_STYLE_MAP.values():
+        result = parse_func(docstring)
+        if len(result._attributes) >= n_sections:
+            best_fit = result
+            n_sections = len(result._attributes)
+
+    return best_fit
+
+
+def measure(
+    parse_func: Callable[[str], doc.Docstring],
+    docstrings: List[str],
+    repeat: int
+) -> float:
+    """Returns the best number of parsed docstrings per second"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for docstring in docstrings:
+            parse_func(docstring)
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(docstrings) / best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package with docstrings'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs, the best one is reported'
+    )
+    parser.add_argument(
+        '--sample',
+        type=int,
+        default=doc.DEFAULT_SAMPLE_SIZE,
+        help='Number of docstrings with sections sampled in auto mode'
+    )
+    args = parser.parse_args(argv)
+
+    # Every run parses the same docstrings, cache would hide parsing time
+    doc.docstring_cache().resize(0)
+
+    tree = SourceWalker().walk(args.SOURCE_PATH)
+    if tree is None:
+        parser.error(f'{args.SOURCE_PATH} is not a python package or module')
+
+    files: List[SourceFile] = (
+        [tree] if isinstance(tree, SourceFile) else list(tree.iter_modules())
+    )
+    docstrings = []
+    for file in files:
+        try:
+            module_docstrings = list(_iter_docstrings([file]))
+        except (SyntaxError, ValueError):
+            continue
+
+        for docstring in module_docstrings:
+            try:
+                # Only docstrings every style parses are compared
+                for parse_func in doc.DOCSTRING_STYLE_MAP.values():
+                    parse_func(docstring)
+            except Exception:
+                continue
+
+            docstrings.append(docstring)
+
+    start = time.perf_counter()
+    sampled = resolve_docstring_style(tree, None, args.sample)
+    sample_time = time.perf_counter() - start
+    print(
+        f'{len(docstrings)} docstrings, auto mode picked '
+        f'{sampled.name if sampled else "detect"} in {sample_time:.3f}s'
+    )
+
+    modes = [
+        ('best fit of all styles', best_fit_parse),
+        ('detect', doc.parse),
+        ('auto', lambda docstring: doc.parse(docstring, sampled))
+    ] + [
+        (
+            f'pinned {style.name.lower()}',
+            lambda docstring, style=style: doc.parse(docstring, style)
+        )
+        for style in doc.DocstringStyle
+    ]
+
+    print(f'{"mode":<24} {"docstrings/s":>13}')
+    for name, parse_func in modes:
+        rate = measure(parse_func, docstrings, args.repeat)
+        print(f'{name:<24} {rate:>13.0f}')
+
+
+if __name__ == '__main__':
+    main()
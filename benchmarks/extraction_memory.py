@@ -0,0 +1,63 @@
+"""
+Compares memory used by AST wrappers and compact records
+
+Usage:
+    python -m benchmarks.extraction_memory [SOURCE_PATH]
+"""
+import argparse
+import gc
+import os
+import tracemalloc
+from typing import List, Optional
+
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+MB = 1024 * 1024
+
+
+def measure(source_path: str, compact: bool) -> None:
+    """Prints retained and peak memory of parsing and rendering"""
+    gc.collect()
+    tracemalloc.start()
+
+    definition = parse(source_path, compact=compact)
+    gc.collect()
+    parsed, parse_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    md = Formatter().format(definition).render()
+    gc.collect()
+    rendered, render_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    mode = 'compact' if compact else 'ast'
+    print(
+        f'{mode:>8} {parsed / MB:>14.1f} {parse_peak / MB:>11.1f}'
+        f' {rendered / MB:>15.1f} {render_peak / MB:>12.1f}'
+        f'  {len(md)}'
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=os.path.join(DEFAULT_SOURCE_PATH, 'email'),
+        help='Path to Python package to document'
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f'{"mode":>8} {"retained, MB":>14} {"peak, MB":>11}'
+        f' {"after render":>15} {"render peak":>12}  markdown chars'
+    )
+    for compact in (False, True):
+        measure(args.SOURCE_PATH, compact)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""
+Measures memory and allocations of formatting a large package to Markdown
+elements and rendering them, counts elements of every class in the tree
+
+Usage:
+    python -m benchmarks.markdown_memory [SOURCE_PATH]
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from collections import Counter
+from typing import List, Optional
+
+from benchmarks.render_stream import DEFAULT_EXCLUDE, DEFAULT_SOURCE_PATH
+
+import pymdocs.formatters.markdown_constructor as md
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+from pymdocs.parsers.walker import SourceWalker
+
+MB = 1024 * 1024
+
+
+def count_elements(document: md.MarkdownElement) -> Counter:
+    """Returns numbers of tree elements by class, shared ones counted once"""
+    counts: Counter = Counter()
+    seen = set()
+    stack = [document]
+    while stack:
+        element = stack.pop()
+        if id(element) in seen:
+            continue
+
+        seen.add(id(element))
+        counts[type(element).__name__] += 1
+        if isinstance(element, md.MarkdownContainer):
+            stack.extend(
+                inner
+                for inner in element.elements
+                if isinstance(inner, md.MarkdownElement)
+            )
+
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package to document'
+    )
+    args = parser.parse_args(argv)
+
+    definition = parse(
+        args.SOURCE_PATH,
+        compact=True,
+        walker=SourceWalker(exclude=DEFAULT_EXCLUDE)
+    )
+    if definition is None:
+        parser.error(f'{args.SOURCE_PATH} is not a python package or module')
+
+    formatter = Formatter()
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    document = formatter.format(definition)
+    format_time = time.perf_counter() - start
+    gc.collect()
+    retained, format_peak = tracemalloc.get_traced_memory()
+    blocks = sum(
+        stat.count
+        for stat in tracemalloc.take_snapshot().statistics('filename')
+    )
+
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as f:
+        document.render_to(f)
+
+    render_time = time.perf_counter() - start
+    _, render_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{"stage":<8} {"retained, MB":>13} {"peak, MB":>9} '
+          f'{"blocks":>9} {"time, s":>8}')
+    print(f'{"format":<8} {retained / MB:>13.1f} {format_peak / MB:>9.1f} '
+          f'{blocks:>9} {format_time:>8.2f}')
+    print(f'{"render":<8} {"":>13} {render_peak / MB:>9.1f} '
+          f'{"":>9} {render_time:>8.2f}')
+
+    counts = count_elements(document)
+    print(f'\n{sum(counts.values())} elements')
+    for name, count in counts.most_common():
+        print(f'{name:<20} {count:>9}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+"""
+Micro-benchmarks of Markdown elements rendering and docstring patterns,
+reports time and memory allocated by one operation
+
+Time is the best of several timeit runs. Memory is traced while one
+operation runs after a warm-up one: peak is the most memory allocated at
+once, kept is memory left allocated when it returns.
+
+Usage:
+    python -m benchmarks.micro [--filter TEXT] [--repeat N]
+        [--output RESULTS_PATH]
+"""
+import argparse
+import gc
+import json
+import re
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pymdocs.formatters.markdown_constructor as md
+import pymdocs.parsers.docstring.google as google
+import pymdocs.parsers.docstring.numpy as numpy
+from pymdocs.parsers.docstring.helpers import DocstringLines
+
+GOOGLE_DOCSTRING = '\n'.join(
+    [
+        'Summary line of function with *markdown* and snake_case_names',
+        '',
+        'Description paragraph explaining what the function does.',
+        '',
+        'Args:'
+    ]
+    + [
+        f'    argument_{i}: (Dict[str, int] | None), description of '
+        f'argument {i}\n        continued on the next line'
+        for i in range(40)
+    ]
+    + ['', 'Returns:', '    List[str]: names', '', 'Raises:']
+    + [f'    Error{i}: if something is wrong' for i in range(10)]
+)
+
+NUMPY_DOCSTRING = '\n'.join(
+    [
+        'Summary line of function with *markdown* and snake_case_names',
+        '',
+        'Description paragraph explaining what the function does.',
+        '',
+        'Parameters',
+        '----------'
+    ]
+    + [
+        f'argument_{i} : Dict[str, int]\n    description of argument {i}'
+        for i in range(40)
+    ]
+    + ['', 'Returns', '-------', 'List[str]', '    names', '', 'Raises',
+       '------']
+    + [f'Error{i}\n    if something is wrong' for i in range(10)]
+)
+
+
+def _deep_tree(depth: int) -> md.MarkdownElement:
+    element: md.MarkdownElement = md.StringLiteral('leaf')
+    for _ in range(depth):
+        element = md.MarkdownContainer(['level ', element], sep='')
+
+    return element
+
+
+def _table(rows: int, columns: int) -> md.Table:
+    return md.Table(
+        header=md.TableRow([f'column_{i}' for i in range(columns)]),
+        rows=[
+            md.TableRow([
+                md.InlineCode([f'cell_{row}_{column}'])
+                for column in range(columns)
+            ])
+            for row in range(rows)
+        ]
+    )
+
+
+def _pattern_cases(
+    module_name: str,
+    module: object,
+    docstring: str
+) -> Dict[str, Callable[[], object]]:
+    """Returns matching of every compiled pattern of docstring module"""
+    lines = DocstringLines(docstring)
+    end = len(lines.text)
+    return {
+        f'{module_name}.{name}': (
+            lambda pattern=pattern: list(lines.iter_matches(pattern, 0, end))
+        )
+        for name, pattern in sorted(vars(module).items())
+        if isinstance(pattern, re.Pattern)
+    }
+
+
+def cases() -> Dict[str, Callable[[], object]]:
+    """Returns benchmarked operations by name"""
+    quote = md.Quote('snake_case_name with *stars*, `ticks` and #hash ' * 4)
+    deep = _deep_tree(500)
+    wide = md.MarkdownContainer(
+        [md.StringLiteral(f'word{i}') for i in range(10000)],
+        sep=' '
+    )
+    long_text = '\n'.join(f'line {i} of quoted text' for i in range(2000))
+    blockquotes = md.Blockquotes([md.Paragraph([long_text])])
+    unordered_list = md.UnorderedList([
+        md.MarkdownContainer([md.Bold([f'item {i}']), ' description\ntext'])
+        for i in range(2000)
+    ])
+    table = _table(1000, 6)
+
+    google_lines = DocstringLines(GOOGLE_DOCSTRING)
+    google_end = len(google_lines.text)
+
+    return {
+        'Quote.render': quote.render,
+        'MarkdownContainer.render deep 500': deep.render,
+        'MarkdownContainer.render wide 10000': wide.render,
+        'Blockquotes.render 2000 lines': blockquotes.render,
+        'UnorderedList.render 2000 items': unordered_list.render,
+        'Table.render 1000x6': table.render,
+        'DocstringLines.iter_split': lambda: list(google_lines.iter_split(
+            google.DOCSTRING_ARG_PATTERN,
+            0,
+            google_end
+        )),
+        **_pattern_cases('google', google, GOOGLE_DOCSTRING),
+        **_pattern_cases('numpy', numpy, NUMPY_DOCSTRING)
+    }
+
+
+def measure(
+    operation: Callable[[], object],
+    repeat: int
+) -> Tuple[float, int, int]:
+    """
+    Measures operation
+
+    Returns:
+        tuple[float, int, int]: nanoseconds per operation, peak and kept
+            bytes allocated by one operation
+    """
+
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+
+    operation()
+    gc.collect()
+    tracemalloc.start()
+    operation()
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best * 1e9, peak, kept
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--filter',
+        default='',
+        help='Run only benchmarks containing the text'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of timed runs, the best one is reported'
+    )
+    parser.add_argument('--output', help='Path to write JSON results to')
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f'{"benchmark":<40} {"ns/op":>14} {"peak B/op":>11} {"kept B":>8}')
+    for name, operation in cases().items():
+        if args.filter not in name:
+            continue
+
+        ns, peak, kept = measure(operation, args.repeat)
+        results[name] = {'ns': ns, 'peak': peak, 'kept': kept}
+        print(f'{name:<40} {ns:>14,.0f} {peak:>11,} {kept:>8,}')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
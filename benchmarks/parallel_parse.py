@@ -0,0 +1,61 @@
+"""
+Scaling benchmark for parallel package parsing
+
+Usage:
+    python -m benchmarks.parallel_parse [SOURCE_PATH] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import time
+from typing import List, Optional
+
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+
+def render(source_path: str, jobs: int) -> str:
+    """Parses and renders package, used for comparing results"""
+    definition = parse(source_path, jobs=jobs)
+    return Formatter().format(definition).render()
+
+
+def measure(source_path: str, jobs: int, repeat: int) -> float:
+    """Returns best parsing time out of repeat runs in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(source_path, jobs=jobs)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=os.path.join(DEFAULT_SOURCE_PATH, 'asyncio'),
+        help='Path to Python package to parse'
+    )
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    serial = render(args.SOURCE_PATH, 1)
+    baseline = None
+    print(f'{"workers":>8} {"seconds":>10} {"speedup":>8}  identical')
+    for jobs in args.workers:
+        elapsed = measure(args.SOURCE_PATH, jobs, args.repeat)
+        baseline = baseline or elapsed
+        identical = render(args.SOURCE_PATH, jobs) == serial
+        print(
+            f'{jobs:>8} {elapsed:>10.3f} {baseline / elapsed:>7.2f}x'
+            f'  {identical}'
+        )
+
+
+if __name__ == '__main__':
+    main()
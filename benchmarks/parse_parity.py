@@ -0,0 +1,165 @@
+"""
+Checks that parallel and cached parsing render the same documentation as
+serial parsing, exits with status 1 if any mode fails or renders
+differently
+
+Besides given packages, a package with unrendered private docstrings the
+docstring parsers can't handle is checked, such docstrings must stay
+unparsed in every mode.
+
+Usage:
+    python -m benchmarks.parse_parity [--jobs N] [SOURCE_PATH ...]
+"""
+import argparse
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, List, Optional
+
+import pymdocs.parsers.docstring as doc
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+from pymdocs.parsers.cache import ParseCache
+
+# Module with private functions and methods having numpy sections parsers
+# don't support, serial runs never parse their docstrings
+PRIVATE_SECTIONS_MODULE = '''"""Module docstring"""
+
+
+def public(value):
+    """
+    Public function
+
+    Parameters
+    ----------
+    value : int
+        value to use
+    """
+
+
+def _private(value):
+    """
+    Private function
+
+    Parameters
+    ----------
+    value : int
+        value to use
+
+    Notes
+    -----
+    Never rendered
+    """
+
+
+class Public:
+    """Public class"""
+
+    def method(self):
+        """Public method"""
+
+    def _hidden(self):
+        """
+        Private method
+
+        See Also
+        --------
+        public
+        """
+'''
+
+
+def write_private_sections_package(path: str) -> str:
+    """Writes package with unrendered unsupported docstrings to directory"""
+    package_path = os.path.join(path, 'private_sections')
+    os.makedirs(package_path)
+    for name, source in (
+        ('__init__.py', ''),
+        ('first.py', PRIVATE_SECTIONS_MODULE),
+        ('second.py', PRIVATE_SECTIONS_MODULE),
+        ('_internal.py', PRIVATE_SECTIONS_MODULE)
+    ):
+        with open(os.path.join(package_path, name), 'w') as f:
+            f.write(source)
+
+    return package_path
+
+
+def render(source_path: str, **options) -> str:
+    """Parses and renders package from empty docstring cache"""
+    doc.cache_clear()
+    return Formatter().format(parse(source_path, **options)).render()
+
+
+def modes(jobs: int, cache_path: str) -> Dict[str, Callable[[str], str]]:
+    """Returns rendering functions of checked parsing modes by name"""
+    result: Dict[str, Callable[[str], str]] = {}
+    for extraction, options in (
+        ('ast', {}),
+        ('compact', {'compact': True}),
+        ('shallow', {'shallow': True})
+    ):
+        cache_dir = os.path.join(cache_path, extraction)
+        result[f'{extraction} jobs={jobs}'] = (
+            lambda path, options=options: render(path, jobs=jobs, **options)
+        )
+        # The first cached run stores modules, the second one loads them
+        for run in ('cold', 'warm'):
+            result[f'{extraction} cache {run}'] = (
+                lambda path, options=options, cache_dir=cache_dir: render(
+                    path,
+                    cache=ParseCache(cache_dir),
+                    **options
+                )
+            )
+
+    return result
+
+
+def check(source_path: str, jobs: int) -> int:
+    """Returns number of modes failing or differing from serial run"""
+    failures = 0
+    expected = render(source_path)
+    with tempfile.TemporaryDirectory() as cache_path:
+        for name, render_mode in modes(jobs, cache_path).items():
+            try:
+                result = render_mode(source_path)
+            except Exception as e:
+                result = f'{type(e).__name__}: {e}'
+
+            identical = result == expected
+            failures += not identical
+            print(
+                f'{os.path.basename(source_path):<20} {name:<22} {identical}'
+            )
+
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='*',
+        default=[],
+        help='Paths to Python packages checked besides the generated one'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=2,
+        help='Number of worker processes of parallel runs'
+    )
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        failures = check(write_private_sections_package(tmp_dir), args.jobs)
+
+    for path in args.SOURCE_PATH:
+        failures += check(path, args.jobs)
+
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
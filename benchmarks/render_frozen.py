@@ -0,0 +1,82 @@
+"""
+Compares time of rendering the same documentation several times with and
+without freezing it, and memory kept by rendered Markdown of frozen elements
+
+Usage:
+    python -m benchmarks.render_frozen [--repeat N] [SOURCE_PATH]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import List, Optional
+
+from benchmarks.render_stream import DEFAULT_EXCLUDE, DEFAULT_SOURCE_PATH
+
+import pymdocs.formatters.markdown_constructor as md
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+from pymdocs.parsers.walker import SourceWalker
+
+MB = 1024 * 1024
+
+
+def measure(
+    name: str,
+    document: md.MarkdownElement,
+    repeat: int
+) -> None:
+    """Prints time of the first and the next renders"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        document.render()
+        times.append(time.perf_counter() - start)
+
+    print(f'{name:<8} {times[0]:>9.3f} {min(times[1:]):>9.6f}')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package to document'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of renders, at least 2'
+    )
+    args = parser.parse_args(argv)
+
+    definition = parse(
+        args.SOURCE_PATH,
+        compact=True,
+        walker=SourceWalker(exclude=DEFAULT_EXCLUDE)
+    )
+    if definition is None:
+        parser.error(f'{args.SOURCE_PATH} is not a python package or module')
+
+    repeat = max(args.repeat, 2)
+    formatter = Formatter()
+
+    print(f'{"mode":<8} {"first, s":>9} {"next, s":>9}')
+    measure('plain', formatter.format(definition), repeat)
+
+    measure('frozen', formatter.format(definition).freeze(), repeat)
+
+    document = formatter.format(definition).freeze()
+    gc.collect()
+    tracemalloc.start()
+    document.render()
+    gc.collect()
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'\n{kept / MB:.1f} MB of rendered Markdown kept by frozen elements')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Compares memory and time of rendering documentation to one string before
+writing it and streaming it to file piece by piece
+
+Usage:
+    python -m benchmarks.render_stream [SOURCE_PATH]
+"""
+import argparse
+import gc
+import os
+import time
+import tracemalloc
+from typing import Callable, List, Optional, TextIO
+
+import pymdocs.formatters.markdown_constructor as md
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+from pymdocs.parsers.walker import SourceWalker
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+# Standard library test suites contain modules with invalid syntax
+DEFAULT_EXCLUDE = ['test/', 'tests/', 'lib2to3/', 'idlelib/', 'site-packages/']
+
+MB = 1024 * 1024
+
+
+def write_rendered(document: md.MarkdownElement, f: TextIO) -> None:
+    """Renders document to one string and writes it"""
+    f.write(document.render())
+
+
+def write_streamed(document: md.MarkdownElement, f: TextIO) -> None:
+    """Streams document to file"""
+    document.render_to(f)
+
+
+def measure(
+    name: str,
+    write: Callable[[md.MarkdownElement, TextIO], None],
+    document: md.MarkdownElement
+) -> None:
+    """Prints peak memory and time of writing document"""
+    with open(os.devnull, 'w') as f:
+        start = time.perf_counter()
+        write(document, f)
+        elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    with open(os.devnull, 'w') as f:
+        write(document, f)
+
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:<10} {peak / MB:>10.1f} {elapsed:>9.2f}')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='?',
+        default=DEFAULT_SOURCE_PATH,
+        help='Path to Python package to document'
+    )
+    args = parser.parse_args(argv)
+
+    definition = parse(
+        args.SOURCE_PATH,
+        compact=True,
+        walker=SourceWalker(exclude=DEFAULT_EXCLUDE)
+    )
+    if definition is None:
+        parser.error(f'{args.SOURCE_PATH} is not a python package or module')
+
+    document = Formatter().format(definition)
+    size = sum(len(piece) for piece in document.iter_render())
+    print(f'{size / MB:.1f} MB of markdown')
+
+    print(f'{"mode":<10} {"peak, MB":>10} {"time, s":>9}')
+    measure('render', write_rendered, document)
+    measure('stream', write_streamed, document)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Compares time and peak memory of extracting module records from full AST and
+from tokens with the shallow parser
+
+Usage:
+    python -m benchmarks.shallow_parse [--repeat N] [SOURCE_PATH ...]
+"""
+import argparse
+import ast
+import gc
+import os
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+from pymdocs.parsers.ast import ModuleRecord, RecordsExtractor
+from pymdocs.parsers.shallow import ShallowParseError, extract
+
+DEFAULT_SOURCE_PATH = os.path.dirname(os.__file__)
+
+DEFAULT_MODULES = (
+    'typing.py',
+    'inspect.py',
+    '_pydecimal.py',
+    'argparse.py',
+    'pydoc.py'
+)
+
+KB = 1024
+
+
+def extract_ast(source: bytes, path: str) -> ModuleRecord:
+    """Extracts records from full module AST"""
+    return RecordsExtractor(path).visit(ast.parse(source))
+
+
+def measure(
+    extractor: Callable[[bytes, str], ModuleRecord],
+    source: bytes,
+    path: str,
+    repeat: int
+) -> Tuple[float, int]:
+    """Returns best extraction time and peak memory of extraction"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extractor(source, path)
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    extractor(source, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        'SOURCE_PATH',
+        nargs='*',
+        default=[
+            os.path.join(DEFAULT_SOURCE_PATH, module)
+            for module in DEFAULT_MODULES
+        ],
+        help='Paths to Python modules'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of timed runs, the best one is reported'
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f'{"module":<16} {"ast, ms":>9} {"shallow, ms":>12}'
+        f' {"ast peak, KB":>13} {"shallow peak, KB":>17}'
+    )
+    for path in args.SOURCE_PATH:
+        with open(path, 'rb') as f:
+            source = f.read()
+
+        ast_time, ast_peak = measure(extract_ast, source, path, args.repeat)
+        try:
+            shallow_time, shallow_peak = measure(
+                extract,
+                source,
+                path,
+                args.repeat
+            )
+        except ShallowParseError as e:
+            print(f'{os.path.basename(path):<16} unsupported: {e}')
+            continue
+
+        print(
+            f'{os.path.basename(path):<16} {ast_time * 1000:>9.1f}'
+            f' {shallow_time * 1000:>12.1f} {ast_peak / KB:>13.0f}'
+            f' {shallow_peak / KB:>17.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+"""
+Measures pymdocs startup with python -X importtime and fails if modules
+deferred to first use are imported at startup or if more pymdocs modules
+are imported than the module budget allows
+
+Module budget doesn't depend on the machine, so it is the budget checks
+fail on. Startup overhead is the wall time of importing pymdocs in a fresh
+interpreter over the wall time of "python -c pass" measured in the same
+run. It is compared with the time budget, exceeding it is only reported
+unless --strict is set, as wall time depends on the machine and its load.
+
+Usage:
+    python -m benchmarks.startup [--runs N] [--max-modules N]
+        [--budget-ms MS] [--strict] [--top N]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pymdocs
+
+# Module imported by "python -m pymdocs"
+ENTRY_MODULE = 'pymdocs.cli'
+
+DEFAULT_BUDGET_MS = 60.0
+
+# Number of pymdocs modules imported on startup, pymdocs.cli included
+DEFAULT_MAX_MODULES = 10
+
+# Modules needed only by optional features or on first use
+DEFERRED_MODULES = (
+    'concurrent.futures.process',
+    'inspect',
+    'json',
+    'multiprocessing',
+    'pathlib',
+    'pickle',
+    'pymdocs.formatters.base',
+    'pymdocs.formatters.class_formatter',
+    'pymdocs.formatters.common_formatter',
+    'pymdocs.formatters.docstring_formatter',
+    'pymdocs.formatters.function_formatter',
+    'pymdocs.formatters.markdown_constructor',
+    'pymdocs.formatters.module_formatter',
+    'pymdocs.formatters.package_formatter',
+    'pymdocs.incremental',
+    'pymdocs.output',
+    'pymdocs.parsers.docstring.google',
+    'pymdocs.parsers.docstring.numpy',
+    'pymdocs.parsers.shallow',
+    'pymdocs.watcher',
+    'tempfile',
+    'tokenize',
+    'urllib.parse'
+)
+
+
+def _environment() -> Dict[str, str]:
+    """Returns environment of interpreter importing pymdocs sources"""
+    source_root = os.path.dirname(os.path.dirname(pymdocs.__file__))
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        filter(None, (source_root, env.get('PYTHONPATH')))
+    )
+    return env
+
+
+def wall_time(code: str) -> float:
+    """
+    Runs code in a fresh interpreter
+
+    Args:
+        code: str, Python code to run
+
+    Returns:
+        float: wall time of interpreter run in seconds
+    """
+
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-c', code],
+        env=_environment(),
+        check=True
+    )
+    return time.perf_counter() - start
+
+
+def import_times(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Imports module in a fresh interpreter
+
+    Args:
+        module: str, name of imported module
+
+    Returns:
+        dict[str, tuple[int, int]]: self and cumulative import time in
+            microseconds by imported module name
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        env=_environment(),
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        if not self_time.strip().isdigit():
+            # Header line
+            continue
+
+        times[name.strip()] = (int(self_time), int(cumulative))
+
+    return times
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--runs',
+        type=int,
+        default=5,
+        help='Number of interpreter starts, the fastest one is reported'
+    )
+    parser.add_argument(
+        '--max-modules',
+        type=int,
+        default=DEFAULT_MAX_MODULES,
+        help='Maximum number of pymdocs modules imported on startup'
+    )
+    parser.add_argument(
+        '--budget-ms',
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        help='Startup overhead over empty interpreter run in milliseconds'
+    )
+    parser.add_argument(
+        '--strict',
+        action='store_true',
+        help='Fail if startup overhead exceeds the budget'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=10,
+        help='Number of slowest imported modules to print'
+    )
+    args = parser.parse_args(argv)
+
+    runs = [import_times(ENTRY_MODULE) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[ENTRY_MODULE][1])
+    total_ms = best[ENTRY_MODULE][1] / 1000
+
+    # Empty and importing runs alternate, so both see the same machine load
+    empty = []
+    importing = []
+    for _ in range(args.runs):
+        empty.append(wall_time('pass'))
+        importing.append(wall_time(f'import {ENTRY_MODULE}'))
+
+    overhead_ms = (min(importing) - min(empty)) * 1000
+
+    print(f'{"module":<48} {"self, ms":>9}')
+    for name, (self_time, _) in sorted(
+        best.items(),
+        key=lambda item: item[1][0],
+        reverse=True
+    )[:args.top]:
+        print(f'{name:<48} {self_time / 1000:>9.2f}')
+
+    own_modules = sorted(
+        name
+        for name in best
+        if name == 'pymdocs' or name.startswith('pymdocs.')
+    )
+    print(
+        f'\n{ENTRY_MODULE} import: {total_ms:.2f} ms, {len(best)} modules, '
+        f'{len(own_modules)} pymdocs modules, budget {args.max_modules}'
+    )
+    print(
+        f'startup overhead: {overhead_ms:.2f} ms over '
+        f'{min(empty) * 1000:.2f} ms of empty interpreter run, '
+        f'budget {args.budget_ms:.2f} ms'
+    )
+
+    failed = False
+    deferred = sorted(set(DEFERRED_MODULES) & set(best))
+    if deferred:
+        print(f'Deferred modules imported at startup: {", ".join(deferred)}')
+        failed = True
+
+    if len(own_modules) > args.max_modules:
+        print(f'Module budget exceeded: {", ".join(own_modules)}')
+        failed = True
+
+    if overhead_ms > args.budget_ms:
+        print('Startup budget exceeded')
+        failed = failed or args.strict
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+"""
+End-to-end benchmark of parsing, formatting and rendering synthetic
+packages of several sizes and the standard library, results could be
+compared with stored baseline results
+
+Usage:
+    python -m benchmarks.suite [--sizes small medium large] [--repeat N]
+        [--no-stdlib] [--output RESULTS_PATH] [--baseline BASELINE_PATH]
+        [--threshold 0.1]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from benchmarks.corpus import CorpusConfig, generate
+from benchmarks.render_stream import DEFAULT_EXCLUDE, DEFAULT_SOURCE_PATH
+
+import pymdocs.parsers.docstring as doc
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.ast import parse
+from pymdocs.parsers.walker import SourceWalker
+
+# Synthetic corpora by size name
+SIZES: Dict[str, CorpusConfig] = {
+    'small': CorpusConfig(depth=0, modules=5),
+    'medium': CorpusConfig(depth=1, packages=4, modules=8),
+    'large': CorpusConfig(depth=2, packages=4, modules=10, methods=6)
+}
+
+STAGES = ('parse', 'format', 'render')
+
+# Relative slowdown reported as regression
+DEFAULT_THRESHOLD = 0.1
+
+
+def measure(
+    source_path: str,
+    repeat: int,
+    exclude: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Measures parsing, formatting and rendering of package, every run starts
+    from empty docstring cache and fresh definitions
+
+    Returns:
+        dict[str, Any]: the best time of every stage in seconds, number of
+            modules and rendered Markdown size
+    """
+
+    best = {stage: float('inf') for stage in STAGES}
+    modules = 0
+    size = 0
+    for _ in range(repeat):
+        doc.cache_clear()
+
+        start = time.perf_counter()
+        definition = parse(
+            source_path,
+            walker=SourceWalker(exclude=exclude or [])
+        )
+        parsed = time.perf_counter()
+        document = Formatter().format(definition, doc_path='reference.md')
+        formatted = time.perf_counter()
+        text = document.render()
+        rendered = time.perf_counter()
+
+        best['parse'] = min(best['parse'], parsed - start)
+        best['format'] = min(best['format'], formatted - parsed)
+        best['render'] = min(best['render'], rendered - formatted)
+        modules = sum(1 for _ in _iter_modules(definition))
+        size = len(text)
+
+    return {**best, 'modules': modules, 'chars': size}
+
+
+def _iter_modules(definition: Any) -> Iterator[Any]:
+    """Yields modules of package definition recursively"""
+    if not hasattr(definition, 'packages'):
+        yield definition
+        return
+
+    yield from definition.modules
+    for package in definition.packages:
+        yield from _iter_modules(package)
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float
+) -> List[str]:
+    """
+    Compares stage times of corpora with baseline results
+
+    Args:
+        results: dict[str, Any], benchmark results
+        baseline: dict[str, Any], stored benchmark results
+        threshold: float, relative slowdown reported as regression
+
+    Returns:
+        list[str]: descriptions of regressions
+    """
+
+    regressions = []
+    for name, corpus in results['corpora'].items():
+        base = baseline['corpora'].get(name)
+        if base is None:
+            continue
+
+        for stage in STAGES:
+            if not base.get(stage):
+                continue
+
+            change = corpus[stage] / base[stage] - 1
+            if change > threshold:
+                regressions.append(
+                    f'{name} {stage}: {base[stage]:.4f}s -> '
+                    f'{corpus[stage]:.4f}s (+{change:.0%})'
+                )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes',
+        nargs='+',
+        choices=list(SIZES),
+        default=list(SIZES),
+        help='Synthetic corpora to measure'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Number of timed runs, the best one is reported'
+    )
+    parser.add_argument(
+        '--no-stdlib',
+        action='store_true',
+        help='Skip standard library corpus'
+    )
+    parser.add_argument('--output', help='Path to write JSON results to')
+    parser.add_argument(
+        '--baseline',
+        help='Path to JSON results to compare with'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Relative slowdown reported as regression, 0.1 is 10%%'
+    )
+    args = parser.parse_args(argv)
+
+    corpora = {}
+    print(
+        f'{"corpus":<8} {"modules":>8} {"parse, s":>9} {"format, s":>10} '
+        f'{"render, s":>10}'
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in args.sizes:
+            path = generate(os.path.join(tmp_dir, name), SIZES[name])
+            corpora[name] = measure(path, args.repeat)
+            corpora[name]['config'] = SIZES[name].as_dict()
+            _print(name, corpora[name])
+
+    if not args.no_stdlib and os.path.isdir(DEFAULT_SOURCE_PATH):
+        corpora['stdlib'] = measure(
+            DEFAULT_SOURCE_PATH,
+            args.repeat,
+            DEFAULT_EXCLUDE
+        )
+        _print('stdlib', corpora['stdlib'])
+
+    results = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'corpora': corpora
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f'regression: {regression}', file=sys.stderr)
+
+        if regressions:
+            return 1
+
+        print(f'no regressions over {args.threshold:.0%}')
+
+    return 0
+
+
+def _print(name: str, corpus: Dict[str, Any]) -> None:
+    print(
+        f'{name:<8} {corpus["modules"]:>8} {corpus["parse"]:>9.3f} '
+        f'{corpus["format"]:>10.3f} {corpus["render"]:>10.3f}'
+    )
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import os
+from typing import Iterator, Optional, Tuple
+
+from pymdocs.formatters.base import FormatterType
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.formatters.module_formatter import ModuleFormatter
+from pymdocs.incremental import iter_documented_modules
+from pymdocs.parsers.ast import parse_module, resolve_docstring_style
+from pymdocs.parsers.cache import ParseCache
+from pymdocs.parsers.docstring import DocstringStyle
+from pymdocs.parsers.walker import SourceWalker
+
+
+def iter_module_docs(
+    source_path: str,
+    doc_path: str = '',
+    formatter: Optional[Formatter] = None,
+    walker: Optional[SourceWalker] = None,
+    cache: Optional[ParseCache] = None,
+    compact: bool = False,
+    shallow: bool = False,
+    docstring_style: Optional[DocstringStyle] = None,
+    docstring_sample: int = 0
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yields Markdown documentation of every public module in the order of
+    package documentation, every module is parsed, formatted and rendered
+    right before it is yielded, so only one module is kept in memory and
+    the first module comes without waiting for the whole package
+
+    Examples:
+        Writing documentation of every module to its own file
+
+        >> for name, anchor, text in iter_module_docs('./pymdocs'):
+        >>     with open(f'docs/{name}.md', 'w') as f:
+        >>         f.write(text)
+
+    Args:
+        source_path: str, path to Python module or package
+        doc_path: str, path to documentation file, source links are relative
+            to its directory, relative to the current directory by default
+        formatter: (Formatter | None), markdown formatter
+        walker: (SourceWalker | None), walker collecting package modules,
+            walker with default exclude patterns if None
+        cache: (ParseCache | None), cache of parsed modules, pruned when
+            iteration ends, None by default
+        compact: bool, extract compact records and release module AST,
+            False by default
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies, False by default
+        docstring_style: (DocstringStyle | None), pinned docstring style,
+            detected for every docstring if None
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style if it isn't pinned, 0 by default
+
+    Yields:
+        tuple[str, str, str]: qualified module name, id of module header
+            anchor and module Markdown
+
+    Raises:
+        FileNotFoundError: if source path doesn't exist
+        ValueError: if source path is not a Python module or package
+    """
+
+    if not os.path.exists(source_path):
+        raise FileNotFoundError(f'Source path {source_path} doesn\'t exist')
+
+    tree = (walker or SourceWalker()).walk(source_path)
+    if tree is None:
+        raise ValueError(f'{source_path} is not a python package or module')
+
+    style = resolve_docstring_style(
+        tree,
+        docstring_style,
+        docstring_sample,
+        shallow
+    )
+    module_formatter: ModuleFormatter = (
+        (formatter or Formatter()).formatters[FormatterType.MODULE]
+    )
+
+    # Cache is pruned once the generator is exhausted or closed
+    try:
+        for package_name, module_file in iter_documented_modules(tree):
+            module_def = parse_module(
+                module_file.path,
+                cache,
+                compact,
+                shallow,
+                style
+            )
+            module_name = (
+                f'{package_name}.{module_def.name}'
+                if package_name
+                else module_def.name
+            )
+
+            yield (
+                module_name,
+                module_formatter.module_anchor(module_name).id,
+                module_formatter.format(
+                    module_def,
+                    doc_path,
+                    package_name
+                ).render()
+            )
+    finally:
+        if cache is not None:
+            cache.prune()
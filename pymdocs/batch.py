@@ -0,0 +1,368 @@
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from pymdocs.cli import Pymdocs, docstring_options
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.parsers.cache import DEFAULT_MAX_SIZE
+from pymdocs.parsers.docstring import DEFAULT_SAMPLE_SIZE
+from pymdocs.parsers.walker import DEFAULT_EXCLUDE, SourceWalker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Job options with default values, the same as command line options
+JOB_OPTIONS: Dict[str, Any] = {
+    'split': False,
+    'check': False,
+    'incremental': False,
+    'compact': False,
+    'shallow': False,
+    'docstring_style': 'detect',
+    'docstring_sample': DEFAULT_SAMPLE_SIZE,
+    'exclude': [],
+    'ignore_file': None,
+    'no_default_exclude': False,
+    'cache_dir': None,
+    'cache_size': DEFAULT_MAX_SIZE // (1024 * 1024)
+}
+
+# Job options with paths, relative to batch file directory
+PATH_OPTIONS = ('source', 'output', 'ignore_file', 'cache_dir')
+
+
+class BatchJob:
+    """
+    Documentation job of batch file
+
+    Attributes:
+        source: str, path to Python source code
+        output: str, path to documentation file or directory
+        options: dict[str, Any], job options, see JOB_OPTIONS
+    """
+
+    def __init__(self, source: str, output: str, options: Dict[str, Any]):
+        self.source = source
+        self.output = output
+        self.options = options
+
+    def pymdocs(
+        self,
+        formatter: Optional[Formatter] = None,
+        executor: 'Optional[Executor]' = None
+    ) -> Pymdocs:
+        """
+        Returns documentation generator for job
+
+        Args:
+            formatter: (Formatter | None), markdown formatter shared by jobs
+            executor: (Executor | None), process pool shared by jobs
+
+        Returns:
+            Pymdocs: documentation generator
+        """
+
+        options = self.options
+        docstring_style, docstring_sample = docstring_options(
+            options['docstring_style'],
+            options['docstring_sample']
+        )
+
+        return Pymdocs(
+            source_path=self.source,
+            doc_path=self.output,
+            formatter=formatter,
+            cache_dir=options['cache_dir'],
+            cache_size=options['cache_size'] * 1024 * 1024,
+            compact=options['compact'],
+            walker=SourceWalker(
+                exclude=options['exclude'],
+                ignore_file=options['ignore_file'],
+                default_exclude=(
+                    ()
+                    if options['no_default_exclude']
+                    else DEFAULT_EXCLUDE
+                )
+            ),
+            incremental=options['incremental'],
+            shallow=options['shallow'],
+            docstring_style=docstring_style,
+            docstring_sample=docstring_sample,
+            split=options['split'],
+            check=options['check'],
+            executor=executor
+        )
+
+
+class JobResult:
+    """
+    Result of batch job
+
+    Attributes:
+        job: BatchJob, documentation job
+        seconds: float, job wall time
+        changed: list[str], paths of documentation files which content
+            differed, they are written unless check option is set
+        error: (str | None), error message if job failed
+    """
+
+    def __init__(
+        self,
+        job: BatchJob,
+        seconds: float,
+        changed: List[str],
+        error: Optional[str] = None
+    ):
+        self.job = job
+        self.seconds = seconds
+        self.changed = changed
+        self.error = error
+
+
+def _read_batch_file(path: str) -> Dict[str, Any]:
+    """Reads TOML or JSON batch file by its extension"""
+    if path.endswith('.toml'):
+        try:
+            # TOML parser is available since Python 3.11
+            import tomllib
+        except ImportError:
+            raise ValueError(
+                f'{path}: TOML batch files need Python 3.11 or newer, '
+                'use JSON instead'
+            ) from None
+
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+
+    with open(path) as f:
+        return json.load(f)
+
+
+def _option_error(name: str, value: Any) -> Optional[str]:
+    """
+    Checks type of job option value against type of its default value
+
+    Returns:
+        (str | None): error message if value has wrong type
+    """
+
+    default = JOB_OPTIONS[name]
+    if default is None:
+        # Optional path
+        if value is None or isinstance(value, str):
+            return None
+
+        return f'{name} should be a string'
+    elif isinstance(default, list):
+        if isinstance(value, list) and all(
+            isinstance(item, str)
+            for item in value
+        ):
+            return None
+
+        return f'{name} should be an array of strings'
+    elif isinstance(value, type(default)) and (
+        # bool is a subclass of int
+        isinstance(value, bool) == isinstance(default, bool)
+    ):
+        return None
+
+    return f'{name} should be {type(default).__name__}'
+
+
+def load_jobs(path: str) -> List[BatchJob]:
+    """
+    Loads documentation jobs from TOML or JSON batch file
+
+    Batch file has optional "defaults" table with options for all jobs and
+    "jobs" array of tables with "source", "output" and job options. Paths
+    are relative to batch file directory.
+
+    Args:
+        path: str, path to batch file
+
+    Returns:
+        list[BatchJob]: documentation jobs
+
+    Raises:
+        ValueError: if batch file is invalid
+    """
+
+    data = _read_batch_file(path)
+    base_dir = os.path.dirname(os.path.abspath(path))
+
+    defaults = data.get('defaults', {})
+    if not isinstance(data.get('jobs'), list) or not isinstance(
+        defaults,
+        dict
+    ):
+        raise ValueError(
+            f'{path}: "jobs" array and optional "defaults" table expected'
+        )
+
+    jobs = []
+    for i, job_data in enumerate(data['jobs'], 1):
+        if not isinstance(job_data, dict):
+            raise ValueError(f'{path}: job {i} is not a table')
+
+        options = {**JOB_OPTIONS, **defaults, **job_data}
+        unknown = set(options) - set(JOB_OPTIONS) - {'source', 'output'}
+        if unknown:
+            raise ValueError(
+                f'{path}: job {i}: unknown options '
+                + ', '.join(sorted(unknown))
+            )
+
+        for option in ('source', 'output'):
+            if not isinstance(options.get(option), str):
+                raise ValueError(f'{path}: job {i}: {option} is required')
+
+        if options['output'] == '-':
+            raise ValueError(
+                f'{path}: job {i}: output can\'t be standard output in batch '
+                'files'
+            )
+
+        for option in JOB_OPTIONS:
+            error = _option_error(option, options[option])
+            if error is not None:
+                raise ValueError(f'{path}: job {i}: {error}')
+
+        for option in PATH_OPTIONS:
+            if options[option] is not None:
+                options[option] = os.path.join(
+                    base_dir,
+                    os.path.expanduser(options[option])
+                )
+
+        if options['incremental'] and (options['split'] or options['check']):
+            raise ValueError(
+                f'{path}: job {i}: incremental can\'t be used with split or '
+                'check'
+            )
+
+        # Style is validated before any job runs
+        try:
+            docstring_options(str(options['docstring_style']))
+        except ValueError as e:
+            raise ValueError(f'{path}: job {i}: {e}') from None
+
+        jobs.append(
+            BatchJob(options.pop('source'), options.pop('output'), options)
+        )
+
+    return jobs
+
+
+def run_jobs(
+    jobs: List[BatchJob],
+    workers: Optional[int] = 1,
+    formatter: Optional[Formatter] = None
+) -> List[JobResult]:
+    """
+    Runs documentation jobs one by one in one process, sharing formatter,
+    docstring cache and process pool parsing modules
+
+    Args:
+        jobs: list[BatchJob], documentation jobs
+        workers: (int | None), number of worker processes parsing modules,
+            all CPUs if None or less than 1, modules are parsed in this
+            process if 1
+        formatter: (Formatter | None), markdown formatter
+
+    Returns:
+        list[JobResult]: results of jobs, failed jobs don't stop the batch
+    """
+
+    formatter = formatter or Formatter()
+
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+
+    executor: 'Optional[Executor]' = None
+    if workers > 1:
+        # Process pool machinery takes a while to import
+        from concurrent.futures import ProcessPoolExecutor
+
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    results = []
+    try:
+        for job in jobs:
+            start = time.perf_counter()
+            try:
+                changed = job.pymdocs(formatter, executor).doc()
+                error = None
+            except (OSError, SyntaxError, ValueError) as e:
+                changed = []
+                error = str(e)
+
+            results.append(
+                JobResult(job, time.perf_counter() - start, changed, error)
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='pymdocs batch',
+        description='Generates documentation for all jobs of batch file'
+    )
+
+    parser.add_argument(
+        'BATCH_PATH',
+        help='Path to TOML or JSON file with documentation jobs'
+    )
+
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help=(
+            'Number of worker processes parsing modules, shared by all '
+            'jobs, 0 for all CPUs'
+        )
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        jobs = load_jobs(args.BATCH_PATH)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    total = time.perf_counter()
+    results = run_jobs(jobs, args.jobs)
+    total = time.perf_counter() - total
+
+    failed = False
+    for result in results:
+        job = result.job
+        if result.error is not None:
+            status = f'error: {result.error}'
+            failed = True
+        elif job.options['check'] and result.changed:
+            status = 'out of date: ' + ', '.join(result.changed)
+            failed = True
+        elif result.changed:
+            status = f'{len(result.changed)} written'
+        else:
+            status = 'unchanged'
+
+        print(
+            f'{result.seconds:8.2f}s {job.source} -> {job.output}: {status}',
+            file=sys.stderr
+        )
+
+    print(f'{total:8.2f}s total, {len(results)} jobs', file=sys.stderr)
+
+    if failed:
+        sys.exit(1)
@@ -1,9 +1,22 @@
 import argparse
 import os
-from typing import Optional
+import sys
+from typing import List, Optional, TYPE_CHECKING, Tuple, Union
 
-from pymdocs.formatters.common_formatter import Formatter
 from pymdocs.parsers.ast import parse
+from pymdocs.parsers.cache import DEFAULT_MAX_SIZE, ParseCache
+from pymdocs.parsers.docstring import DEFAULT_SAMPLE_SIZE, DocstringStyle
+from pymdocs.parsers.walker import DEFAULT_EXCLUDE, SourceWalker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from pymdocs.formatters.common_formatter import Formatter
+    from pymdocs.formatters.markdown_constructor import MarkdownElement
+    from pymdocs.incremental import IncrementalBuilder
+
+# Documentation path for writing to standard output
+STDOUT_PATH = '-'
 
 
 class Pymdocs:
@@ -12,51 +25,306 @@ class Pymdocs:
 
     Attributes:
         source_path: str, path to Python source code
-        doc_path: str, path to documentation file
+        doc_path: str, path to documentation file, documentation is written
+            to standard output if "-"
         formatter: Formatter, markdown formatter
+        jobs: (int | None), number of worker processes parsing modules,
+            all CPUs if None or less than 1
+        cache: (ParseCache | None), cache of parsed modules, enabled if
+            cache_dir is set
+        compact: bool, extract compact records and release modules AST
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies
+        docstring_style: (DocstringStyle | None), pinned docstring style
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style if it isn't pinned, style of every
+            docstring is detected if 0
+        walker: SourceWalker, walker collecting package modules
+        explain: bool, print why every module was rebuilt in incremental
+            and watch modes
+        builder: (IncrementalBuilder | None), builder reusing markdown of
+            unchanged modules, enabled if incremental is set
+        split: bool, documentation path is a directory, every module is
+            documented in its own file, with index file linking them
+        check: bool, only compare generated documentation with existing
+            files, nothing is written
+        executor: (Executor | None), process pool parsing modules, shared
+            with other documentation builds, jobs are ignored if set
     """
 
     def __init__(
         self,
         source_path: str,
         doc_path: str,
-        formatter: Optional[Formatter] = None
+        formatter: 'Optional[Formatter]' = None,
+        jobs: Optional[int] = 1,
+        cache_dir: Optional[str] = None,
+        cache_size: int = DEFAULT_MAX_SIZE,
+        compact: bool = False,
+        walker: Optional[SourceWalker] = None,
+        incremental: bool = False,
+        explain: bool = False,
+        shallow: bool = False,
+        docstring_style: Optional[DocstringStyle] = None,
+        docstring_sample: int = 0,
+        split: bool = False,
+        check: bool = False,
+        executor: 'Optional[Executor]' = None
     ):
         self.source_path = source_path
         self.doc_path = doc_path
 
-        self.formatter = formatter or Formatter()
+        if formatter is None:
+            # Formatters and Markdown elements are imported when
+            # documentation is generated, not on startup
+            from pymdocs.formatters.common_formatter import Formatter
+
+            formatter = Formatter()
+
+        self.formatter = formatter
+        self.jobs = jobs
+        self.cache = (
+            ParseCache(cache_dir, cache_size)
+            if cache_dir is not None
+            else None
+        )
+        self.compact = compact
+        self.shallow = shallow
+        self.docstring_style = docstring_style
+        self.docstring_sample = docstring_sample
+        self.walker = walker or SourceWalker()
+        self.explain = explain
+        self.executor = executor
+        self.builder = (
+            self._incremental_builder(persist=True)
+            if incremental
+            else None
+        )
+        self.split = split
+        self.check = check
 
-    @staticmethod
-    def _save(md: str, path: str) -> None:
+    def _incremental_builder(self, persist: bool) -> 'IncrementalBuilder':
+        """Returns incremental builder with the same settings"""
+        # Incremental builds are optional, so builder is imported on demand
+        from pymdocs.incremental import IncrementalBuilder
+
+        return IncrementalBuilder(
+            source_path=self.source_path,
+            doc_path=self.doc_path,
+            formatter=self.formatter,
+            walker=self.walker,
+            jobs=self.jobs,
+            cache=self.cache,
+            compact=self.compact,
+            explain=self.explain,
+            shallow=self.shallow,
+            docstring_style=self.docstring_style,
+            docstring_sample=self.docstring_sample,
+            persist=persist,
+            executor=self.executor
+        )
+
+    def _save(self, md: 'MarkdownElement', path: str) -> bool:
         """
-        Saves markdown to documentation file
+        Streams markdown to documentation file piece by piece, file is
+        replaced atomically and only if its content changes
 
         Args:
-            md: str, markdown text
-            path: str, path to target file
+            md: MarkdownElement, markdown document
+            path: str, path to target file, standard output if "-"
+
+        Returns:
+            bool: True if file content differs from markdown, file is
+                written unless check is set
         """
-        with open(path, 'w') as f:
-            f.write(md)
+        if path == STDOUT_PATH:
+            md.render_to(sys.stdout)
+            sys.stdout.flush()
+            return True
+
+        from pymdocs.output import save
 
-    def doc(self) -> None:
-        """Generates Code Reference for python code"""
+        return save(md, path, self.check)
+
+    def doc(self) -> List[str]:
+        """
+        Generates Code Reference for python code
+
+        Returns:
+            list[str]: paths of documentation files which content differs
+                from generated documentation, they are written unless check
+                is set, documentation file if it was rebuilt in incremental
+                mode
+        """
         if not os.path.exists(self.source_path):
             raise FileNotFoundError(
                 f'Source path {self.source_path} doesn\'t exist'
             )
 
-        definition = parse(self.source_path)
+        if self.builder is not None:
+            return [self.doc_path] if self.builder.build() else []
+
+        definition = parse(
+            self.source_path,
+            jobs=self.jobs,
+            cache=self.cache,
+            compact=self.compact,
+            walker=self.walker,
+            shallow=self.shallow,
+            docstring_style=self.docstring_style,
+            docstring_sample=self.docstring_sample,
+            executor=self.executor
+        )
         if definition is None:
             raise ValueError(
                 f'{self.source_path} is not a python package or module'
             )
 
+        if self.split:
+            # Split output is optional, so writer is imported on demand
+            from pymdocs.split import SplitWriter
+
+            return SplitWriter(
+                self.doc_path,
+                self.formatter,
+                check=self.check
+            ).write(definition)
+
         md = self.formatter.format(definition, doc_path=self.doc_path)
-        self._save(md.render(), self.doc_path)
+        return [self.doc_path] if self._save(md, self.doc_path) else []
+
+    def watch(
+        self,
+        interval: float = 0.5,
+        debounce: float = 0.2,
+        cycles: Optional[int] = None
+    ) -> None:
+        """
+        Regenerates Code Reference on every python code change, markdown of
+        unchanged modules is kept in memory between regenerations
+
+        Args:
+            interval: float, seconds between sources polls, 0.5 by default
+            debounce: float, seconds sources have to stay unchanged before
+                regeneration, 0.2 by default
+            cycles: (int | None), number of polls before return, polls
+                forever if None
+        """
+        from pymdocs.watcher import Watcher
+
+        builder = self.builder or self._incremental_builder(persist=False)
+        Watcher(builder, interval, debounce).watch(cycles)
+
+
+# Docstring style option values besides style names
+DOCSTRING_STYLE_MODES = ['detect', 'auto']
+
+
+def docstring_options(
+    style_name: str,
+    sample: int = DEFAULT_SAMPLE_SIZE
+) -> Tuple[Optional[DocstringStyle], int]:
+    """
+    Returns pinned docstring style and sample size by style option value
+
+    Args:
+        style_name: str, "detect", "auto" or lowercase style name
+        sample: int, number of docstrings sampled in auto mode
+
+    Returns:
+        tuple[(DocstringStyle | None), int]: pinned style and number of
+            sampled docstrings
+
+    Raises:
+        ValueError: if style is unknown
+    """
+
+    if style_name == 'detect':
+        return None, 0
+    elif style_name == 'auto':
+        return None, sample
 
+    try:
+        return DocstringStyle[style_name.upper()], 0
+    except KeyError:
+        raise ValueError(f'Unknown docstring style {style_name}') from None
+
+
+def _profiled_doc(
+    doc: Pymdocs,
+    report_path: Optional[str] = None,
+    top: int = 20,
+    cprofile_path: Optional[str] = None,
+    memory_path: Optional[str] = None
+) -> List[str]:
+    """
+    Generates documentation, measuring it if report paths are set
+
+    Args:
+        doc: Pymdocs, documentation generator
+        report_path: (str | None), path to JSON profile report
+        top: int, number of the slowest modules and docstrings in profile
+            report, of the largest modules and allocation sites in memory
+            report
+        cprofile_path: (str | None), path to cProfile statistics
+        memory_path: (str | None), path to JSON memory report
+
+    Returns:
+        list[str]: paths of changed documentation files
+    """
+
+    if report_path is None and cprofile_path is None and memory_path is None:
+        return doc.doc()
+
+    # Profilers are imported only when profiling is requested
+    from contextlib import ExitStack
+
+    from pymdocs.profiling import MemoryProfiler, Profiler
+
+    reports: List[Tuple[Union[Profiler, MemoryProfiler], str]] = []
+    with ExitStack() as stack:
+        if memory_path is not None:
+            reports.append(
+                (stack.enter_context(MemoryProfiler(top)), memory_path)
+            )
+
+        if report_path is not None:
+            reports.append((stack.enter_context(Profiler(top)), report_path))
+
+        if cprofile_path is not None:
+            import cProfile
+
+            cprofile = stack.enter_context(cProfile.Profile())
+
+        changed = doc.doc()
+
+    if cprofile_path is not None:
+        cprofile.dump_stats(cprofile_path)
+
+    for profiler, path in reports:
+        profiler.save(path)
+
+    return changed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv[:1] == ['batch']:
+        # Batch mode is optional, so it's imported on demand
+        from pymdocs.batch import main as batch_main
+
+        batch_main(argv[1:])
+        return
+
+    if argv[:1] == ['serve']:
+        # Documentation server is optional, so it's imported on demand
+        from pymdocs.server import main as serve_main
+
+        serve_main(argv[1:])
+        return
 
-def main() -> None:
     parser = argparse.ArgumentParser()
 
     parser.add_argument(
@@ -66,14 +334,252 @@ def main() -> None:
 
     parser.add_argument(
         'DOC_PATH',
-        help='Path to documentation folder'
+        help=(
+            'Path to documentation file, "-" writes documentation to '
+            'standard output'
+        )
+    )
+
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes parsing modules, 0 for all CPUs'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        help='Path to directory for caching parsed modules between runs'
+    )
+
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        help='Maximum size of parsed modules cache in megabytes'
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Keep compact definitions instead of modules AST, saves memory'
+    )
+
+    parser.add_argument(
+        '--shallow',
+        action='store_true',
+        help=(
+            'Read only signatures and docstrings from tokens, skipping '
+            'function bodies, implies --compact'
+        )
+    )
+
+    parser.add_argument(
+        '--docstring-style',
+        choices=DOCSTRING_STYLE_MODES + [
+            style.name.lower()
+            for style in DocstringStyle
+        ],
+        default='detect',
+        help=(
+            'Docstring style: detect style of every docstring, pick one style '
+            'by the first docstrings (auto) or use the given style'
+        )
+    )
+
+    parser.add_argument(
+        '--docstring-sample',
+        type=int,
+        default=DEFAULT_SAMPLE_SIZE,
+        metavar='N',
+        help='Number of docstrings with sections sampled in auto style mode'
+    )
+
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='PATTERN',
+        help=(
+            'Glob pattern of source paths to skip, patterns ending with "/" '
+            'match directories only, could be used several times'
+        )
+    )
+
+    parser.add_argument(
+        '--ignore-file',
+        help='Path to file with exclude patterns, one pattern per line'
+    )
+
+    parser.add_argument(
+        '--no-default-exclude',
+        action='store_true',
+        help=(
+            'Walk into directories skipped by default: '
+            + ', '.join(DEFAULT_EXCLUDE)
+        )
+    )
+
+    parser.add_argument(
+        '--split',
+        action='store_true',
+        help=(
+            'Treat DOC_PATH as directory and write documentation of every '
+            'module to its own file, with index.md linking them'
+        )
+    )
+
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help=(
+            'Compare generated documentation with existing files without '
+            'writing them, exit with status 1 if they differ'
+        )
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help=(
+            'Keep manifest and markdown of modules next to documentation '
+            'and rebuild only changed modules'
+        )
+    )
+
+    parser.add_argument(
+        '--explain',
+        action='store_true',
+        help='Print why every module was rebuilt in incremental mode'
+    )
+
+    parser.add_argument(
+        '--profile-report',
+        metavar='PATH',
+        help=(
+            'Write JSON report with wall and CPU time of every phase, '
+            'timings of modules and the slowest modules and docstrings'
+        )
+    )
+
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=20,
+        metavar='N',
+        help=(
+            'Number of the slowest modules and docstrings in profile report, '
+            'of the largest modules and allocation sites in memory report'
+        )
+    )
+
+    parser.add_argument(
+        '--memory-report',
+        metavar='PATH',
+        help=(
+            'Write JSON report with peak and retained memory of parse, '
+            'format, render and write stages, memory of modules and the top '
+            'allocation sites, traced with tracemalloc'
+        )
+    )
+
+    parser.add_argument(
+        '--cprofile',
+        metavar='PATH',
+        help='Write cProfile statistics, readable with pstats'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and regenerate documentation on source changes'
+    )
+
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.5,
+        help='Seconds between source polls in watch mode'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.DOC_PATH == STDOUT_PATH and (args.incremental or args.watch):
+        parser.error(
+            '--incremental and --watch need path to documentation file'
+        )
+
+    if args.explain and not args.incremental:
+        parser.error('--explain needs --incremental')
+
+    if args.split and (
+        args.DOC_PATH == STDOUT_PATH or args.incremental or args.watch
+    ):
+        parser.error(
+            '--split needs path to documentation directory and can\'t be '
+            'used with --incremental or --watch'
+        )
+
+    if args.check and (
+        args.DOC_PATH == STDOUT_PATH or args.incremental or args.watch
+    ):
+        parser.error(
+            '--check needs path to documentation and can\'t be used with '
+            '--incremental or --watch'
+        )
+
+    if args.watch and (
+        args.profile_report or args.cprofile or args.memory_report
+    ):
+        parser.error(
+            '--profile-report, --memory-report and --cprofile can\'t be used '
+            'with --watch'
+        )
+
+    docstring_style, docstring_sample = docstring_options(
+        args.docstring_style,
+        args.docstring_sample
+    )
 
     doc = Pymdocs(
         source_path=args.SOURCE_PATH,
-        doc_path=args.DOC_PATH
+        doc_path=args.DOC_PATH,
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        cache_size=args.cache_size * 1024 * 1024,
+        compact=args.compact,
+        walker=SourceWalker(
+            exclude=args.exclude,
+            ignore_file=args.ignore_file,
+            default_exclude=() if args.no_default_exclude else DEFAULT_EXCLUDE
+        ),
+        incremental=args.incremental,
+        explain=args.explain,
+        shallow=args.shallow,
+        docstring_style=docstring_style,
+        docstring_sample=docstring_sample,
+        split=args.split,
+        check=args.check
     )
 
-    doc.doc()
+    if not args.watch:
+        changed = _profiled_doc(
+            doc,
+            args.profile_report,
+            args.profile_top,
+            args.cprofile,
+            args.memory_report
+        )
+        if args.check and changed:
+            for path in changed:
+                print(f'{path} is out of date', file=sys.stderr)
+
+            sys.exit(1)
+
+        return
+
+    try:
+        doc.watch(interval=args.interval)
+    except KeyboardInterrupt:
+        pass
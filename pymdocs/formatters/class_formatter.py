@@ -3,10 +3,10 @@ from typing import Optional, Tuple
 import pymdocs.formatters.markdown_constructor as md
 from pymdocs.formatters.base import BaseFormatter, FormatterType
 from pymdocs.formatters.helpers import module_line_path_link
-from pymdocs.parsers.ast import ClassDefinition
+from pymdocs.parsers.ast import AnyClassDefinition
 
 
-class ClassFormatter(BaseFormatter[ClassDefinition]):
+class ClassFormatter(BaseFormatter[AnyClassDefinition]):
     """
     Formatter for ClassDefinition objects
 
@@ -24,7 +24,7 @@ class ClassFormatter(BaseFormatter[ClassDefinition]):
 
     def format(
         self,
-        obj: ClassDefinition,
+        obj: AnyClassDefinition,
         doc_path: str = '',
         package_name: Optional[str] = None,
         module_name: Optional[str] = None
@@ -33,7 +33,7 @@ class ClassFormatter(BaseFormatter[ClassDefinition]):
         Returns Markdown element for function definition
 
         Args:
-            class_def: ClassDefinition, python class definition
+            class_def: (ClassDefinition | ClassRecord), python class definition
             doc_path: str, path to documentation file
             package_name: (str | None), name of the class package
             module_name: (str | None), name of the class module
@@ -65,8 +65,8 @@ class ClassFormatter(BaseFormatter[ClassDefinition]):
                         doc_path
                     )
                 ]),
-                md.MarkdownContainer(
-                    [
+                (
+                    md.MarkdownContainer([
                         'Base: ',
                         md.InlineCode(
                             [
@@ -76,21 +76,22 @@ class ClassFormatter(BaseFormatter[ClassDefinition]):
                             ', '
                         ),
                         md.PARAGRAPH_BREAK
-                    ] if obj.inherits else []
+                    ])
+                    if obj.inherits else md.EMPTY
                 ),
-                md.MarkdownContainer(
-                    [
+                (
+                    md.MarkdownContainer([
                         self.format_by(
                             FormatterType.DOCSTRING,
                             obj.docstring
                         ),
                         md.PARAGRAPH_BREAK
-                    ]
+                    ])
                     if obj.docstring is not None
-                    else []
+                    else md.EMPTY
                 ),
-                md.MarkdownContainer(
-                    [
+                (
+                    md.MarkdownContainer([
                         md.H4(['Methods']),
                         md.MarkdownContainer(
                             [
@@ -106,8 +107,8 @@ class ClassFormatter(BaseFormatter[ClassDefinition]):
                                 if not method.name.startswith('_')
                             ]
                         )
-                    ]
-                    if obj.methods else []
+                    ])
+                    if obj.methods else md.EMPTY
                 )
             ]
         )
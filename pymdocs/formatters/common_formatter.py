@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import pymdocs.formatters.markdown_constructor as md
 from pymdocs.formatters.base import (
@@ -13,19 +13,22 @@ from pymdocs.formatters.module_formatter import ModuleFormatter
 from pymdocs.formatters.package_formatter import PackageFormatter
 from pymdocs.parsers.ast import (
     ClassDefinition,
+    ClassRecord,
     FunctionDefinition,
+    FunctionRecord,
     ModuleDefinition,
+    ModuleRecord,
     PackageDefinition
 )
 from pymdocs.parsers.docstring.base import Docstring
 
 
-_FORMATTERS_TARGET_MAP: Dict[FormatterType, type] = {
-    FormatterType.DOCSTRING: Docstring,
-    FormatterType.FUNCTION: FunctionDefinition,
-    FormatterType.CLASS: ClassDefinition,
-    FormatterType.MODULE: ModuleDefinition,
-    FormatterType.PACKAGE: PackageDefinition
+_FORMATTERS_TARGET_MAP: Dict[FormatterType, Tuple[type, ...]] = {
+    FormatterType.DOCSTRING: (Docstring,),
+    FormatterType.FUNCTION: (FunctionDefinition, FunctionRecord),
+    FormatterType.CLASS: (ClassDefinition, ClassRecord),
+    FormatterType.MODULE: (ModuleDefinition, ModuleRecord),
+    FormatterType.PACKAGE: (PackageDefinition,)
 }
 
 _DEFAULT_FORMATTERS: Dict[FormatterType, type] = {
@@ -41,19 +41,19 @@ class DocstringFormatter(BaseFormatter[Docstring]):
                     md.UnorderedList([
                         md.MarkdownContainer([
                             md.Italic([md.Quote(arg.name)]),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     md.WHITESPACE,
                                     md.InlineCode([
                                         arg.typing_annotation
                                     ])
-                                ]
+                                ])
                                 if arg.typing_annotation is not None
-                                else []
+                                else md.EMPTY
                             ),
                             ':',
                             md.WHITESPACE,
-                            md.StringLiteral(
+                            (
                                 arg.description
                                 if arg.description is not None
                                 else ''
@@ -70,24 +70,24 @@ class DocstringFormatter(BaseFormatter[Docstring]):
                     md.UnorderedList([
                         md.MarkdownContainer([
                             md.Italic([md.Quote(attribute.name)]),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     md.WHITESPACE,
                                     md.InlineCode([
                                         attribute.typing_annotation
                                     ])
-                                ]
+                                ])
                                 if attribute.typing_annotation is not None
-                                else []
+                                else md.EMPTY
                             ),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     ':',
                                     md.WHITESPACE,
                                     attribute.description
-                                ]
+                                ])
                                 if attribute.description is not None
-                                else []
+                                else md.EMPTY
                             )
                         ])
                         for attribute in obj.attributes
@@ -101,14 +101,14 @@ class DocstringFormatter(BaseFormatter[Docstring]):
                     md.UnorderedList([
                         md.MarkdownContainer([
                             md.InlineCode([raises.exception]),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     ':',
                                     md.WHITESPACE,
                                     raises.description
-                                ]
+                                ])
                                 if raises.description is not None
-                                else []
+                                else md.EMPTY
                             )
                         ])
                         for raises in obj.raises
@@ -122,14 +122,14 @@ class DocstringFormatter(BaseFormatter[Docstring]):
                     md.MarkdownContainer([
                         md.MarkdownContainer([
                             md.InlineCode([returns.typing_annotation]),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     ':',
                                     md.WHITESPACE,
                                     returns.description
-                                ]
+                                ])
                                 if returns.description is not None
-                                else []
+                                else md.EMPTY
                             )
                         ])
                         for returns in obj.returns
@@ -143,14 +143,14 @@ class DocstringFormatter(BaseFormatter[Docstring]):
                     md.MarkdownContainer([
                         md.MarkdownContainer([
                             md.InlineCode([yields.typing_annotation]),
-                            md.MarkdownContainer(
-                                [
+                            (
+                                md.MarkdownContainer([
                                     ':',
                                     md.WHITESPACE,
                                     yields.description
-                                ]
+                                ])
                                 if yields.description is not None
-                                else []
+                                else md.EMPTY
                             )
                         ])
                         for yields in obj.yields
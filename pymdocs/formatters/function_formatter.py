@@ -3,10 +3,10 @@ from typing import Optional, Tuple
 import pymdocs.formatters.markdown_constructor as md
 from pymdocs.formatters.base import BaseFormatter, FormatterType
 from pymdocs.formatters.helpers import module_line_path_link
-from pymdocs.parsers.ast import FunctionDefinition
+from pymdocs.parsers.ast import AnyFunctionDefinition
 
 
-class FunctionFormatter(BaseFormatter[FunctionDefinition]):
+class FunctionFormatter(BaseFormatter[AnyFunctionDefinition]):
     """
     Formatter for FunctionDefinition objects
 
@@ -23,7 +23,7 @@ class FunctionFormatter(BaseFormatter[FunctionDefinition]):
 
     def format(
         self,
-        obj: FunctionDefinition,
+        obj: AnyFunctionDefinition,
         doc_path: str = '',
         package_name: Optional[str] = None,
         module_name: Optional[str] = None,
@@ -33,7 +33,8 @@ class FunctionFormatter(BaseFormatter[FunctionDefinition]):
         Returns Markdown element for function definition
 
         Args:
-            obj: FunctionDefinition, python function definition
+            obj: (FunctionDefinition | FunctionRecord), python function
+                definition
             doc_path: str, path to documentation file
             package_name: (str | None), name of the function package,
                 None by default
@@ -67,13 +68,13 @@ class FunctionFormatter(BaseFormatter[FunctionDefinition]):
                             [
                                 md.Italic([
                                     md.Quote(argument.name),
-                                    md.MarkdownContainer(
-                                        [
+                                    (
+                                        md.MarkdownContainer([
                                             ': ',
                                             md.Quote(argument.type.annotation)
-                                        ]
+                                        ])
                                         if argument.type is not None
-                                        else []
+                                        else md.EMPTY
                                     )
                                 ])
                                 for argument in obj.arguments
@@ -81,13 +82,13 @@ class FunctionFormatter(BaseFormatter[FunctionDefinition]):
                             ', '
                         ),
                         ')',
-                        md.MarkdownContainer(
-                            [
+                        (
+                            md.MarkdownContainer([
                                 ' -> ',
                                 md.Italic([obj.returns.annotation])
-                            ]
+                            ])
                             if obj.returns is not None
-                            else []
+                            else md.EMPTY
                         ),
                         md.WHITESPACE,
                         module_line_path_link(
@@ -97,16 +98,16 @@ class FunctionFormatter(BaseFormatter[FunctionDefinition]):
                         )
                     ]
                 ),
-                md.MarkdownContainer(
-                    [
+                (
+                    md.MarkdownContainer([
                         md.PARAGRAPH_BREAK,
                         self.format_by(
                             FormatterType.DOCSTRING,
                             obj.docstring
                         )
-                    ]
+                    ])
                     if obj.docstring is not None
-                    else []
+                    else md.EMPTY
                 )
             ]
         )
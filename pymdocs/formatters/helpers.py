@@ -1,12 +1,12 @@
 import os
-from pathlib import Path
+from typing import Union
 
 import pymdocs.formatters.markdown_constructor as md
-from pymdocs.parsers.ast import AstWrapper
+from pymdocs.parsers.ast import AstWrapper, ClassRecord, FunctionRecord
 
 
 def module_line_path_link(
-    element: AstWrapper,
+    element: Union[AstWrapper, ClassRecord, FunctionRecord],
     text: str,
     doc_path: str
 ) -> md.Link:
@@ -14,7 +14,8 @@ def module_line_path_link(
     Returns reference Markdown link to object
 
     Args:
-        element: AstWrapper, element needed to reference
+        element: (AstWrapper | ClassRecord | FunctionRecord), element needed
+            to reference
         text: str, reference link text
         doc_path: str, path to documentation file
 
@@ -22,12 +23,12 @@ def module_line_path_link(
         Link: reference link to object
     """
 
-    relpath = Path(
-        os.path.relpath(
-            element.path,
-            os.path.dirname(doc_path)
-        )
-    ).as_posix()
+    relpath = os.path.relpath(
+        element.path,
+        os.path.dirname(doc_path)
+    )
+    if os.sep != '/':
+        relpath = relpath.replace(os.sep, '/')
 
     pos = element.lineno
 
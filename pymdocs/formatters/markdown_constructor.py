@@ -1,21 +1,155 @@
-import urllib.parse
 from enum import Enum
-from typing import Optional, Sequence, Union
+from itertools import islice
+from typing import (
+    Dict,
+    IO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
 
 MARKDOWN_QUOTE_SYMBOLS = list('_*`')
 
+# Number of Markdown pieces rendered before writing them to stream
+RENDER_CHUNK_SIZE = 4096
+
 
 class MarkdownElement:
-    """Base class for Markdown elements"""
+    """
+    Base class for Markdown elements
+
+    Elements made of other elements list their parts in _parts, so the
+    whole tree is rendered by one loop without recursion and could be
+    streamed to file piece by piece. Other elements are rendered by render.
+
+    Frozen elements can't be modified, frozen containers keep Markdown
+    rendered the first time, so the same tree could be rendered again or
+    reused as a part of other documents without walking it.
+    """
+
+    __slots__ = ()
 
     def render(self) -> str:
         """Method for rendering Markdown"""
         return ''
 
+    def _parts(self) -> Sequence[Union['MarkdownElement', str, '_Marker']]:
+        """Returns strings and inner elements making up element"""
+        return (self.render(),)
+
+    def _inner_elements(self) -> Sequence['MarkdownElement']:
+        """Returns elements element is made of"""
+        return ()
+
+    def iter_render(self) -> Iterator[str]:
+        """Yields pieces of Markdown"""
+        return _iter_render(self._parts())
+
+    def freeze(self) -> 'MarkdownElement':
+        """
+        Makes element and all its inner elements immutable, containers
+        keep rendered Markdown after the first render. Shared module
+        elements like EMPTY and WHITESPACE are left as they are, they are
+        used by other trees and rendered by fast paths of their classes
+
+        Returns:
+            MarkdownElement: the same element, frozen
+        """
+
+        stack: List[MarkdownElement] = [self]
+        while stack:
+            element = stack.pop()
+            if (
+                isinstance(element, _FrozenElement)
+                or id(element) in _SHARED_ELEMENTS
+            ):
+                continue
+
+            element.__class__ = _frozen_class(type(element))
+            stack.extend(element._inner_elements())
+
+        return self
+
+    def render_to(
+        self,
+        stream: IO[str],
+        chunk_size: int = RENDER_CHUNK_SIZE
+    ) -> None:
+        """
+        Writes Markdown to text stream by chunks, without rendering the
+        whole element to one string
+
+        Args:
+            stream: IO[str], text stream, e.g. file opened for writing
+            chunk_size: int, number of pieces joined before writing, writing
+                every small piece separately is slower
+        """
+
+        pieces = self.iter_render()
+        chunk = list(islice(pieces, chunk_size))
+        while chunk:
+            stream.write(''.join(chunk))
+            chunk = list(islice(pieces, chunk_size))
+
+
+class _Marker:
+    """Marker of blockquotes start and end in element parts"""
+
+    __slots__ = ()
+
+
+_QUOTE_START = _Marker()
+_QUOTE_END = _Marker()
+
+
+def _iter_render(
+    parts: Sequence[Union[MarkdownElement, str, _Marker]]
+) -> Iterator[str]:
+    """
+    Yields Markdown pieces of element, walking inner elements with stack,
+    lines inside blockquotes are prefixed on the fly
+
+    Args:
+        parts: Sequence[Union[MarkdownElement, str, _Marker]], parts of
+            element to render
+
+    Yields:
+        str: piece of Markdown
+    """
+
+    stack = [iter(parts)]
+    quotes = 0
+    newline = '\n'
+    while stack:
+        for part in stack[-1]:
+            if type(part) is str:
+                text = part
+            elif type(part) is StringLiteral:
+                # Plain strings are the most common elements
+                text = part.text  # type: ignore
+            elif isinstance(part, MarkdownContainer):
+                stack.append(iter(part._parts()))
+                break
+            elif isinstance(part, MarkdownElement):
+                text = part.render()
+            else:
+                quotes += 1 if part is _QUOTE_START else -1
+                newline = '\n' + '> ' * quotes
+                continue
+
+            yield text.replace('\n', newline) if quotes else text
+        else:
+            stack.pop()
+
 
 class StringLiteral(MarkdownElement):
     """Helper class for user defined strings"""
 
+    __slots__ = ('text',)
+
     def __init__(self, text: str):
         self.text = text
 
@@ -29,7 +163,7 @@ class MarkdownContainer(MarkdownElement):
         other elements
 
     Attributes:
-        elemens: Sequence[Union[MarkdownElement, str]], list of inner elements,
+        elements: tuple[Union[MarkdownElement, str], ...], inner elements,
             could be another MarkdownElement or python string
         sep: Union[MarkdownElement, str], elements separator, could be
             another MarkdownElement or python string
@@ -49,37 +183,56 @@ class MarkdownContainer(MarkdownElement):
         second paragraph
     """
 
+    __slots__ = ('elements', 'sep', '_rendered')
+
+    # Rendered Markdown, set only for frozen containers
+    _rendered: str
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
         sep: Union[MarkdownElement, str] = ''
     ):
-        self.elements = [
-            (
-                element
-                if isinstance(element, MarkdownElement)
-                else StringLiteral(element)
-            )
-            for element in elements
-        ]
-
-        self.sep = (
-            sep
-            if isinstance(sep, MarkdownElement)
-            else StringLiteral(sep)
+        # Strings are kept as they are instead of wrapping every one of them
+        # to StringLiteral, they are rendered the same way
+        self.elements: Tuple[Union[MarkdownElement, str], ...] = tuple(
+            elements
         )
+        self.sep = sep
 
     def render(self) -> str:
         """
         Returns Markdown representation all inner elements,
         joined by separator
         """
+        return ''.join(_iter_render(self._parts()))
 
-        sep = self.sep.render()
-        return sep.join(
-            element.render()
+    def _inner_elements(self) -> Sequence[MarkdownElement]:
+        """Returns inner elements and separator"""
+        inner = [
+            element
             for element in self.elements
+            if isinstance(element, MarkdownElement)
+        ]
+        if isinstance(self.sep, MarkdownElement):
+            inner.append(self.sep)
+
+        return inner
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
+        """Returns inner elements with separators between them"""
+        sep = self.sep
+        if not isinstance(sep, str):
+            sep = sep.render()
+
+        if not sep or len(self.elements) < 2:
+            return self.elements
+
+        parts: List[Union[MarkdownElement, str, _Marker]] = (
+            [sep] * (2 * len(self.elements) - 1)
         )
+        parts[::2] = self.elements
+        return parts
 
 
 WHITESPACE = StringLiteral(' ')
@@ -90,6 +243,23 @@ LINE = StringLiteral('\n\n---\n\n')
 # Line break for table cells
 HTML_LINEBREAK = StringLiteral('</br>')
 
+# Shared element for missing optional parts, containers are never modified
+# after creation, so one empty container could be used everywhere
+EMPTY = MarkdownContainer(())
+
+# Ids of elements shared by all trees, freezing one tree must not change them
+_SHARED_ELEMENTS = frozenset(
+    id(element)
+    for element in (
+        WHITESPACE,
+        NEWLINE,
+        PARAGRAPH_BREAK,
+        LINE,
+        HTML_LINEBREAK,
+        EMPTY
+    )
+)
+
 
 class Quote(StringLiteral):
     """
@@ -106,6 +276,8 @@ class Quote(StringLiteral):
         text\\_with\\_dashes
     """
 
+    __slots__ = ()
+
     def render(self) -> str:
         """Returns markdown quoted text"""
         quoted_text = self.text
@@ -133,6 +305,8 @@ class Link(StringLiteral):
         [Go here](README.md)
     """
 
+    __slots__ = ('link', 'quote')
+
     def __init__(
         self,
         text: str,
@@ -145,11 +319,13 @@ class Link(StringLiteral):
 
     def render(self) -> str:
         """Returns Markdown link"""
-        link = (
-            urllib.parse.quote(self.link)
-            if self.quote
-            else self.link
-        )
+        if self.quote:
+            # urllib is imported only if any link needs quoting
+            import urllib.parse
+            link = urllib.parse.quote(self.link)
+        else:
+            link = self.link
+
         return f'[{self.text}]({link})'
 
 
@@ -170,6 +346,8 @@ class Image(Link):
         ![Beautiful picture](image.png)
     """
 
+    __slots__ = ()
+
     def render(self):
         """Returns Markdown image"""
         return f'!{super().render()}'
@@ -178,12 +356,11 @@ class Image(Link):
 class Paragraph(MarkdownContainer):
     """Class for Markdown paragraph element"""
 
-    def render(self) -> str:
-        """Renders inner elements, with paragraph break in the end"""
-        return (
-            super().render()
-            + PARAGRAPH_BREAK.render()
-        )
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
+        """Returns inner elements, with paragraph break in the end"""
+        return [*super()._parts(), PARAGRAPH_BREAK.text]
 
 
 class Header(MarkdownContainer):
@@ -206,6 +383,8 @@ class Header(MarkdownContainer):
         # module markdown\\_constructor
     """
 
+    __slots__ = ('level',)
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -215,18 +394,20 @@ class Header(MarkdownContainer):
         self.level = level
         super().__init__(elements, sep)
 
-    def render(self) -> str:
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Markdown header with inner elelements"""
-        return (
-            '#' * self.level
-            + f' {super().render()}'
-            + PARAGRAPH_BREAK.render()
-        )
+        return [
+            '#' * self.level + ' ',
+            *super()._parts(),
+            PARAGRAPH_BREAK.text
+        ]
 
 
 class H1(Header):
     """Class for 1 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -238,6 +419,8 @@ class H1(Header):
 class H2(Header):
     """Class for 2 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -249,6 +432,8 @@ class H2(Header):
 class H3(Header):
     """Class for 3 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -260,6 +445,8 @@ class H3(Header):
 class H4(Header):
     """Class for 4 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -271,6 +458,8 @@ class H4(Header):
 class H5(Header):
     """Class for 5 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -282,6 +471,8 @@ class H5(Header):
 class H6(Header):
     """Class for 6 level Markdown header"""
 
+    __slots__ = ()
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -302,9 +493,11 @@ class Bold(MarkdownContainer):
         **some bold text**
     """
 
-    def render(self) -> str:
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns bolded inner elements"""
-        return f'**{super().render()}**'
+        return ['**', *super()._parts(), '**']
 
 
 class Italic(MarkdownContainer):
@@ -319,9 +512,11 @@ class Italic(MarkdownContainer):
         *some italic text*
     """
 
-    def render(self) -> str:
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns italic inner elements"""
-        return f'*{super().render()}*'
+        return ['*', *super()._parts(), '*']
 
 
 class BoldItalic(MarkdownContainer):
@@ -336,9 +531,11 @@ class BoldItalic(MarkdownContainer):
         **some text**
     """
 
-    def render(self) -> str:
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns bolded italic inner elements"""
-        return f'***{super().render()}***'
+        return ['***', *super()._parts(), '***']
 
 
 class Strikethrough(MarkdownContainer):
@@ -353,8 +550,10 @@ class Strikethrough(MarkdownContainer):
         ~~some text~~
     """
 
-    def render(self):
-        return f'~~{super().render()}~~'
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
+        return ['~~', *super()._parts(), '~~']
 
 
 class Blockquotes(MarkdownContainer):
@@ -369,12 +568,11 @@ class Blockquotes(MarkdownContainer):
         > some text
     """
 
-    def render(self) -> str:
-        """Returns blockquotes with inner elements"""
-        return '\n'.join(
-            ('> ' + line)
-            for line in super().render().split('\n')
-        )
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
+        """Returns blockquotes with inner elements, lines are prefixed"""
+        return ['> ', _QUOTE_START, *super()._parts(), _QUOTE_END]
 
 
 class OrderedList(MarkdownContainer):
@@ -395,16 +593,19 @@ class OrderedList(MarkdownContainer):
         3. third item
     """
 
+    __slots__ = ()
+
     def __init__(self, elements: Sequence[Union[MarkdownElement, str]]):
         super().__init__(elements)
 
-    def render(self) -> str:
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Markdown ordered list with inner elements as items"""
-        return '\n'.join(
-            f'{i}. '
-            + element.render()
-            for i, element in enumerate(self.elements, 1)
-        )
+        parts: List[Union[MarkdownElement, str, _Marker]] = []
+        for i, element in enumerate(self.elements, 1):
+            parts.append(f'{i}. ' if i == 1 else f'\n{i}. ')
+            parts.append(element)
+
+        return parts
 
 
 class UnorderedList(MarkdownContainer):
@@ -425,15 +626,19 @@ class UnorderedList(MarkdownContainer):
         - third item
     """
 
+    __slots__ = ()
+
     def __init__(self, elements: Sequence[Union[MarkdownElement, str]]):
         super().__init__(elements)
 
-    def render(self) -> str:
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Markdown unordered list with inner elements as items"""
-        return '\n'.join(
-            f'- {element.render()}'
-            for element in self.elements
-        )
+        parts: List[Union[MarkdownElement, str, _Marker]] = []
+        for element in self.elements:
+            parts.append('\n- ' if parts else '- ')
+            parts.append(element)
+
+        return parts
 
 
 class TaskItem(MarkdownContainer):
@@ -447,6 +652,8 @@ class TaskItem(MarkdownContainer):
         is_done: bool, is the task done or not, False by default
     """
 
+    __slots__ = ('is_done',)
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -456,12 +663,9 @@ class TaskItem(MarkdownContainer):
         super().__init__(elements, sep)
         self.is_done = is_done
 
-    def render(self):
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Markdown task list item with inner elements"""
-        return (
-            ('[x] ' if self.is_done else '[ ] ')
-            + f'{super().render()}'
-        )
+        return ['[x] ' if self.is_done else '[ ] ', *super()._parts()]
 
 
 class TaskList(UnorderedList):
@@ -485,6 +689,8 @@ class TaskList(UnorderedList):
         - [ ] Third task
     """
 
+    __slots__ = ()
+
     def __init__(self, elements: Sequence[TaskItem]):
         super().__init__(elements)
 
@@ -501,9 +707,11 @@ class InlineCode(MarkdownContainer):
         `code`
     """
 
-    def render(self) -> str:
+    __slots__ = ()
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Mrkdown inline code with inner elements"""
-        return f'`{super().render()}`'
+        return ['`', *super()._parts(), '`']
 
 
 class Code(MarkdownContainer):
@@ -533,6 +741,8 @@ class Code(MarkdownContainer):
         ```
     """
 
+    __slots__ = ('language',)
+
     def __init__(
         self,
         elements: Sequence[Union[MarkdownElement, str]],
@@ -542,13 +752,9 @@ class Code(MarkdownContainer):
         self.language = language
         super().__init__(elements, sep)
 
-    def render(self) -> str:
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns markdown code block with inner elements"""
-        return (
-            f'```{self.language}\n'
-            + f'{super().render()}\n'
-            + '```'
-        )
+        return [f'```{self.language}\n', *super()._parts(), '\n```']
 
 
 class ColumnOrientation(str, Enum):
@@ -558,7 +764,7 @@ class ColumnOrientation(str, Enum):
     MIDDLE = ':-:'
 
 
-_TABLE_BORDER = MarkdownContainer([' | '])
+_TABLE_BORDER = ' | '
 
 
 class TableRow(MarkdownContainer):
@@ -576,6 +782,8 @@ class TableRow(MarkdownContainer):
         1 | one
     """
 
+    __slots__ = ()
+
     def __init__(self, elements: Sequence[Union[MarkdownElement, str]]):
         super().__init__(elements, sep=_TABLE_BORDER)
 
@@ -611,6 +819,8 @@ class Table(MarkdownContainer):
         2 | two
     """
 
+    __slots__ = ('header', 'orientation')
+
     def __init__(
         self,
         header: TableRow,
@@ -621,7 +831,11 @@ class Table(MarkdownContainer):
         self.orientation = orientation
         super().__init__(rows, NEWLINE)
 
-    def render(self):
+    def _inner_elements(self) -> Sequence[MarkdownElement]:
+        """Returns table rows, separator and header"""
+        return [*super()._inner_elements(), self.header]
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
         """Returns Markdown table"""
         orientation = self.orientation
         if orientation is None:
@@ -632,11 +846,13 @@ class Table(MarkdownContainer):
             for el in orientation
         ])
 
-        return (
-            f'{self.header.render()}\n'
-            + f'{orientation_row.render()}\n'
-            + f'{super().render()}'
-        )
+        return [
+            self.header,
+            NEWLINE.text,
+            orientation_row,
+            NEWLINE.text,
+            *super()._parts()
+        ]
 
 
 class HTMLComment(StringLiteral):
@@ -651,6 +867,8 @@ class HTMLComment(StringLiteral):
         <!--very usefull information-->
     """
 
+    __slots__ = ()
+
     def render(self) -> str:
         """Returns markdown HTML comment with inner elements"""
         return (
@@ -665,6 +883,8 @@ class Raw(StringLiteral):
     Class for raw text
     """
 
+    __slots__ = ()
+
     def render(self) -> str:
         """Returns raw text"""
         return (
@@ -679,6 +899,8 @@ class HTMLAnchor(MarkdownElement):
     Class for html anchor
     """
 
+    __slots__ = ('id',)
+
     def __init__(self, id: str):
         self.id = id
 
@@ -693,5 +915,76 @@ class Latex(StringLiteral):
     Class for Latex formulas
     """
 
+    __slots__ = ()
+
     def render(self):
         return f'${super().render()}$'
+
+
+class _FrozenElement(MarkdownElement):
+    """Base class for frozen elements, attributes can't be changed"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(
+            f'can\'t set attribute {name!r} of frozen {type(self).__name__}'
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f'can\'t delete attribute {name!r} of frozen '
+            f'{type(self).__name__}'
+        )
+
+
+class _FrozenContainer(_FrozenElement, MarkdownContainer):
+    """Base class for frozen containers, rendered once"""
+
+    __slots__ = ()
+
+    def render(self) -> str:
+        """Returns Markdown rendered the first time"""
+        try:
+            return self._rendered
+        except AttributeError:
+            pass
+
+        rendered = ''.join(_iter_render(super()._parts()))
+        object.__setattr__(self, '_rendered', rendered)
+        return rendered
+
+    def _parts(self) -> Sequence[Union[MarkdownElement, str, _Marker]]:
+        """Returns rendered Markdown as the only part"""
+        return (self.render(),)
+
+
+_frozen_classes: Dict[type, type] = {}
+
+
+def _frozen_class(cls: type) -> type:
+    """
+    Returns frozen subclass of element class, element could be frozen by
+    changing its class, as subclass adds no attributes
+
+    Args:
+        cls: type, MarkdownElement subclass
+
+    Returns:
+        type: frozen subclass
+    """
+
+    frozen = _frozen_classes.get(cls)
+    if frozen is None:
+        base = (
+            _FrozenContainer
+            if issubclass(cls, MarkdownContainer)
+            else _FrozenElement
+        )
+        frozen = _frozen_classes[cls] = type(
+            f'Frozen{cls.__name__}',
+            (base, cls),
+            {'__slots__': (), '__module__': cls.__module__}
+        )
+
+    return frozen
@@ -2,10 +2,10 @@ from typing import List, Optional, Tuple
 
 import pymdocs.formatters.markdown_constructor as md
 from pymdocs.formatters.base import BaseFormatter, FormatterType
-from pymdocs.parsers.ast import ModuleDefinition
+from pymdocs.parsers.ast import AnyModuleDefinition
 
 
-class ModuleFormatter(BaseFormatter[ModuleDefinition]):
+class ModuleFormatter(BaseFormatter[AnyModuleDefinition]):
     """
     Formatter for ModuleDefinition objects
 
@@ -38,6 +38,20 @@ class ModuleFormatter(BaseFormatter[ModuleDefinition]):
             f'#{module_name.replace(".", "-")}'
         )
 
+    @staticmethod
+    def module_file_link(module_name: str, file_name: str):
+        """
+        Returns link to module documentation file for index Contents section
+
+        Args:
+            module_name: str, module name
+            file_name: str, name of module documentation file
+
+        Returns:
+            Link: markdown link element
+        """
+        return md.Link(module_name, file_name)
+
     @staticmethod
     def module_anchor(module_name: str):
         """
@@ -55,7 +69,7 @@ class ModuleFormatter(BaseFormatter[ModuleDefinition]):
 
     def format(
         self,
-        obj: ModuleDefinition,
+        obj: AnyModuleDefinition,
         doc_path: str = '',
         package_name: Optional[str] = None
     ):
@@ -63,7 +77,8 @@ class ModuleFormatter(BaseFormatter[ModuleDefinition]):
         Returns Markdown element for module definition
 
         Args:
-            module_def: ModuleDefinition, python module definition
+            module_def: (ModuleDefinition | ModuleRecord), python module
+                definition
             doc_path: str, path to documentation file
             package_name: (str | None), name of the class package
 
@@ -1,9 +1,9 @@
-from typing import List, Tuple
+from typing import Iterator, List, Sequence, Tuple
 
 import pymdocs.formatters.markdown_constructor as md
 from pymdocs.formatters.base import BaseFormatter, FormatterType
 from pymdocs.formatters.module_formatter import ModuleFormatter
-from pymdocs.parsers.ast import PackageDefinition
+from pymdocs.parsers.ast import AnyModuleDefinition, PackageDefinition
 
 
 class PackageFormatter(BaseFormatter[PackageDefinition]):
@@ -24,27 +24,23 @@ class PackageFormatter(BaseFormatter[PackageDefinition]):
         FormatterType.MODULE
     )
 
-    def flatten_modules(
+    def iter_modules(
         self,
         package_def: PackageDefinition,
-        doc_path: str,
         prefix: str = ''
-    ) -> List[Tuple[md.MarkdownContainer, md.Link]]:
+    ) -> Iterator[Tuple[str, AnyModuleDefinition]]:
         """
-        Formats package definition as a list of formatted module definitions
-        recursively
+        Iterates through public modules of package recursively in the order
+        of package documentation
 
         Args:
             package_def: PackageDefinition, python package definition
-            doc_path: str, path to documentation file
             prefix: str, prefix to add to package inner objects names
 
-        Returns:
-            (list[tuple[md.MarkdownContainer, md.Link]]): list of tuples of
-                markdown element for module and module link for Contents
-                section
+        Yields:
+            tuple[str, (ModuleDefinition | ModuleRecord)]: module package name
+                and module definition
         """
-        modules_md = []
 
         package_name = (
             f'{prefix}.{package_def.name}'
@@ -53,34 +49,49 @@ class PackageFormatter(BaseFormatter[PackageDefinition]):
         )
 
         for module_def in package_def.modules:
-            if module_def.name.startswith('_'):
-                continue
+            if not module_def.name.startswith('_'):
+                yield package_name, module_def
 
-            module_name = f'{package_name}.{module_def.name}'
+        for inner_package_def in package_def.packages:
+            yield from self.iter_modules(inner_package_def, package_name)
 
-            module_formatter: ModuleFormatter = (
-                self.formatters[FormatterType.MODULE]
-            )
+    def flatten_modules(
+        self,
+        package_def: PackageDefinition,
+        doc_path: str,
+        prefix: str = ''
+    ) -> List[Tuple[md.MarkdownContainer, md.Link]]:
+        """
+        Formats package definition as a list of formatted module definitions
+        recursively
 
-            module_md = module_formatter.format(
-                module_def,
-                doc_path,
-                package_name
-            )
+        Args:
+            package_def: PackageDefinition, python package definition
+            doc_path: str, path to documentation file
+            prefix: str, prefix to add to package inner objects names
+
+        Returns:
+            (list[tuple[md.MarkdownContainer, md.Link]]): list of tuples of
+                markdown element for module and module link for Contents
+                section
+        """
 
-            module_link = module_formatter.module_link(module_name)
-            modules_md.append((module_md, module_link))
+        module_formatter: ModuleFormatter = (
+            self.formatters[FormatterType.MODULE]
+        )
 
-        for inner_package_def in package_def.packages:
-            modules_md.extend(
-                self.flatten_modules(
-                    inner_package_def,
-                    doc_path,
-                    package_name
+        return [
+            (
+                module_formatter.format(module_def, doc_path, package_name),
+                module_formatter.module_link(
+                    f'{package_name}.{module_def.name}'
                 )
             )
-
-        return modules_md
+            for package_name, module_def in self.iter_modules(
+                package_def,
+                prefix
+            )
+        ]
 
     def format(
         self,
@@ -98,20 +109,62 @@ class PackageFormatter(BaseFormatter[PackageDefinition]):
             MarkdownContainer: Markdown element for package
         """
 
-        modules_md = self.flatten_modules(
-            obj,
-            doc_path
+        return self.format_document(
+            obj.name,
+            self.flatten_modules(obj, doc_path)
         )
 
+    def format_contents(
+        self,
+        package_name: str,
+        module_links: Sequence[md.Link]
+    ) -> md.MarkdownContainer:
+        """
+        Returns Markdown element for package header and Contents section
+
+        Args:
+            package_name: str, package name
+            module_links: (list[md.Link]), links to modules documentation
+
+        Returns:
+            MarkdownContainer: Markdown element for package contents
+        """
+
         return md.MarkdownContainer([
-            md.H1(['Package', md.WHITESPACE, md.Quote(obj.name)]),
+            md.H1(['Package', md.WHITESPACE, md.Quote(package_name)]),
             md.H2(['Contents']),
             md.Paragraph([
-                md.UnorderedList([
+                md.UnorderedList(module_links)
+            ])
+        ])
+
+    def format_document(
+        self,
+        package_name: str,
+        modules_md: Sequence[Tuple[md.MarkdownElement, md.Link]]
+    ) -> md.MarkdownElement:
+        """
+        Returns Markdown element for package documentation made of
+        formatted modules
+
+        Args:
+            package_name: str, package name
+            modules_md: (list[tuple[md.MarkdownElement, md.Link]]), list of
+                tuples of markdown element for module and module link for
+                Contents section
+
+        Returns:
+            MarkdownContainer: Markdown element for package
+        """
+
+        return md.MarkdownContainer([
+            self.format_contents(
+                package_name,
+                [
                     module_link
                     for _, module_link in modules_md
-                ])
-            ]),
+                ]
+            ),
             md.Paragraph([
                 module_md
                 for module_md, _ in modules_md
@@ -0,0 +1,687 @@
+import hashlib
+import json
+import os
+import sys
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    Union
+)
+
+import pymdocs
+import pymdocs.formatters.markdown_constructor as md
+from pymdocs.formatters.base import FormatterType
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.formatters.module_formatter import ModuleFormatter
+from pymdocs.formatters.package_formatter import PackageFormatter
+from pymdocs.output import save, write_atomic
+from pymdocs.parsers.ast import parse_modules, resolve_docstring_style
+from pymdocs.parsers.cache import ParseCache
+from pymdocs.parsers.docstring import DocstringStyle
+from pymdocs.parsers.walker import SourceFile, SourcePackage, SourceWalker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+MANIFEST_VERSION = 1
+
+
+class RebuildReason(str, Enum):
+    """Reasons of module documentation rebuild"""
+    ADDED = 'added'
+    MODIFIED = 'modified'
+    CONFIGURATION = 'formatter configuration changed'
+    MISSING_FRAGMENT = 'cached fragment is missing'
+    REMOVED = 'removed'
+
+
+class ModuleEntry:
+    """
+    Manifest entry of documented module
+
+    Attributes:
+        mtime_ns: int, module modification time in nanoseconds
+        size: int, module size in bytes
+        sha256: str, module content hash
+        fragment: str, name of the cached markdown fragment file
+    """
+
+    __slots__ = ('mtime_ns', 'size', 'sha256', 'fragment')
+
+    def __init__(self, mtime_ns: int, size: int, sha256: str, fragment: str):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.sha256 = sha256
+        self.fragment = fragment
+
+
+class Manifest:
+    """
+    Fingerprints of documented modules and formatter configuration of the
+    previous documentation build
+
+    Attributes:
+        config: str, formatter configuration fingerprint
+        modules: dict[str, ModuleEntry], entries by module path
+        output: (list[int] | None), size and modification time of written
+            documentation file
+        style: (dict[str, Any] | None), sampled docstring style with
+            sample size and fingerprints of sampled modules, in sampling
+            order
+    """
+
+    def __init__(
+        self,
+        config: str = '',
+        modules: Optional[Dict[str, ModuleEntry]] = None,
+        output: Optional[List[int]] = None,
+        style: Optional[Dict[str, Any]] = None
+    ):
+        self.config = config
+        self.modules = modules or {}
+        self.output = output
+        self.style = style
+
+    @classmethod
+    def load(cls, path: str) -> 'Manifest':
+        """
+        Loads manifest, returns empty manifest if file is missing or broken
+
+        Args:
+            path: str, path to manifest file
+
+        Returns:
+            Manifest: loaded manifest
+        """
+
+        try:
+            with open(path) as f:
+                data = json.load(f)
+
+            if data.get('version') != MANIFEST_VERSION:
+                return cls()
+
+            return cls(
+                config=data['config'],
+                modules={
+                    module_path: ModuleEntry(**entry)
+                    for module_path, entry in data['modules'].items()
+                },
+                output=data.get('output'),
+                style=data.get('style')
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+    def save(self, path: str) -> None:
+        """
+        Saves manifest atomically
+
+        Args:
+            path: str, path to manifest file
+        """
+
+        data = {
+            'version': MANIFEST_VERSION,
+            'config': self.config,
+            'output': self.output,
+            'style': self.style,
+            'modules': {
+                module_path: {
+                    attribute: getattr(entry, attribute)
+                    for attribute in ModuleEntry.__slots__
+                }
+                for module_path, entry in self.modules.items()
+            }
+        }
+
+        write_atomic(path, json.dumps(data, indent=1))
+
+
+def _file_hash(path: str) -> str:
+    """Returns sha256 hash of file content"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _module_name(path: str) -> str:
+    """Returns module name the same way as module definition does"""
+    return os.path.basename(path).replace('.py', '')
+
+
+def iter_documented_modules(
+    tree: Union[SourceFile, SourcePackage],
+    prefix: str = ''
+) -> Iterator[Tuple[Optional[str], SourceFile]]:
+    """
+    Iterates through modules in the order of package documentation,
+    skipping private modules like PackageFormatter does
+
+    Args:
+        tree: (SourceFile | SourcePackage), module or package layout
+        prefix: str, prefix to add to package name
+
+    Yields:
+        tuple[(str | None), SourceFile]: module package name and module file
+    """
+
+    if isinstance(tree, SourceFile):
+        yield None, tree
+        return
+
+    package_name = (
+        f'{prefix}.{os.path.basename(tree.path)}'
+        if prefix
+        else os.path.basename(tree.path)
+    )
+
+    for module_file in tree.modules:
+        if not _module_name(module_file.path).startswith('_'):
+            yield package_name, module_file
+
+    for package in tree.packages:
+        yield from iter_documented_modules(package, package_name)
+
+
+def _formatter_settings(formatter: Any) -> str:
+    """
+    Returns representation of formatter instance attributes, nested
+    formatters are fingerprinted separately and skipped
+
+    Args:
+        formatter: Any, formatter to describe
+
+    Returns:
+        str: sorted attribute names and reprs
+    """
+    settings = sorted(
+        (name, value)
+        for name, value in getattr(formatter, '__dict__', {}).items()
+        if name != 'formatters'
+    )
+    return repr(settings)
+
+
+class IncrementalBuilder:
+    """
+    Documentation builder, reusing markdown of unchanged modules
+
+    Markdown fragment of every module is cached next to documentation file
+    together with manifest of module files modification times, sizes and
+    content hashes. Only added, modified and removed modules are parsed and
+    formatted on the next build, if formatter configuration is the same.
+    Manifest and fragments are also kept in memory, so builder could be
+    reused for several builds without reading them again.
+
+    Attributes:
+        source_path: str, path to Python source code
+        doc_path: str, path to documentation file
+        formatter: Formatter, markdown formatter
+        walker: SourceWalker, walker collecting package modules
+        jobs: (int | None), number of worker processes parsing modules
+        cache: (ParseCache | None), cache of parsed modules
+        compact: bool, extract compact records and release modules AST
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies
+        docstring_style: (DocstringStyle | None), pinned docstring style
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style if it isn't pinned, style of every
+            docstring is detected if 0
+        explain: bool, print the reason of every module rebuild to stderr
+        persist: bool, save manifest and fragments next to documentation
+        executor: (Executor | None), process pool shared with other builds,
+            jobs are ignored if set
+        state_path: str, path to directory with manifest and fragments
+    """
+
+    def __init__(
+        self,
+        source_path: str,
+        doc_path: str,
+        formatter: Optional[Formatter] = None,
+        walker: Optional[SourceWalker] = None,
+        jobs: Optional[int] = 1,
+        cache: Optional[ParseCache] = None,
+        compact: bool = False,
+        explain: bool = False,
+        shallow: bool = False,
+        docstring_style: Optional[DocstringStyle] = None,
+        docstring_sample: int = 0,
+        persist: bool = True,
+        executor: 'Optional[Executor]' = None
+    ):
+        self.source_path = source_path
+        self.doc_path = doc_path
+        self.formatter = formatter or Formatter()
+        self.walker = walker or SourceWalker()
+        self.jobs = jobs
+        self.cache = cache
+        self.compact = compact
+        self.shallow = shallow
+        self.docstring_style = docstring_style
+        self.docstring_sample = docstring_sample
+        self.explain = explain
+        self.persist = persist
+        self.executor = executor
+
+        doc_dir, doc_name = os.path.split(doc_path)
+        self.state_path = os.path.join(doc_dir, f'.{doc_name}.pymdocs')
+        self._manifest_path = os.path.join(self.state_path, 'manifest.json')
+
+        self._manifest: Optional[Manifest] = None
+        self._resolved_style = docstring_style
+        self._fragments: Dict[str, str] = {}
+
+    def config_fingerprint(self) -> str:
+        """
+        Returns fingerprint of everything formatted markdown depends on,
+        besides modules content: version, paths, docstring style, classes
+        and instance attributes of formatters
+
+        Returns:
+            str: configuration fingerprint
+        """
+
+        parts = [
+            pymdocs.__version__,
+            os.path.abspath(self.source_path),
+            os.path.abspath(self.doc_path),
+            'docstring_style=' + (
+                self._resolved_style.name
+                if self._resolved_style is not None
+                else 'detect'
+            )
+        ] + [
+            f'{formatter_type.name}={type(formatter).__module__}'
+            f'.{type(formatter).__qualname__}'
+            f'{_formatter_settings(formatter)}'
+            for formatter_type, formatter in sorted(
+                self.formatter.formatters.items()
+            )
+        ]
+
+        return hashlib.sha256('\0'.join(parts).encode()).hexdigest()
+
+    def _explain(self, module_path: str, reason: RebuildReason) -> None:
+        """Prints reason of module rebuild if explain is enabled"""
+        if self.explain:
+            print(f'{module_path}: {reason.value}', file=sys.stderr)
+
+    def _fragment_path(self, entry: ModuleEntry) -> str:
+        """Returns path to cached markdown fragment of module"""
+        return os.path.join(self.state_path, entry.fragment)
+
+    def _check(
+        self,
+        module_file: SourceFile,
+        entry: Optional[ModuleEntry],
+        config_changed: bool
+    ) -> Union[RebuildReason, ModuleEntry]:
+        """
+        Checks if module documentation needs to be rebuilt
+
+        Returns:
+            (RebuildReason | ModuleEntry): reason of rebuild or updated
+                manifest entry if cached fragment could be used
+        """
+
+        if entry is None:
+            return RebuildReason.ADDED
+        elif config_changed:
+            return RebuildReason.CONFIGURATION
+        elif entry.fragment not in self._fragments and (
+            not self.persist
+            or not os.path.exists(self._fragment_path(entry))
+        ):
+            return RebuildReason.MISSING_FRAGMENT
+        elif (
+            entry.mtime_ns == module_file.mtime_ns
+            and entry.size == module_file.size
+        ):
+            return entry
+
+        # Module is touched, but its content could be the same
+        sha256 = _file_hash(module_file.path)
+        if sha256 != entry.sha256:
+            return RebuildReason.MODIFIED
+
+        return ModuleEntry(
+            mtime_ns=module_file.mtime_ns,
+            size=module_file.size,
+            sha256=sha256,
+            fragment=entry.fragment
+        )
+
+    def _resolve_style(
+        self,
+        tree: Union[SourceFile, SourcePackage],
+        manifest: Manifest
+    ) -> bool:
+        """
+        Resolves docstring style of build, sampled style stored in manifest
+        is reused while sampled modules are the same
+
+        Returns:
+            bool: True if style was sampled and stored in manifest
+        """
+
+        if self.docstring_style is not None or self.docstring_sample < 1:
+            self._resolved_style = self.docstring_style
+            return False
+
+        files = (
+            [tree]
+            if isinstance(tree, SourceFile)
+            else list(tree.iter_modules())
+        )
+        stored = manifest.style
+        if stored is not None:
+            try:
+                if self._same_sample(stored, files):
+                    self._resolved_style = (
+                        DocstringStyle[stored['style']]
+                        if stored['style'] is not None
+                        else None
+                    )
+                    return False
+            except (KeyError, TypeError, ValueError):
+                # Broken manifest entry is sampled again
+                pass
+
+        sampled: List[Tuple[SourceFile, str]] = []
+        self._resolved_style = resolve_docstring_style(
+            tree,
+            None,
+            self.docstring_sample,
+            self.shallow,
+            sampled
+        )
+        manifest.style = {
+            'sample': self.docstring_sample,
+            'style': (
+                self._resolved_style.name
+                if self._resolved_style is not None
+                else None
+            ),
+            # All modules were read, any added module could change style
+            'exhausted': len(sampled) == len(files),
+            'modules': [
+                [
+                    module_file.path,
+                    module_file.mtime_ns,
+                    module_file.size,
+                    sha256
+                ]
+                for module_file, sha256 in sampled
+            ]
+        }
+        return True
+
+    def _same_sample(
+        self,
+        stored: Dict[str, Any],
+        files: List[SourceFile]
+    ) -> bool:
+        """
+        Checks if the first modules are the sampled modules of stored style
+        and they have the same content
+        """
+
+        modules = stored['modules']
+        if (
+            stored['sample'] != self.docstring_sample
+            or len(modules) > len(files)
+            or (stored['exhausted'] and len(modules) != len(files))
+        ):
+            return False
+
+        for (path, mtime_ns, size, sha256), module_file in zip(
+            modules,
+            files
+        ):
+            if path != module_file.path:
+                return False
+            elif (
+                (mtime_ns, size) != (module_file.mtime_ns, module_file.size)
+                and _file_hash(path) != sha256
+            ):
+                return False
+
+        return True
+
+    def build(
+        self,
+        tree: Optional[Union[SourceFile, SourcePackage]] = None
+    ) -> List[Tuple[str, RebuildReason]]:
+        """
+        Builds documentation, rebuilding only changed modules
+
+        Args:
+            tree: (SourceFile | SourcePackage | None), sources layout, walked
+                from source path if None
+
+        Returns:
+            list[tuple[str, RebuildReason]]: rebuilt and removed modules
+                paths with reasons
+        """
+
+        if tree is None:
+            tree = self.walker.walk(self.source_path)
+
+        if tree is None:
+            raise ValueError(
+                f'{self.source_path} is not a python package or module'
+            )
+
+        if self._manifest is None:
+            self._manifest = (
+                Manifest.load(self._manifest_path)
+                if self.persist
+                else Manifest()
+            )
+
+        manifest = self._manifest
+        changes: List[Tuple[str, RebuildReason]] = []
+        style_sampled = self._resolve_style(tree, manifest)
+        config = self.config_fingerprint()
+        config_changed = manifest.config != config
+
+        documented = list(iter_documented_modules(tree))
+        new_modules: Dict[str, ModuleEntry] = {}
+        rebuild: List[Tuple[Optional[str], SourceFile]] = []
+        touched = style_sampled
+
+        for package_name, module_file in documented:
+            entry = manifest.modules.get(module_file.path)
+            checked = self._check(module_file, entry, config_changed)
+            if isinstance(checked, RebuildReason):
+                changes.append((module_file.path, checked))
+                rebuild.append((package_name, module_file))
+                continue
+
+            touched = touched or checked is not entry
+            new_modules[module_file.path] = checked
+
+        documented_paths = {
+            module_file.path
+            for _, module_file in documented
+        }
+        removed = [
+            module_path
+            for module_path in manifest.modules
+            if module_path not in documented_paths
+        ]
+        changes.extend(
+            (module_path, RebuildReason.REMOVED)
+            for module_path in removed
+        )
+        for module_path, reason in changes:
+            self._explain(module_path, reason)
+
+        if (
+            not rebuild
+            and not removed
+            and manifest.output is not None
+            and self._output_stat() == manifest.output
+        ):
+            if touched:
+                manifest.modules = new_modules
+                self._save_manifest()
+
+            return changes
+
+        if self.persist:
+            os.makedirs(self.state_path, exist_ok=True)
+
+        new_modules.update(self._rebuild(rebuild))
+        if rebuild and self.cache is not None:
+            self.cache.prune()
+
+        for module_path in removed:
+            self._remove_fragment(manifest.modules[module_path])
+
+        self._write(tree, documented, new_modules)
+
+        manifest.config = config
+        manifest.modules = new_modules
+        manifest.output = self._output_stat()
+        self._save_manifest()
+
+        return changes
+
+    def _save_manifest(self) -> None:
+        """Saves manifest if builder state is persisted"""
+        if self.persist and self._manifest is not None:
+            self._manifest.save(self._manifest_path)
+
+    def _rebuild(
+        self,
+        modules: List[Tuple[Optional[str], SourceFile]]
+    ) -> Dict[str, ModuleEntry]:
+        """
+        Parses and formats modules, saves their markdown fragments
+
+        Returns:
+            dict[str, ModuleEntry]: manifest entries by module path
+        """
+
+        if not modules:
+            return {}
+
+        # Hashes are taken before parsing, so a stored hash never describes
+        # newer content than the fragment: a module saved while it's parsed
+        # is seen modified on the next build
+        hashes = {
+            module_file.path: _file_hash(module_file.path)
+            for _, module_file in modules
+        }
+        definitions = parse_modules(
+            [module_file for _, module_file in modules],
+            self.jobs,
+            self.cache,
+            self.compact,
+            self.shallow,
+            self._resolved_style,
+            self.executor
+        )
+
+        module_formatter: ModuleFormatter = (
+            self.formatter.formatters[FormatterType.MODULE]
+        )
+
+        entries = {}
+        for package_name, module_file in modules:
+            fragment = module_formatter.format(
+                definitions[module_file.path],
+                self.doc_path,
+                package_name
+            ).render()
+
+            entry = ModuleEntry(
+                mtime_ns=module_file.mtime_ns,
+                size=module_file.size,
+                sha256=hashes[module_file.path],
+                fragment=hashlib.sha1(
+                    module_file.path.encode()
+                ).hexdigest() + '.md'
+            )
+            self._fragments[entry.fragment] = fragment
+            if self.persist:
+                write_atomic(self._fragment_path(entry), fragment)
+
+            entries[module_file.path] = entry
+
+        return entries
+
+    def _remove_fragment(self, entry: ModuleEntry) -> None:
+        """Removes cached fragment of removed module"""
+        self._fragments.pop(entry.fragment, None)
+        if not self.persist:
+            return
+
+        try:
+            os.remove(self._fragment_path(entry))
+        except OSError:
+            pass
+
+    def _read_fragment(self, entry: ModuleEntry) -> str:
+        """Returns cached markdown fragment of module"""
+        fragment = self._fragments.get(entry.fragment)
+        if fragment is None:
+            with open(self._fragment_path(entry)) as f:
+                fragment = f.read()
+
+            self._fragments[entry.fragment] = fragment
+
+        return fragment
+
+    def _output_stat(self) -> Optional[List[int]]:
+        """Returns size and modification time of documentation file"""
+        try:
+            stat = os.stat(self.doc_path)
+        except OSError:
+            return None
+
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _write(
+        self,
+        tree: Union[SourceFile, SourcePackage],
+        documented: List[Tuple[Optional[str], SourceFile]],
+        entries: Dict[str, ModuleEntry]
+    ) -> None:
+        """Assembles documentation from markdown fragments and writes it"""
+        if isinstance(tree, SourceFile):
+            document: md.MarkdownElement = md.StringLiteral(
+                self._read_fragment(entries[tree.path])
+            )
+        else:
+            module_formatter: ModuleFormatter = (
+                self.formatter.formatters[FormatterType.MODULE]
+            )
+            package_formatter: PackageFormatter = (
+                self.formatter.formatters[FormatterType.PACKAGE]
+            )
+
+            document = package_formatter.format_document(
+                os.path.basename(tree.path),
+                [
+                    (
+                        md.StringLiteral(
+                            self._read_fragment(entries[module_file.path])
+                        ),
+                        module_formatter.module_link(
+                            f'{package_name}.{_module_name(module_file.path)}'
+                        )
+                    )
+                    for package_name, module_file in documented
+                ]
+            )
+
+        save(document, self.doc_path)
@@ -0,0 +1,226 @@
+import os
+from typing import IO, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pymdocs.formatters.markdown_constructor import MarkdownElement
+
+# Number of characters copied at once from the unchanged part of file
+_COPY_SIZE = 1024 * 1024
+
+
+def write_atomic(path: str, text: str) -> None:
+    """
+    Writes text to temporary file next to path and renames it to path, so
+    readers never see partially written file
+
+    Args:
+        path: str, path to target file
+        text: str, file content
+    """
+
+    output = _TemporaryFile(path)
+    try:
+        output.file.write(text)
+    except BaseException:
+        output.discard()
+        raise
+
+    output.commit()
+
+
+class _TemporaryFile:
+    """
+    Temporary file next to target file, renamed to target path when it is
+    complete
+
+    Attributes:
+        path: str, path to target file
+        file: IO[str], temporary file opened for writing
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        # File is created with default permissions like open does, unlike
+        # tempfile.mkstemp, which makes it readable by owner only
+        while True:
+            self._tmp_path = os.path.join(
+                os.path.dirname(path),
+                f'.tmp-{os.urandom(6).hex()}'
+            )
+            try:
+                fd = os.open(
+                    self._tmp_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                    0o666
+                )
+                break
+            except FileExistsError:
+                continue
+
+        try:
+            # Replaced file keeps its permissions
+            os.chmod(self._tmp_path, os.stat(path).st_mode & 0o7777)
+        except OSError:
+            pass
+
+        self.file = os.fdopen(fd, 'w')
+
+    def commit(self) -> None:
+        """Closes temporary file and renames it to target path"""
+        try:
+            self.file.close()
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        """Closes and removes temporary file"""
+        self.file.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+class _Drift(Exception):
+    """Raised to stop rendering once output differs from file"""
+
+
+class _ComparingWriter:
+    """
+    Text stream comparing written text with file content as it comes
+
+    Nothing is written while text matches the file. On the first difference
+    matched part is copied from the file to temporary file, the rest of text
+    is written there, so file is replaced only if its content changes and
+    document is rendered once. In check mode difference stops rendering.
+
+    Attributes:
+        path: str, path to target file
+        check: bool, only compare text with file, never write it
+        changed: bool, text differs from file content
+    """
+
+    def __init__(self, path: str, check: bool = False):
+        self.path = path
+        self.check = check
+        self.changed = False
+        self._matched = 0
+        self._output: Optional[_TemporaryFile] = None
+        try:
+            self._current: Optional[IO[str]] = open(path)
+        except OSError:
+            self._current = None
+
+    def write(self, text: str) -> int:
+        """
+        Compares text with the next part of file or writes it to temporary
+        file if file has already differed
+
+        Args:
+            text: str, next part of output
+
+        Returns:
+            int: number of characters written
+        """
+
+        if self._output is None:
+            if self._current is not None:
+                try:
+                    if self._current.read(len(text)) == text:
+                        self._matched += len(text)
+                        return len(text)
+                except UnicodeDecodeError:
+                    pass
+
+            self._diverge()
+
+        self._output.file.write(text)  # type: ignore
+        return len(text)
+
+    def _diverge(self) -> None:
+        """Marks output as changed, starts temporary file in write mode"""
+        self.changed = True
+        if self.check:
+            raise _Drift()
+
+        self._output = _TemporaryFile(self.path)
+        if self._current is not None and self._matched:
+            self._current.seek(0)
+            left = self._matched
+            while left:
+                part = self._current.read(min(left, _COPY_SIZE))
+                self._output.file.write(part)
+                left -= len(part)
+
+    def close(self, failed: bool = False) -> None:
+        """
+        Finishes comparison, renames temporary file to target path if output
+        has changed
+
+        Args:
+            failed: bool, rendering failed, temporary file is removed and
+                target file is kept
+        """
+
+        try:
+            if not failed and not self.changed:
+                # Text could be a prefix of longer file
+                try:
+                    longer = (
+                        self._current is None
+                        or self._current.read(1) != ''
+                    )
+                except UnicodeDecodeError:
+                    longer = True
+
+                if longer:
+                    try:
+                        self._diverge()
+                    except _Drift:
+                        pass
+        finally:
+            if self._current is not None:
+                self._current.close()
+
+            if self._output is not None:
+                if failed:
+                    self._output.discard()
+                else:
+                    self._output.commit()
+
+
+def save(
+    document: 'MarkdownElement',
+    path: str,
+    check: bool = False
+) -> bool:
+    """
+    Streams document to file, file is replaced atomically and only if its
+    content changes
+
+    Args:
+        document: MarkdownElement, markdown document
+        path: str, path to target file
+        check: bool, only compare document with file, stops rendering on
+            the first difference, False by default
+
+    Returns:
+        bool: True if file content differs from document, file is written
+            then unless check is set
+    """
+
+    writer = _ComparingWriter(path, check)
+    try:
+        document.render_to(writer)  # type: ignore
+    except _Drift:
+        writer.close()
+        return True
+    except BaseException:
+        writer.close(failed=True)
+        raise
+
+    writer.close()
+    return writer.changed
@@ -0,0 +1,148 @@
+import ast
+import sys
+from typing import Callable, Dict, Type
+
+BINOPS: Dict[Type[ast.operator], str] = {
+    ast.Add: '+',
+    ast.Sub: '-',
+    ast.Mult: '*',
+    ast.MatMult: '@',
+    ast.Div: '/',
+    ast.Mod: '%',
+    ast.Pow: '**',
+    ast.LShift: '<<',
+    ast.RShift: '>>',
+    ast.BitOr: '|',
+    ast.BitXor: '^',
+    ast.BitAnd: '&',
+    ast.FloorDiv: '//'
+}
+
+UNARYOPS: Dict[Type[ast.unaryop], str] = {
+    ast.Invert: '~',
+    ast.Not: 'not ',
+    ast.UAdd: '+',
+    ast.USub: '-'
+}
+
+
+# Renderers of annotation nodes by node type, nested nodes are rendered with
+# _render function, the result is interned once for the whole annotation
+
+
+def _name(node: ast.Name) -> str:
+    return node.id
+
+
+def _constant(node: ast.Constant) -> str:
+    return str(node.value)
+
+
+def _subscript(node: ast.Subscript) -> str:
+    return f'{_render(node.value)}[{_render(node.slice)}]'
+
+
+def _attribute(node: ast.Attribute) -> str:
+    return f'{_render(node.value)}.{node.attr}'
+
+
+def _tuple(node: ast.Tuple) -> str:
+    return ', '.join(_render(element) for element in node.elts)
+
+
+def _list(node: ast.List) -> str:
+    return '[' + ', '.join(_render(element) for element in node.elts) + ']'
+
+
+def _binop(node: ast.BinOp) -> str:
+    op = BINOPS.get(type(node.op), '|')
+    return '(' + ' '.join((_render(node.left), op, _render(node.right))) + ')'
+
+
+def _unaryop(node: ast.UnaryOp) -> str:
+    return UNARYOPS.get(type(node.op), '') + _render(node.operand)
+
+
+def _starred(node: ast.Starred) -> str:
+    return '*' + _render(node.value)
+
+
+def _keyword(node: ast.keyword) -> str:
+    if node.arg is None:
+        return '**' + _render(node.value)
+
+    return f'{node.arg}={_render(node.value)}'
+
+
+def _call(node: ast.Call) -> str:
+    arguments = [_render(argument) for argument in node.args]
+    arguments.extend(_keyword(keyword) for keyword in node.keywords)
+    return f'{_render(node.func)}({", ".join(arguments)})'
+
+
+def _slice(node: ast.Slice) -> str:
+    parts = [
+        '' if part is None else _render(part)
+        for part in (node.lower, node.upper)
+    ]
+    if node.step is not None:
+        parts.append(_render(node.step))
+
+    return ':'.join(parts)
+
+
+def _index(node: ast.AST) -> str:
+    # Subscript slice is wrapped to ast.Index on Python 3.8
+    return _render(node.value)  # type: ignore
+
+
+def _ext_slice(node: ast.AST) -> str:
+    # Subscript slice with several dimensions on Python 3.8
+    dimensions = node.dims  # type: ignore
+    return ', '.join(_render(dimension) for dimension in dimensions)
+
+
+def _unknown(node: ast.AST) -> str:
+    if hasattr(ast, 'unparse'):
+        return ast.unparse(node)
+
+    return type(node).__name__
+
+
+_RENDERERS: Dict[type, Callable] = {
+    ast.Name: _name,
+    ast.Constant: _constant,
+    ast.Subscript: _subscript,
+    ast.Attribute: _attribute,
+    ast.Tuple: _tuple,
+    ast.List: _list,
+    ast.BinOp: _binop,
+    ast.UnaryOp: _unaryop,
+    ast.Starred: _starred,
+    ast.Call: _call,
+    ast.Slice: _slice
+}
+
+if sys.version_info < (3, 9):
+    _RENDERERS[ast.Index] = _index
+    _RENDERERS[ast.ExtSlice] = _ext_slice
+
+
+def _render(node: ast.AST) -> str:
+    return _RENDERERS.get(type(node), _unknown)(node)
+
+
+def render(node: ast.AST) -> str:
+    """
+    Returns string representation of typing annotation expression, any
+    expression is supported, nodes without own rendering are rendered as
+    source code
+
+    Args:
+        node: ast.AST, annotation expression node
+
+    Returns:
+        str: interned string representation of annotation
+    """
+
+    return sys.intern(_render(node))
@@ -1,19 +1,95 @@
 import ast
 import os
-from typing import Generic, List, Optional, TypeVar, Union
+from functools import cached_property
+from itertools import repeat
+from typing import (
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple,
+    TypeVar,
+    Union
+)
 
 import pymdocs.parsers.docstring as doc
+from pymdocs.parsers.annotation import render as render_annotation
+from pymdocs.parsers.cache import CacheStats, ParseCache
+from pymdocs.parsers.walker import SourceFile, SourcePackage, SourceWalker
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 T = TypeVar('T', bound=ast.AST)
 
-BINOPS = {
-    ast.BitOr: '|'
-}
+
+def _style_option(docstring_style: Optional[doc.DocstringStyle]) -> str:
+    """Returns name of docstring style option, part of cache key"""
+    if docstring_style is None:
+        # Style is detected for every docstring by the known styles
+        return 'detect:' + ','.join(
+            style.name
+            for style in doc.DOCSTRING_STYLE_MAP
+        )
+
+    return docstring_style.name
+
+
+def _raw_docstring(
+    ast_element: Union[ast.Module, ast.ClassDef, ast.FunctionDef]
+) -> Optional[str]:
+    """
+    Returns docstring of module, class or function AST node if exists
+
+    Args:
+        ast_element: (ast.Module | ast.ClassDef | ast.FunctionDef), AST node
+
+    Returns:
+        (str | None): docstring text
+    """
+    if ast_element.body:
+        potentional_docstring = ast_element.body[0]
+        if isinstance(potentional_docstring, ast.Expr):
+            potentional_docstring_value = potentional_docstring.value
+            if (
+                isinstance(potentional_docstring_value, ast.Constant)
+                and isinstance(potentional_docstring_value.value, str)
+            ):
+                return potentional_docstring_value.value
+
+    return None
+
+
+def _parse_docstring(
+    ast_element: Union[ast.Module, ast.ClassDef, ast.FunctionDef],
+    docstring_style: Optional[doc.DocstringStyle] = None
+) -> Optional[doc.Docstring]:
+    """
+    Parses docstring of module, class or function AST node if exists
+
+    Args:
+        ast_element: (ast.Module | ast.ClassDef | ast.FunctionDef), AST node
+        docstring_style: (DocstringStyle | None), docstring style, detected
+            if None
+
+    Returns:
+        (Docstring | None): parsed docstring
+    """
+    docstring = _raw_docstring(ast_element)
+    if docstring is None:
+        return None
+
+    return doc.parse(docstring, docstring_style)
 
 
 class ElementDefinition:
     """Base class for Python code structures"""
 
+    __slots__ = ()
+
 
 class AstWrapper(ElementDefinition, Generic[T]):
     """
@@ -22,15 +98,19 @@ class AstWrapper(ElementDefinition, Generic[T]):
     Attributes:
         ast_element: ast.AST, AST tree node
         path: str, path to file contains element
+        docstring_style: (DocstringStyle | None), style of element
+            docstrings, detected for every docstring if None
     """
 
     def __init__(
         self,
         ast_element: T,
-        path: str
+        path: str,
+        docstring_style: Optional[doc.DocstringStyle] = None
     ):
         self.ast_element = ast_element
         self.path = path
+        self.docstring_style = docstring_style
 
     @property
     def lineno(self) -> int:
@@ -47,39 +127,22 @@ class AstWrapper(ElementDefinition, Generic[T]):
 class Typing(AstWrapper):
     """Class for Python typing annotations representation"""
 
+    def __init__(self, ast_element: ast.AST, path: str):
+        super().__init__(ast_element, path)
+        self._annotation: Optional[str] = None
+
     @property
     def annotation(self) -> str:
         """
-        Returns string representation of typing annotation
+        Returns string representation of typing annotation, rendered on first
+        access
         """
-        if isinstance(self.ast_element, ast.Name):
-            return self.ast_element.id
-        elif isinstance(self.ast_element, ast.Constant):
-            return str(self.ast_element.value)
-        elif isinstance(self.ast_element, ast.Subscript):
-            value = Typing(self.ast_element.value, self.path).annotation
-            value_slice = Typing(self.ast_element.slice, self.path).annotation
-            return f'{value}[{value_slice}]'
-        elif isinstance(self.ast_element, ast.Attribute):
-            value = Typing(self.ast_element.value, self.path).annotation
-            value_attr = self.ast_element.attr
-            return f'{value}.{value_attr}'
-        elif isinstance(self.ast_element, ast.Tuple):
-            return ', '.join(
-                Typing(element, self.path).annotation
-                for element in self.ast_element.elts
-            )
-        elif isinstance(self.ast_element, ast.BinOp):
-            left = Typing(self.ast_element.left, self.path).annotation
-            right = Typing(self.ast_element.right, self.path).annotation
-            op = '|'
-            for binop, symbol in BINOPS.items():
-                if isinstance(self.ast_element.op, binop):
-                    op = symbol
-
-            return '(' + ' '.join((left, op, right)) + ')'
+        # Plain attribute is cheaper than cached_property lock for the most
+        # frequent element
+        if self._annotation is None:
+            self._annotation = render_annotation(self.ast_element)
 
-        raise ValueError(f'Unknown annotation type: {self.ast_element}')
+        return self._annotation
 
 
 class Argument(AstWrapper[ast.arg]):
@@ -90,7 +153,7 @@ class Argument(AstWrapper[ast.arg]):
         """Returns name of function argument"""
         return self.ast_element.arg
 
-    @property
+    @cached_property
     def type(self) -> Optional[Typing]:
         """
         Returns typing annotation of function argument
@@ -114,7 +177,7 @@ class FunctionDefinition(AstWrapper[ast.FunctionDef]):
         """Returns function name"""
         return self.ast_element.name
 
-    @property
+    @cached_property
     def arguments(self) -> List[Argument]:
         """Returns list of function arguments"""
         return [
@@ -122,7 +185,7 @@ class FunctionDefinition(AstWrapper[ast.FunctionDef]):
             for element in self.ast_element.args.args
         ]
 
-    @property
+    @cached_property
     def returns(self) -> Optional[Typing]:
         """Returns function return typing annotation"""
         if self.ast_element.returns is None:
@@ -133,17 +196,10 @@ class FunctionDefinition(AstWrapper[ast.FunctionDef]):
             self.path
         )
 
-    @property
+    @cached_property
     def docstring(self) -> Optional[doc.Docstring]:
         """Returns function docstring if exists"""
-        if self.ast_element.body:
-            potentional_docstring = self.ast_element.body[0]
-            if isinstance(potentional_docstring, ast.Expr):
-                potentional_docstring_value = potentional_docstring.value
-                if isinstance(potentional_docstring_value, ast.Constant):
-                    return doc.parse(potentional_docstring_value.value)
-
-        return None
+        return _parse_docstring(self.ast_element, self.docstring_style)
 
 
 class ClassDefinition(AstWrapper[ast.ClassDef]):
@@ -154,7 +210,7 @@ class ClassDefinition(AstWrapper[ast.ClassDef]):
         """Returns class name"""
         return self.ast_element.name
 
-    @property
+    @cached_property
     def inherits(self) -> List[str]:
         """Returns class bases"""
         return [
@@ -163,23 +219,16 @@ class ClassDefinition(AstWrapper[ast.ClassDef]):
             if isinstance(base, ast.Name)
         ]
 
-    @property
+    @cached_property
     def docstring(self) -> Optional[doc.Docstring]:
         """Retuns class docstring if exists"""
-        if self.ast_element.body:
-            potentional_docstring = self.ast_element.body[0]
-            if isinstance(potentional_docstring, ast.Expr):
-                potentional_docstring_value = potentional_docstring.value
-                if isinstance(potentional_docstring_value, ast.Constant):
-                    return doc.parse(potentional_docstring_value.value)
+        return _parse_docstring(self.ast_element, self.docstring_style)
 
-        return None
-
-    @property
+    @cached_property
     def methods(self) -> List[FunctionDefinition]:
         """Returns list of class methods"""
         return [
-            FunctionDefinition(element, self.path)
+            FunctionDefinition(element, self.path, self.docstring_style)
             for element in self.ast_element.body
             if isinstance(element, ast.FunctionDef)
         ]
@@ -193,43 +242,320 @@ class ModuleDefinition(AstWrapper[ast.Module]):
         """Returns module name"""
         return os.path.basename(self.path).replace('.py', '')
 
-    @property
+    @cached_property
     def docstring(self) -> Optional[doc.Docstring]:
         """Retuns module docstring if exists"""
-        if self.ast_element.body:
-            potentional_docstring = self.ast_element.body[0]
-            if isinstance(potentional_docstring, ast.Expr):
-                potentional_docstring_value = potentional_docstring.value
-                if isinstance(potentional_docstring_value, ast.Constant):
-                    return doc.parse(potentional_docstring_value.value)
+        return _parse_docstring(self.ast_element, self.docstring_style)
 
-        return None
-
-    @property
+    @cached_property
     def classes(self) -> List[ClassDefinition]:
         """Returns list of module classes"""
         return [
-            ClassDefinition(element, self.path)
+            ClassDefinition(element, self.path, self.docstring_style)
             for element in self.ast_element.body
             if isinstance(element, ast.ClassDef)
         ]
 
-    @property
+    @cached_property
     def functions(self) -> List[FunctionDefinition]:
         """Returns list of module functions"""
         return [
-            FunctionDefinition(element, self.path)
+            FunctionDefinition(element, self.path, self.docstring_style)
             for element in self.ast_element.body
             if isinstance(element, ast.FunctionDef)
         ]
 
 
+class TypingRecord(ElementDefinition):
+    """
+    Compact typing annotation representation
+
+    Attributes:
+        annotation: str, string representation of typing annotation
+    """
+
+    __slots__ = ('annotation',)
+
+    def __init__(self, annotation: str):
+        self.annotation = annotation
+
+
+class ArgumentRecord(ElementDefinition):
+    """
+    Compact function argument representation
+
+    Attributes:
+        name: str, name of function argument
+        type: (TypingRecord | None), typing annotation of function argument
+        lineno: int, line number of the argument in file
+        path: str, path to file contains argument
+    """
+
+    __slots__ = ('name', 'type', 'lineno', 'path')
+
+    def __init__(
+        self,
+        name: str,
+        type: Optional[TypingRecord],
+        lineno: int,
+        path: str
+    ):
+        self.name = name
+        self.type = type
+        self.lineno = lineno
+        self.path = path
+
+
+class _DocumentedRecord(ElementDefinition):
+    """
+    Base class for compact representations of documented elements,
+    docstring is parsed on first access
+
+    Attributes:
+        path: str, path to file contains element
+        docstring_style: (DocstringStyle | None), docstring style, detected
+            if None
+    """
+
+    __slots__ = ('path', 'docstring_style', '_raw_docstring', '_docstring')
+
+    def __init__(
+        self,
+        path: str,
+        docstring: Optional[str],
+        docstring_style: Optional[doc.DocstringStyle] = None
+    ):
+        self.path = path
+        self.docstring_style = docstring_style
+        self._raw_docstring = docstring
+        self._docstring: Optional[doc.Docstring] = None
+
+    @property
+    def docstring(self) -> Optional[doc.Docstring]:
+        """Returns element docstring if exists"""
+        if self._docstring is None and self._raw_docstring is not None:
+            self._docstring = doc.parse(
+                self._raw_docstring,
+                self.docstring_style
+            )
+            self._raw_docstring = None
+
+        return self._docstring
+
+
+class FunctionRecord(_DocumentedRecord):
+    """
+    Compact function representation
+
+    Attributes:
+        name: str, function name
+        arguments: list[ArgumentRecord], list of function arguments
+        returns: (TypingRecord | None), function return typing annotation
+        lineno: int, line number of the function in file
+        path: str, path to file contains function
+    """
+
+    __slots__ = ('name', 'arguments', 'returns', 'lineno')
+
+    def __init__(
+        self,
+        name: str,
+        arguments: List[ArgumentRecord],
+        returns: Optional[TypingRecord],
+        docstring: Optional[str],
+        lineno: int,
+        path: str,
+        docstring_style: Optional[doc.DocstringStyle] = None
+    ):
+        super().__init__(path, docstring, docstring_style)
+        self.name = name
+        self.arguments = arguments
+        self.returns = returns
+        self.lineno = lineno
+
+
+class ClassRecord(_DocumentedRecord):
+    """
+    Compact class representation
+
+    Attributes:
+        name: str, class name
+        inherits: list[str], class bases
+        methods: list[FunctionRecord], list of class methods
+        lineno: int, line number of the class in file
+        path: str, path to file contains class
+    """
+
+    __slots__ = ('name', 'inherits', 'methods', 'lineno')
+
+    def __init__(
+        self,
+        name: str,
+        inherits: List[str],
+        methods: List[FunctionRecord],
+        docstring: Optional[str],
+        lineno: int,
+        path: str,
+        docstring_style: Optional[doc.DocstringStyle] = None
+    ):
+        super().__init__(path, docstring, docstring_style)
+        self.name = name
+        self.inherits = inherits
+        self.methods = methods
+        self.lineno = lineno
+
+
+class ModuleRecord(_DocumentedRecord):
+    """
+    Compact module representation
+
+    Attributes:
+        classes: list[ClassRecord], list of module classes
+        functions: list[FunctionRecord], list of module functions
+        path: str, path to module
+    """
+
+    __slots__ = ('classes', 'functions')
+
+    def __init__(
+        self,
+        classes: List[ClassRecord],
+        functions: List[FunctionRecord],
+        docstring: Optional[str],
+        path: str,
+        docstring_style: Optional[doc.DocstringStyle] = None
+    ):
+        super().__init__(path, docstring, docstring_style)
+        self.classes = classes
+        self.functions = functions
+
+    @property
+    def name(self) -> str:
+        """Returns module name"""
+        return os.path.basename(self.path).replace('.py', '')
+
+
+class RecordsExtractor(ast.NodeVisitor):
+    """
+    Builds compact records from module AST in a single pass, visiting only
+    the nodes needed for documentation
+
+    Attributes:
+        path: str, path to module
+        docstring_style: (DocstringStyle | None), style of module
+            docstrings, detected for every docstring if None
+
+    Examples:
+        Extracting module records
+
+        >> tree = ast.parse(source)
+        >> module = RecordsExtractor(path).visit(tree)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        docstring_style: Optional[doc.DocstringStyle] = None
+    ):
+        self.path = path
+        self.docstring_style = docstring_style
+        self._typings: Dict[str, TypingRecord] = {}
+
+    def _typing(
+        self,
+        ast_element: Optional[ast.AST]
+    ) -> Optional[TypingRecord]:
+        """
+        Returns typing annotation record if annotation exists, equal
+        annotations of the module share the same record
+        """
+        if ast_element is None:
+            return None
+
+        annotation = render_annotation(ast_element)
+        record = self._typings.get(annotation)
+        if record is None:
+            record = self._typings[annotation] = TypingRecord(annotation)
+
+        return record
+
+    def visit_arg(self, node: ast.arg) -> ArgumentRecord:
+        """Returns function argument record"""
+        return ArgumentRecord(
+            name=node.arg,
+            type=self._typing(node.annotation),
+            lineno=node.lineno,
+            path=self.path
+        )
+
+    def visit_FunctionDef(  # noqa: N802
+        self,
+        node: ast.FunctionDef
+    ) -> FunctionRecord:
+        """Returns function record"""
+        return FunctionRecord(
+            name=node.name,
+            arguments=[
+                self.visit_arg(element)
+                for element in node.args.args
+            ],
+            returns=self._typing(node.returns),
+            docstring=_raw_docstring(node),
+            lineno=node.lineno,
+            path=self.path,
+            docstring_style=self.docstring_style
+        )
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> ClassRecord:  # noqa: N802
+        """Returns class record with methods"""
+        return ClassRecord(
+            name=node.name,
+            inherits=[
+                base.id
+                for base in node.bases
+                if isinstance(base, ast.Name)
+            ],
+            methods=[
+                self.visit_FunctionDef(element)
+                for element in node.body
+                if isinstance(element, ast.FunctionDef)
+            ],
+            docstring=_raw_docstring(node),
+            lineno=node.lineno,
+            path=self.path,
+            docstring_style=self.docstring_style
+        )
+
+    def visit_Module(self, node: ast.Module) -> ModuleRecord:  # noqa: N802
+        """Returns module record with classes and functions"""
+        return ModuleRecord(
+            classes=[
+                self.visit_ClassDef(element)
+                for element in node.body
+                if isinstance(element, ast.ClassDef)
+            ],
+            functions=[
+                self.visit_FunctionDef(element)
+                for element in node.body
+                if isinstance(element, ast.FunctionDef)
+            ],
+            docstring=_raw_docstring(node),
+            path=self.path,
+            docstring_style=self.docstring_style
+        )
+
+
+AnyFunctionDefinition = Union[FunctionDefinition, FunctionRecord]
+AnyClassDefinition = Union[ClassDefinition, ClassRecord]
+AnyModuleDefinition = Union[ModuleDefinition, ModuleRecord]
+
+
 class PackageDefinition(ElementDefinition):
     """Class for python package representation"""
 
     def __init__(
         self,
-        modules: List[ModuleDefinition],
+        modules: List[AnyModuleDefinition],
         packages: 'List[PackageDefinition]',
         path: str
     ):
@@ -243,67 +569,474 @@ class PackageDefinition(ElementDefinition):
         return os.path.basename(self.path)
 
 
-def _is_python_module(path: str) -> bool:
-    """Simple check if file is python module"""
-    if os.path.isfile(path):
-        if path.endswith('.py'):
-            return True
+def _read_source(path: str) -> bytes:
+    """Reads Python module source code"""
+    with open(path, 'rb') as f:
+        return f.read()
 
-    return False
 
+def _parse_source(source: bytes) -> ast.Module:
+    """Builds AST of Python module source code"""
+    return ast.parse(source)
 
-def parse_module(path: str) -> ModuleDefinition:
+
+def parse_module(
+    path: str,
+    cache: Optional[ParseCache] = None,
+    compact: bool = False,
+    shallow: bool = False,
+    docstring_style: Optional[doc.DocstringStyle] = None
+) -> AnyModuleDefinition:
     """
     Parses Python module content
 
     Args:
         path: pathlib.Path, Python module path
+        cache: (ParseCache | None), cache of parsed modules, None by default
+        compact: bool, extract compact records and release module AST,
+            False by default
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies, falls back to AST for unsupported code,
+            False by default
+        docstring_style: (DocstringStyle | None), style of module
+            docstrings, detected for every docstring if None
 
     Returns:
-        ModuleDefinition: module objects definition
+        (ModuleDefinition | ModuleRecord): module objects definition
     """
 
-    with open(path) as f:
-        source = f.read()
+    source = _read_source(path)
+
+    key = None
+    if cache is not None:
+        key = cache.key(
+            path,
+            source,
+            _style_option(docstring_style),
+            _mode(compact, shallow)
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    module: Optional[AnyModuleDefinition] = None
+    if shallow:
+        # Shallow extractor builds records defined in this module
+        from pymdocs.parsers.shallow import ShallowParseError, extract
+        try:
+            module = extract(source, path, docstring_style)
+        except ShallowParseError:
+            module = None
+
+    if module is None:
+        tree = _parse_source(source)
+        module = (
+            RecordsExtractor(path, docstring_style).visit(tree)
+            if compact or shallow
+            else ModuleDefinition(tree, path, docstring_style)
+        )
+
+    if cache is not None and key is not None:
+        _prime(module)
+        cache.put(key, module)
+
+    return module
+
 
-    tree = ast.parse(source)
-    return ModuleDefinition(tree, path)
+def _mode(compact: bool, shallow: bool) -> str:
+    """Returns name of extraction mode, part of cache key"""
+    if shallow:
+        return 'shallow'
 
+    return 'compact' if compact else 'ast'
 
-def parse(path: str) -> Optional[Union[PackageDefinition, ModuleDefinition]]:
+
+def _prime(module: AnyModuleDefinition) -> None:
+    """
+    Evaluates memoized module definition properties, so docstrings are parsed
+    in worker process and stored to cache together with module definition
+
+    Only the elements formatters render are primed: classes, public methods
+    and public functions of public modules. Other docstrings stay unparsed,
+    as they are in serial runs.
+
+    Args:
+        module: (ModuleDefinition | ModuleRecord), module definition to prime
+    """
+
+    if module.name.startswith('_'):
+        return
+
+    functions: List[AnyFunctionDefinition] = list(module.functions)
+    for class_def in module.classes:
+        class_def.inherits
+        class_def.docstring
+        functions.extend(class_def.methods)
+
+    for function_def in functions:
+        if function_def.name.startswith('_'):
+            continue
+
+        function_def.docstring
+        function_def.returns
+        for argument in function_def.arguments:
+            argument.type
+
+
+def _parse_module_job(
+    path: str,
+    cache: Optional[ParseCache],
+    shallow: bool,
+    docstring_style: Optional[doc.DocstringStyle]
+) -> Tuple[AnyModuleDefinition, Optional[CacheStats]]:
+    """
+    Parses Python module inside worker process, docstrings are parsed in
+    the worker too
+
+    Workers always extract compact records, even if module AST is requested:
+    records render the same documentation, and only they are sent back to
+    the parent process instead of the whole pickled AST.
+
+    Returns:
+        tuple[(ModuleDefinition | ModuleRecord), (CacheStats | None)]: module
+            definition and cache counters collected while parsing the module
+    """
+    if cache is None:
+        module = parse_module(
+            path,
+            compact=True,
+            shallow=shallow,
+            docstring_style=docstring_style
+        )
+        _prime(module)
+        return module, None
+
+    # Cache is copied to worker with parent counters, they are reset to send
+    # back only the counters of this module
+    cache.stats = CacheStats()
+    module = parse_module(path, cache, True, shallow, docstring_style)
+    return module, cache.stats
+
+
+def parse_modules(
+    files: List[SourceFile],
+    jobs: Optional[int] = 1,
+    cache: Optional[ParseCache] = None,
+    compact: bool = False,
+    shallow: bool = False,
+    docstring_style: Optional[doc.DocstringStyle] = None,
+    executor: Optional['Executor'] = None
+) -> Dict[str, AnyModuleDefinition]:
+    """
+    Parses Python modules, using process pool if more than one job requested
+    or executor is given
+
+    Args:
+        files: list[SourceFile], Python modules files
+        jobs: (int | None), number of worker processes, all CPUs if None or
+            less than 1, 1 by default
+        cache: (ParseCache | None), cache of parsed modules, None by default
+        compact: bool, extract compact records, False by default, modules
+            parsed by worker processes are always compact records
+        shallow: bool, extract compact records from tokens, False by default
+        docstring_style: (DocstringStyle | None), style of modules
+            docstrings, detected for every docstring if None
+        executor: (Executor | None), process pool shared by several parse
+            calls, jobs are ignored if set, pool is created for the call if
+            None
+
+    Returns:
+        dict[str, (ModuleDefinition | ModuleRecord)]: module definitions by
+            module path
+    """
+
+    if jobs is None or jobs < 1:
+        jobs = os.cpu_count() or 1
+
+    if executor is None and (jobs == 1 or len(files) < 2):
+        return {
+            file.path: parse_module(
+                file.path,
+                cache,
+                compact,
+                shallow,
+                docstring_style
+            )
+            for file in files
+        }
+
+    if executor is not None:
+        return _parse_in_pool(
+            executor,
+            files,
+            cache,
+            shallow,
+            docstring_style
+        )
+
+    # Process pool machinery takes a while to import, so it's imported only
+    # when modules are parsed in parallel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        return _parse_in_pool(
+            executor,
+            files,
+            cache,
+            shallow,
+            docstring_style
+        )
+
+
+def _parse_in_pool(
+    executor: 'Executor',
+    files: List[SourceFile],
+    cache: Optional[ParseCache],
+    shallow: bool,
+    docstring_style: Optional[doc.DocstringStyle]
+) -> Dict[str, AnyModuleDefinition]:
+    """Parses Python modules by pool workers"""
+    # Largest modules go first, so one huge module isn't left for the end
+    ordered_paths = [
+        file.path
+        for file in sorted(files, key=lambda file: file.size, reverse=True)
+    ]
+    modules = {}
+    for path, (module, stats) in zip(
+        ordered_paths,
+        executor.map(
+            _parse_module_job,
+            ordered_paths,
+            repeat(cache),
+            repeat(shallow),
+            repeat(docstring_style)
+        )
+    ):
+        modules[path] = module
+        if cache is not None and stats is not None:
+            cache.stats.merge(stats)
+
+    return modules
+
+
+def _assemble(
+    tree: SourcePackage,
+    modules: Dict[str, AnyModuleDefinition]
+) -> PackageDefinition:
+    """
+    Builds package definition from package layout and parsed modules
+
+    Args:
+        tree: SourcePackage, package layout
+        modules: dict[str, (ModuleDefinition | ModuleRecord)], module
+            definitions by path
+
+    Returns:
+        PackageDefinition: package objects definition
+    """
+
+    return PackageDefinition(
+        modules=[
+            modules[module_file.path]
+            for module_file in tree.modules
+        ],
+        packages=[
+            _assemble(package, modules)
+            for package in tree.packages
+        ],
+        path=tree.path
+    )
+
+
+def _iter_tree_docstrings(tree: ast.Module) -> Iterator[str]:
+    """
+    Yields docstrings of module, its classes and functions and methods of
+    the classes in source order, the same elements RecordsExtractor
+    extracts, nested functions and classes are never documented, so they
+    aren't sampled
+    """
+    nodes: List[Union[ast.Module, ast.ClassDef, ast.FunctionDef]] = [tree]
+    for statement in tree.body:
+        if isinstance(statement, ast.FunctionDef):
+            nodes.append(statement)
+        elif isinstance(statement, ast.ClassDef):
+            nodes.append(statement)
+            for element in statement.body:
+                if isinstance(element, ast.FunctionDef):
+                    nodes.append(element)
+
+    for node in nodes:
+        docstring = _raw_docstring(node)
+        if docstring is not None:
+            yield docstring
+
+
+def _iter_record_docstrings(module: ModuleRecord) -> Iterator[str]:
+    """
+    Yields raw docstrings of module record in the same order as
+    _iter_tree_docstrings does, docstrings aren't parsed
+    """
+    members: List[Union[ClassRecord, FunctionRecord]] = [
+        *module.classes,
+        *module.functions
+    ]
+    members.sort(key=lambda member: member.lineno)
+
+    records: List[_DocumentedRecord] = [module]
+    for member in members:
+        records.append(member)
+        if isinstance(member, ClassRecord):
+            records.extend(member.methods)
+
+    for record in records:
+        if record._raw_docstring is not None:
+            yield record._raw_docstring
+
+
+def _iter_docstrings(
+    files: Iterable[SourceFile],
+    shallow: bool = False,
+    sampled: Optional[List[Tuple[SourceFile, str]]] = None
+) -> Iterator[str]:
+    """
+    Yields docstrings of documented elements of modules
+
+    Args:
+        files: Iterable[SourceFile], Python modules files
+        shallow: bool, read docstrings from tokens without building AST,
+            falls back to AST for unsupported code, False by default
+        sampled: (list[tuple[SourceFile, str]] | None), files with sha256
+            hash of the source read are appended to the list when their
+            docstrings are read, None by default
+
+    Yields:
+        str: raw docstring
+    """
+
+    for file in files:
+        source = _read_source(file.path)
+        if sampled is not None:
+            # Hash is needed only to fingerprint sampled files
+            import hashlib
+
+            sampled.append((file, hashlib.sha256(source).hexdigest()))
+        if shallow:
+            from pymdocs.parsers.shallow import ShallowParseError, extract
+            try:
+                module = extract(source, file.path)
+            except ShallowParseError:
+                pass
+            else:
+                yield from _iter_record_docstrings(module)
+                continue
+
+        yield from _iter_tree_docstrings(_parse_source(source))
+
+
+def resolve_docstring_style(
+    tree: Union[SourceFile, SourcePackage],
+    docstring_style: Optional[doc.DocstringStyle] = None,
+    docstring_sample: int = 0,
+    shallow: bool = False,
+    sampled: Optional[List[Tuple[SourceFile, str]]] = None
+) -> Optional[doc.DocstringStyle]:
+    """
+    Returns docstring style of all package docstrings
+
+    Args:
+        tree: (SourceFile | SourcePackage), sources layout
+        docstring_style: (DocstringStyle | None), pinned docstring style,
+            None by default
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style if it isn't pinned, 0 by default
+        shallow: bool, read sampled docstrings from tokens without building
+            AST, False by default
+        sampled: (list[tuple[SourceFile, str]] | None), files which
+            docstrings were sampled and sha256 hashes of their sources are
+            appended to the list in sampling order, None by default
+
+    Returns:
+        (DocstringStyle | None): pinned or sampled style, None if style
+            should be detected for every docstring
+    """
+
+    if docstring_style is not None or docstring_sample < 1:
+        return docstring_style
+
+    files = [tree] if isinstance(tree, SourceFile) else tree.iter_modules()
+    return doc.sample_style(
+        _iter_docstrings(files, shallow, sampled),
+        docstring_sample
+    )
+
+
+def parse(
+    path: str,
+    jobs: Optional[int] = 1,
+    cache: Optional[ParseCache] = None,
+    compact: bool = False,
+    walker: Optional[SourceWalker] = None,
+    shallow: bool = False,
+    docstring_style: Optional[doc.DocstringStyle] = None,
+    docstring_sample: int = 0,
+    executor: Optional['Executor'] = None
+) -> Optional[Union[PackageDefinition, AnyModuleDefinition]]:
     """
     Parses Python module or package content
 
     Args:
         path: pathlib.Path, Python module path
+        jobs: (int | None), number of worker processes parsing modules,
+            all CPUs if None or less than 1, 1 by default
+        cache: (ParseCache | None), cache of parsed modules, None by default
+        compact: bool, extract compact records and release modules AST,
+            False by default
+        walker: (SourceWalker | None), walker collecting package modules,
+            walker with default exclude patterns if None
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies, False by default
+        docstring_style: (DocstringStyle | None), pinned docstring style,
+            None by default
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style for all docstrings if it isn't pinned,
+            style of every docstring is detected if 0, 0 by default
+        executor: (Executor | None), process pool shared by several parse
+            calls, jobs are ignored if set, None by default
 
     Returns:
-        (ModuleDefinition | PackageDefinition | None): module or package
-            objects definition
+        (ModuleDefinition | ModuleRecord | PackageDefinition | None): module
+            or package objects definition
     """
 
-    if _is_python_module(path):
-        return parse_module(path)
-    elif os.path.isdir(path):
-        modules = []
-        packages = []
+    tree = (walker or SourceWalker()).walk(path)
+    if tree is None:
+        return None
 
-        for entity in os.listdir(path):
-            entity_path = os.path.join(path, entity)
-            entity_def = parse(entity_path)
+    # Style is sampled before parsing, so it doesn't depend on the order
+    # modules are parsed in
+    docstring_style = resolve_docstring_style(
+        tree,
+        docstring_style,
+        docstring_sample,
+        shallow
+    )
+    if isinstance(tree, SourceFile):
+        definition: Union[PackageDefinition, AnyModuleDefinition] = (
+            parse_module(tree.path, cache, compact, shallow, docstring_style)
+        )
+    else:
+        modules = parse_modules(
+            list(tree.iter_modules()),
+            jobs,
+            cache,
+            compact,
+            shallow,
+            docstring_style,
+            executor
+        )
+        definition = _assemble(tree, modules)
 
-            if entity_def is None:
-                continue
-            elif isinstance(entity_def, ModuleDefinition):
-                modules.append(entity_def)
-            elif isinstance(entity_def, PackageDefinition):
-                packages.append(entity_def)
-
-        if modules or packages:
-            return PackageDefinition(
-                modules=modules,
-                packages=packages,
-                path=path
-            )
+    if cache is not None:
+        cache.prune()
 
-    return None
+    return definition
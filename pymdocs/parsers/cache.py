@@ -0,0 +1,228 @@
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import pymdocs
+
+# hashlib, pickle and tempfile are imported on first use, so pymdocs starts
+# faster when cache is disabled
+
+# 256 MB
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = '.pickle'
+_TMP_PREFIX = '.tmp-'
+
+
+class CacheStats:
+    """
+    Parse cache counters
+
+    Attributes:
+        hits: int, number of definitions loaded from cache
+        misses: int, number of definitions not found in cache
+        writes: int, number of definitions stored to cache
+        evictions: int, number of entries removed to fit cache size
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def merge(self, other: 'CacheStats') -> None:
+        """
+        Adds counters of other stats, collected in worker process
+
+        Args:
+            other: CacheStats, stats to add
+        """
+        self.hits += other.hits
+        self.misses += other.misses
+        self.writes += other.writes
+        self.evictions += other.evictions
+
+    def as_dict(self) -> Dict[str, int]:
+        """Returns counters as dictionary"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions
+        }
+
+
+class ParseCache:
+    """
+    Persistent on-disk cache of parsed module definitions
+
+    Entries are keyed by module path and source content hash, pymdocs and
+    Python versions and parsing options, so any change of them is a cache
+    miss. Entries are written to temporary file and renamed, so cache
+    directory could be shared by concurrent processes. The least recently
+    used entries are removed by `prune` when cache exceeds its size.
+
+    Attributes:
+        path: str, path to cache directory
+        max_size: int, maximum size of cache entries in bytes
+        stats: CacheStats, cache counters
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = DEFAULT_MAX_SIZE
+    ):
+        self.path = path
+        self.max_size = max_size
+        self.stats = CacheStats()
+
+    @staticmethod
+    def key(path: str, source: bytes, *options: str) -> str:
+        """
+        Returns cache key for module source
+
+        Args:
+            path: str, path to module
+            source: bytes, module source
+            *options: str, parsing options, e.g. docstring style
+
+        Returns:
+            str: cache key
+        """
+
+        import hashlib
+
+        key = hashlib.sha256()
+        for part in (
+            pymdocs.__version__,
+            '.'.join(map(str, sys.version_info[:2])),
+            os.path.abspath(path),
+            *options
+        ):
+            key.update(part.encode())
+            key.update(b'\0')
+
+        key.update(source)
+        return key.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        """Returns path to cache entry file"""
+        return os.path.join(self.path, key[:2], key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Loads cached value
+
+        Args:
+            key: str, cache key
+
+        Returns:
+            (Any | None): cached value, None if there is no valid entry
+        """
+
+        import pickle
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except Exception:
+            # Broken entry, e.g. written by incompatible pymdocs version
+            self.stats.misses += 1
+            self._remove(entry_path)
+            return None
+
+        # Modification time is used as last access time for LRU eviction
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Stores value to cache atomically
+
+        Args:
+            key: str, cache key
+            value: Any, value to store, must be picklable
+        """
+
+        import pickle
+        import tempfile
+
+        entry_path = self._entry_path(key)
+        entry_dir = os.path.dirname(entry_path)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, prefix=_TMP_PREFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            self._remove(tmp_path)
+            return
+
+        self.stats.writes += 1
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """Returns list of cache entries access times, sizes and paths"""
+        entries: List[Tuple[float, int, str]] = []
+        if not os.path.isdir(self.path):
+            return entries
+
+        with os.scandir(self.path) as bucket_entries:
+            for bucket in bucket_entries:
+                if not bucket.is_dir():
+                    continue
+
+                with os.scandir(bucket.path) as bucket_files:
+                    for entry in bucket_files:
+                        if not entry.name.endswith(_ENTRY_SUFFIX):
+                            continue
+
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+
+                        entries.append(
+                            (stat.st_mtime, stat.st_size, entry.path)
+                        )
+
+        return entries
+
+    def prune(self) -> None:
+        """Removes the least recently used entries to fit cache size"""
+        entries = self._entries()
+        size = sum(entry_size for _, entry_size, _ in entries)
+        if size <= self.max_size:
+            return
+
+        for _, entry_size, entry_path in sorted(entries):
+            if size <= self.max_size:
+                break
+
+            if self._remove(entry_path):
+                self.stats.evictions += 1
+
+            size -= entry_size
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        """Removes file if it still exists"""
+        try:
+            os.remove(path)
+        except OSError:
+            return False
+
+        return True
@@ -1,9 +1,22 @@
+import importlib
+from collections import Counter
 from enum import Enum
-from typing import Callable, Dict
+from types import ModuleType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TYPE_CHECKING,
+    Tuple
+)
 
-import pymdocs.parsers.docstring.google as google
-import pymdocs.parsers.docstring.numpy as numpy
 from pymdocs.parsers.docstring.base import Docstring
+from pymdocs.parsers.docstring.helpers import DocstringLines
+
+if TYPE_CHECKING:
+    from pymdocs.parsers.docstring.cache import DocstringCache
 
 
 class DocstringStyle(int, Enum):
@@ -11,19 +24,244 @@ class DocstringStyle(int, Enum):
     NUMPY = 2
 
 
+# Number of docstrings with sections sampled to pick project style
+DEFAULT_SAMPLE_SIZE = 50
+
+_STYLE_MODULE_NAMES: Dict[DocstringStyle, str] = {
+    DocstringStyle.GOOGLE: 'google',
+    DocstringStyle.NUMPY: 'numpy'
+}
+
+_style_modules: Dict[DocstringStyle, ModuleType] = {}
+
+# Section names of all styles, filled on the first style detection
+_section_names: Tuple[str, ...] = ()
+
+# Cache of parsed docstrings, created on the first parse
+_docstring_cache: Optional['DocstringCache'] = None
+
+
+def _style_module(style: DocstringStyle) -> ModuleType:
+    """
+    Returns docstring style module, the module and its regular expressions
+    are loaded on the first use
+
+    Args:
+        style: DocstringStyle, docstring style
+
+    Returns:
+        ModuleType: module with parse and find_sections functions
+    """
+
+    module = _style_modules.get(style)
+    if module is None:
+        module = _style_modules[style] = importlib.import_module(
+            f'{__name__}.{_STYLE_MODULE_NAMES[style]}'
+        )
+
+    return module
+
+
+def _lazy_parser(style: DocstringStyle) -> Callable[[str], Docstring]:
+    """Returns parse function loading style module on the first call"""
+    def parse(docstring: str) -> Docstring:
+        return _style_module(style).parse(docstring)
+
+    return parse
+
+
 DOCSTRING_STYLE_MAP: Dict[DocstringStyle, Callable[[str], Docstring]] = {
-    DocstringStyle.GOOGLE: google.parse,
-    DocstringStyle.NUMPY: numpy.parse
+    style: _lazy_parser(style)
+    for style in DocstringStyle
 }
 
+# Docstrings without sections are parsed the same way by any style, the last
+# style is used like for styles with equal number of sections
+_DEFAULT_STYLE = list(DOCSTRING_STYLE_MAP)[-1]
+
+
+def _has_section_names(docstring: str) -> bool:
+    """
+    Checks if docstring contains section name of any style, most docstrings
+    have no sections and are rejected without splitting them to lines
+    """
+
+    global _section_names
+    if not _section_names:
+        _section_names = tuple({
+            section.value
+            for style in DOCSTRING_STYLE_MAP
+            for section in _style_module(style).DocstringSections
+        })
+
+    for name in _section_names:
+        if name in docstring:
+            return True
+
+    return False
+
+
+def _detect_lines(
+    lines: DocstringLines
+) -> Tuple[Optional[DocstringStyle], List[Tuple[str, int, int]]]:
+    """
+    Detects docstring style by section headers found in docstring lines
+
+    Args:
+        lines: DocstringLines, docstring lines
+
+    Returns:
+        tuple[(DocstringStyle | None), list[tuple[str, int, int]]]: style
+            with the most section headers and its sections, the last one of
+            styles with equal number of headers, None and no sections if
+            docstring has no sections
+    """
+
+    best_fit = None
+    best_sections: List[Tuple[str, int, int]] = []
+    for style in DOCSTRING_STYLE_MAP:
+        sections = _style_module(style).find_sections(lines)
+        if sections and len(sections) >= len(best_sections):
+            best_fit = style
+            best_sections = sections
+
+    return best_fit, best_sections
+
+
+def detect_style(docstring: str) -> Optional[DocstringStyle]:
+    """
+    Detects docstring style by section headers, without parsing sections
+
+    Args:
+        docstring: str, docstring text
+
+    Returns:
+        (DocstringStyle | None): style with the most section headers, the
+            last one of styles with equal number of headers, None if
+            docstring has no sections
+    """
+
+    if not _has_section_names(docstring):
+        return None
+
+    return _detect_lines(DocstringLines(docstring))[0]
+
+
+def sample_style(
+    docstrings: Iterable[str],
+    sample_size: int = DEFAULT_SAMPLE_SIZE
+) -> Optional[DocstringStyle]:
+    """
+    Picks the most common style of the first docstrings with sections
+
+    Args:
+        docstrings: Iterable[str], docstrings in stable order
+        sample_size: int, number of docstrings with sections to sample
+
+    Returns:
+        (DocstringStyle | None): the most common style, None if there are
+            no docstrings with sections
+    """
+
+    counts: Counter = Counter()
+    for docstring in docstrings:
+        style = detect_style(docstring)
+        if style is None:
+            continue
+
+        counts[style] += 1
+        if sum(counts.values()) >= sample_size:
+            break
+
+    if not counts:
+        return None
+
+    # Styles with equal counts are resolved like in detect_style
+    return max(reversed(DOCSTRING_STYLE_MAP), key=lambda style: counts[style])
+
+
+def docstring_cache() -> 'DocstringCache':
+    """
+    Returns process-wide cache of parsed docstrings, keyed by docstring text
+    and style
+
+    Returns:
+        DocstringCache: cache of parsed docstrings
+    """
+
+    global _docstring_cache
+    if _docstring_cache is None:
+        # Cache module is imported only when docstrings are parsed
+        from pymdocs.parsers.docstring.cache import DocstringCache
+
+        _docstring_cache = DocstringCache()
+
+    return _docstring_cache
+
+
+def cache_info() -> Dict[str, int]:
+    """
+    Returns counters of parsed docstrings cache
+
+    Returns:
+        dict[str, int]: numbers of cache hits, misses, writes and
+            evictions, current and maximum number of cached docstrings
+    """
+
+    cache = docstring_cache()
+    info = cache.stats.as_dict()
+    info['size'] = len(cache)
+    info['max_size'] = cache.max_size
+    return info
+
+
+def cache_clear() -> None:
+    """Removes all parsed docstrings from cache and resets its counters"""
+    docstring_cache().clear()
+
+
+def _parse(
+    docstring: str,
+    style: Optional[DocstringStyle] = None
+) -> Docstring:
+    """Parses docstring without cache"""
+    if style is not None:
+        return DOCSTRING_STYLE_MAP[style](docstring)
+
+    if not _has_section_names(docstring):
+        return DOCSTRING_STYLE_MAP[_DEFAULT_STYLE](docstring)
+
+    # Lines and sections found while detecting style are parsed right away
+    lines = DocstringLines(docstring)
+    detected, sections = _detect_lines(lines)
+    return _style_module(detected or _DEFAULT_STYLE).parse_lines(
+        lines,
+        sections
+    )
+
+
+def parse(
+    docstring: str,
+    style: Optional[DocstringStyle] = None
+) -> Docstring:
+    """
+    Parses docstring, equal docstrings are parsed once and share the result
+    while it is kept in cache
+
+    Args:
+        docstring: str, docstring text
+        style: (DocstringStyle | None), docstring style, detected for every
+            docstring if None
+
+    Returns:
+        Docstring: parsed docstring, must not be modified
+    """
 
-def parse(docstring: str) -> Docstring:
-    best_fit: Docstring
-    n_sections = 0
-    for _, parse_func in DOCSTRING_STYLE_MAP.items():
-        result = parse_func(docstring)
-        if len(result._attributes) >= n_sections:
-            best_fit = result
-            n_sections = len(result._attributes)
+    cache = docstring_cache()
+    key = (docstring, style)
+    result = cache.get(key)
+    if result is None:
+        result = _parse(docstring, style)
+        cache.put(key, result)
 
-    return best_fit
+    return result
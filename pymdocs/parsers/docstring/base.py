@@ -177,7 +177,8 @@ class DocstringYiedlsSection(DocstringSection[DocstringYiedls]):
 
 class Docstring(DocstringSection):
     """
-    Class for python docstring
+    Class for python docstring, parsed docstrings are cached and shared by
+    equal docstrings, so they are never modified
 
     Attributes:
         attributes: List[DocstringSection], list of docstring sections
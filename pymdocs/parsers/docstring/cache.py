@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from pymdocs.parsers.cache import CacheStats
+from pymdocs.parsers.docstring.base import Docstring
+
+# Number of parsed docstrings kept in memory
+DEFAULT_CACHE_SIZE = 4096
+
+
+class DocstringCache:
+    """
+    Bounded in-memory LRU cache of parsed docstrings
+
+    Parsed docstrings are shared by all equal docstrings, so they must not be
+    modified after parsing. Cache could be used by several threads without
+    locking, every operation on the ordered dictionary is atomic, counters
+    are approximate then.
+
+    Attributes:
+        max_size: int, maximum number of cached docstrings, cache is
+            disabled if 0
+        stats: CacheStats, cache counters, writes are numbers of parsed
+            docstrings stored to cache
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._entries: 'OrderedDict[Hashable, Docstring]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Docstring]:
+        """
+        Returns cached docstring and marks it as recently used
+
+        Args:
+            key: Hashable, cache key
+
+        Returns:
+            (Docstring | None): cached docstring, None if it isn't cached
+        """
+
+        value = self._entries.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Evicted by another thread
+            pass
+
+        self.stats.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Docstring) -> None:
+        """
+        Stores docstring, the least recently used ones are evicted to fit
+        cache size
+
+        Args:
+            key: Hashable, cache key
+            value: Docstring, parsed docstring
+        """
+
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = value
+        self.stats.writes += 1
+        if len(self._entries) > self.max_size:
+            self._evict()
+
+    def resize(self, max_size: int) -> None:
+        """
+        Changes cache size, the least recently used docstrings are evicted
+        to fit the new size
+
+        Args:
+            max_size: int, maximum number of cached docstrings
+        """
+
+        self.max_size = max_size
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all cached docstrings and resets counters"""
+        self._entries.clear()
+        self.stats = CacheStats()
+
+    def _evict(self) -> None:
+        """Removes the least recently used docstrings to fit cache size"""
+        while len(self._entries) > max(self.max_size, 0):
+            try:
+                self._entries.popitem(last=False)
+            except KeyError:
+                # Emptied by another thread
+                break
+
+            self.stats.evictions += 1
@@ -1,7 +1,6 @@
-import inspect
 import re
 from enum import Enum
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 
 from pymdocs.parsers.docstring.base import (
     Docstring,
@@ -19,7 +18,10 @@ from pymdocs.parsers.docstring.base import (
     DocstringYiedls,
     DocstringYiedlsSection
 )
-from pymdocs.parsers.docstring.helpers import iter_split
+from pymdocs.parsers.docstring.helpers import (
+    DocstringLines,
+    sections_slices
+)
 
 
 class DocstringSections(str, Enum):
@@ -36,13 +38,12 @@ SINGLE_SECTIONS = {
 }
 
 DOCSTRING_SECTION_PATTERN = re.compile(
-    r'^(?P<type>('
+    r'(?P<type>('
     + '|'.join(
         member.value
         for member in DocstringSections
     )
-    + r')):',
-    re.MULTILINE
+    + r')):'
 )
 
 DOCSTRING_TYPING_ANNOTATION = re.compile(
@@ -53,21 +54,18 @@ DOCSTRING_TYPING_ANNOTATION = re.compile(
 )
 
 DOCSTRING_ARG_PATTERN = re.compile(
-    r'^[ \t]+(?P<name>(\*{1,2})?[A-Za-z_][A-Za-z0-9_]*)'
-    rf'([ \t]+{DOCSTRING_TYPING_ANNOTATION})?[ \t]*:',
-    re.MULTILINE
+    r'[ \t]+(?P<name>(\*{1,2})?[A-Za-z_][A-Za-z0-9_]*)'
+    rf'([ \t]+{DOCSTRING_TYPING_ANNOTATION})?[ \t]*:'
 )
 
 DOCSTRING_EXAMPLES_PATTERN = re.compile(r'(?!.*)')
 
 DOCSTRING_RAISES_PATTERN = re.compile(
-    r'^[ \t]+(?P<exception>[A-Za-z_][A-Za-z0-9_]*)\s*:',
-    re.MULTILINE
+    r'[ \t]+(?P<exception>[A-Za-z_][A-Za-z0-9_]*)\s*:'
 )
 
 DOCSTRING_RETURNS_PATTERN = re.compile(
-    rf'^[ \t]+{DOCSTRING_TYPING_ANNOTATION.pattern}\s*:',
-    re.MULTILINE
+    rf'[ \t]+{DOCSTRING_TYPING_ANNOTATION.pattern}\s*:'
 )
 
 
@@ -99,12 +97,40 @@ SECTION_CLASS_MAP: Dict[str, type] = {
 }
 
 
-def parse_section(text: str, section_type: str) -> DocstringSection:
+def find_sections(lines: DocstringLines) -> List[Tuple[str, int, int]]:
+    """
+    Finds section headers in docstring lines
+
+    Args:
+        lines: DocstringLines, docstring lines
+
+    Returns:
+        list[tuple[str, int, int]]: section type, offset of section header
+            and offset of section text
+    """
+    return [
+        (group.group('type'), group_start, group.end())
+        for group, group_start in lines.iter_matches(
+            DOCSTRING_SECTION_PATTERN,
+            0,
+            len(lines.text)
+        )
+    ]
+
+
+def parse_section(
+    lines: DocstringLines,
+    start: int,
+    end: int,
+    section_type: str
+) -> DocstringSection:
     """
-    Parses section from text by section type
+    Parses section from docstring lines by section type
 
     Args:
-        text: str, text to parse
+        lines: DocstringLines, docstring lines
+        start: int, offset of section text
+        end: int, offset of section end
         section_type: str, section type (Args, Attributes, Raises, etc.)
 
     Returns:
@@ -114,18 +140,24 @@ def parse_section(text: str, section_type: str) -> DocstringSection:
     element_pattern = SECTION_ELEMENT_PATTERN_MAP[section_type]
     section = SECTION_CLASS_MAP[section_type]
     section_element = SECTION_ELEMENT_CLASS_MAP[section_type]
+    single = section_type in SINGLE_SECTIONS
     attributes = []
 
-    for group, text, _, _ in iter_split(element_pattern, text):
-        description = inspect.cleandoc(text)
-        if section_type in SINGLE_SECTIONS:
+    for group, text_start, text_end in lines.iter_split(
+        element_pattern,
+        start,
+        end
+    ):
+        if single:
             attributes.append(
-                section_element(description=description)
+                section_element(
+                    description=lines.clean(text_start, text_end)
+                )
             )
         elif group is not None:
             attributes.append(
                 section_element(
-                    description=description,
+                    description=lines.clean(text_start, text_end),
                     **group.groupdict()
                 )
             )
@@ -135,31 +167,47 @@ def parse_section(text: str, section_type: str) -> DocstringSection:
     )
 
 
-def parse(docstring: str) -> Docstring:
+def parse_lines(
+    lines: DocstringLines,
+    sections: Optional[List[Tuple[str, int, int]]] = None
+) -> Docstring:
     """
-    Parses Google Style docstring
+    Parses Google Style docstring lines
 
     Args:
-        docstring: Google Style docstring
+        lines: DocstringLines, docstring lines
+        sections: (list[tuple[str, int, int]] | None), sections found by
+            find_sections, searched if None
 
     Returns:
         Docstring: Docstring object
     """
-    cleared_docstring = inspect.cleandoc(docstring)
-    description = None
-    sections = []
+    if sections is None:
+        sections = find_sections(lines)
 
-    for group, text, _, _ in iter_split(
-        DOCSTRING_SECTION_PATTERN,
-        cleared_docstring
-    ):
-        if group is None:
-            description = inspect.cleandoc(text)
-        else:
-            section_type = group.group('type')
-            sections.append(parse_section(text, section_type))
+    text_end = len(lines.text)
+    description = lines.clean(0, sections[0][1] if sections else text_end)
 
     return Docstring(
-        attributes=sections,
+        attributes=[
+            parse_section(lines, start, end, section_type)
+            for section_type, start, end in sections_slices(
+                sections,
+                text_end
+            )
+        ],
         description=description
     )
+
+
+def parse(docstring: str) -> Docstring:
+    """
+    Parses Google Style docstring
+
+    Args:
+        docstring: Google Style docstring
+
+    Returns:
+        Docstring: Docstring object
+    """
+    return parse_lines(DocstringLines(docstring))
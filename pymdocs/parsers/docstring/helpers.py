@@ -1,51 +1,239 @@
 import re
-from typing import Iterator, Optional, Tuple
+import sys
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
+# inspect.cleandoc strips only spaces since Python 3.13
+if sys.version_info >= (3, 13):
+    def _lstrip(line: str) -> str:
+        return line.lstrip(' ')
+else:
+    _lstrip: Callable[[str], str] = str.lstrip
 
-def iter_split(
-    pattern: re.Pattern,
-    text: str
-) -> Iterator[Tuple[Optional[re.Match], str, int, int]]:
+
+class DocstringLines:
+    """
+    Docstring with indentation removed the same way inspect.cleandoc does,
+    split to lines once, so sections and their elements are found and
+    cleaned without splitting and dedenting the same text again
+
+    Attributes:
+        text: str, cleaned docstring
+        lines: list[str], lines of cleaned docstring
+    """
+
+    __slots__ = ('text', 'lines', '_starts')
+
+    def __init__(self, docstring: str):
+        lines = docstring.expandtabs().split('\n')
+
+        margin = sys.maxsize
+        for line in lines[1:]:
+            content = len(_lstrip(line))
+            if content:
+                indent = len(line) - content
+                if indent < margin:
+                    margin = indent
+
+        lines[0] = _lstrip(lines[0])
+        if margin < sys.maxsize:
+            lines[1:] = [line[margin:] for line in lines[1:]]
+
+        # Leading and trailing empty lines are removed
+        while lines and not lines[-1]:
+            lines.pop()
+
+        start = 0
+        while start < len(lines) and not lines[start]:
+            start += 1
+
+        self.lines = lines[start:] if start else lines
+        self.text = '\n'.join(self.lines)
+        self._starts: Optional[List[int]] = None
+
+    @property
+    def starts(self) -> List[int]:
+        """Returns offsets of lines in cleaned docstring"""
+        if self._starts is None:
+            self._starts = [0]
+            self._starts.extend(
+                accumulate(len(line) + 1 for line in self.lines[:-1])
+            )
+
+        return self._starts
+
+    def clean(self, start: int, end: int) -> str:
+        """
+        Returns part of docstring cleaned like inspect.cleandoc would do
+        without splitting it to lines again
+
+        Args:
+            start: int, offset of text start
+            end: int, offset of text end
+
+        Returns:
+            str: cleaned text
+        """
+
+        # Trailing empty lines are removed anyway and don't affect margin
+        text = self.text
+        while end > start and text[end - 1] == '\n':
+            end -= 1
+
+        if start >= end:
+            return ''
+
+        lines = self.lines
+        if start == 0 and end == len(text):
+            # The whole docstring is cleaned without slicing lines
+            first = 0
+            last = len(lines) - 1
+            head = _lstrip(lines[0])
+            tail = lines[last]
+        else:
+            newlines = text.count('\n', start, end)
+            if not newlines:
+                return _lstrip(text[start:end])
+
+            starts = self.starts
+            first = bisect_right(starts, start) - 1
+            last = first + newlines
+            head = _lstrip(text[start:starts[first] + len(lines[first])])
+            tail = text[starts[last]:end]
+
+        if first == last:
+            return head
+
+        # The first line is excluded from indentation like in cleandoc
+        body = lines[first + 1:last]
+        body.append(tail)
+        margin = sys.maxsize
+        for line in body:
+            content = len(_lstrip(line))
+            if content and len(line) - content < margin:
+                margin = len(line) - content
+
+        if 0 < margin < sys.maxsize:
+            body = [line[margin:] for line in body]
+
+        body.insert(0, head)
+
+        # Leading and trailing empty lines are removed like in cleandoc
+        stop = len(body)
+        while stop and not body[stop - 1]:
+            stop -= 1
+
+        begin = 0
+        while begin < stop and not body[begin]:
+            begin += 1
+
+        return '\n'.join(body[begin:stop])
+
+    def iter_matches(
+        self,
+        pattern: re.Pattern,
+        start: int,
+        end: int
+    ) -> Iterator[Tuple[re.Match, int]]:
+        """
+        Iterates through not overlapping pattern matches at the beginning of
+        text and at the beginning of every line
+
+        Args:
+            pattern: re.Pattern, pattern to match
+            start: int, offset of text start
+            end: int, offset of text end
+
+        Yields:
+            tuple[re.Match, int]: match and offset of its beginning
+        """
+
+        text = self.text
+        line_pattern = _line_start_pattern(pattern)
+
+        group = pattern.match(text, start, end)
+        if group is not None:
+            yield group, start
+            start = group.end()
+
+        # Line start pattern matches the preceding line break too, so search
+        # starts right before the possible beginning of a line
+        group = line_pattern.search(text, max(start - 1, 0), end)
+        while group is not None:
+            yield group, group.start() + 1
+            group = line_pattern.search(text, group.end() - 1, end)
+
+    def iter_split(
+        self,
+        pattern: re.Pattern,
+        start: int,
+        end: int
+    ) -> Iterator[Tuple[Optional[re.Match], int, int]]:
+        """
+        Iterates through pattern matches at the beginning of text and at the
+        beginning of every line, yields offsets of text between them
+
+        Args:
+            pattern: re.Pattern, pattern of element start, matched only at
+                text and lines beginnings
+            start: int, offset of text start
+            end: int, offset of text end
+
+        Yields:
+            tuple[(re.Match | None), int, int]: tuple of match, offsets of
+                text from match end till next match or text end
+        """
+
+        last_group: Optional[re.Match] = None
+        text_start = start
+        for group, group_start in self.iter_matches(pattern, start, end):
+            yield last_group, text_start, group_start
+            last_group = group
+            text_start = group.end()
+
+        yield last_group, text_start, end
+
+
+_line_start_patterns: Dict[re.Pattern, re.Pattern] = {}
+
+
+def _line_start_pattern(pattern: re.Pattern) -> re.Pattern:
+    """
+    Returns pattern matching after a line break, patterns starting with
+    a literal character are searched much faster than the ones starting with
+    the beginning of line
+    """
+    line_pattern = _line_start_patterns.get(pattern)
+    if line_pattern is None:
+        line_pattern = _line_start_patterns[pattern] = re.compile(
+            f'\n(?:{pattern.pattern})',
+            pattern.flags
+        )
+
+    return line_pattern
+
+
+def sections_slices(
+    sections: List[Tuple[str, int, int]],
+    text_end: int
+) -> Iterator[Tuple[str, int, int]]:
     """
-    Iterates through pattern matches and yiedls text between them
+    Iterates through sections found in docstring
 
     Args:
-        pattern: re.Pattern, pattern to search
-        text: str, text to search pattern
+        sections: list[tuple[str, int, int]], section type, offset of
+            section header and offset of section text
+        text_end: int, length of docstring
 
     Yields:
-        tuple[(re.Match | None), str, int, int]: tuple of match,
-            text till next metch or text end, start of match and end of text
+        tuple[str, int, int]: section type and offsets of section text
     """
-    pos = 0
-    last_group: Optional[re.Match] = None
-
-    for group in pattern.finditer(text):
-        last_group_end = group.start()
-        last_group_start = (
-            0 if last_group is None
-            else last_group.start()
-        )
 
-        yield (
-            last_group,
-            text[pos:last_group_end],
-            last_group_start,
-            last_group_end
+    for i, (section_type, _, text_start) in enumerate(sections):
+        section_end = (
+            sections[i + 1][1]
+            if i + 1 < len(sections)
+            else text_end
         )
-
-        pos = group.end()
-        last_group = group
-
-    last_group_end = len(text)
-    last_group_start = (
-        0 if last_group is None
-        else last_group.start()
-    )
-
-    yield (
-        last_group,
-        text[pos:last_group_end],
-        last_group_start,
-        last_group_end
-    )
+        yield section_type, text_start, section_end
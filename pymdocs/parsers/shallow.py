@@ -0,0 +1,435 @@
+import ast
+import io
+import keyword
+import tokenize
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple, Union
+
+from pymdocs.parsers.annotation import render as render_annotation
+from pymdocs.parsers.ast import (
+    ArgumentRecord,
+    ClassRecord,
+    FunctionRecord,
+    ModuleRecord,
+    TypingRecord
+)
+from pymdocs.parsers.docstring import DocstringStyle
+
+_SKIPPED_TOKENS = {
+    tokenize.COMMENT,
+    tokenize.NL,
+    tokenize.ENCODING
+}
+
+_LINE_END = (';', None)
+
+# Docstrings of methods are the deepest documented statements
+_MAX_DEPTH = 2
+
+
+class ShallowParseError(Exception):
+    """Raised on source code shallow parser doesn't support"""
+
+
+def _logical_lines(
+    source: bytes
+) -> Iterator[Tuple[int, List[tokenize.TokenInfo]]]:
+    """
+    Groups source tokens into logical lines, tokens of lines nested deeper
+    than documented statements are skipped
+
+    Args:
+        source: bytes, Python module source
+
+    Yields:
+        tuple[int, list[TokenInfo]]: indentation level and line tokens
+    """
+
+    depth = 0
+    line: List[tokenize.TokenInfo] = []
+    try:
+        for token in tokenize.tokenize(io.BytesIO(source).readline):
+            if token.type in _SKIPPED_TOKENS:
+                continue
+            elif token.type == tokenize.INDENT:
+                depth += 1
+            elif token.type == tokenize.DEDENT:
+                depth -= 1
+            elif token.type == tokenize.NEWLINE:
+                if line:
+                    yield depth, line
+                    line = []
+            elif depth <= _MAX_DEPTH and token.type != tokenize.ENDMARKER:
+                line.append(token)
+    except (tokenize.TokenError, SyntaxError) as e:
+        raise ShallowParseError(str(e)) from e
+
+    if line:
+        yield depth, line
+
+
+def _split(
+    tokens: List[tokenize.TokenInfo],
+    separator: str
+) -> List[List[tokenize.TokenInfo]]:
+    """Splits tokens by separator outside of brackets"""
+    parts: List[List[tokenize.TokenInfo]] = [[]]
+    depth = 0
+    for token in tokens:
+        if token.type == tokenize.OP:
+            if token.string in '([{':
+                depth += 1
+            elif token.string in ')]}':
+                depth -= 1
+            elif token.string == separator and depth == 0:
+                parts.append([])
+                continue
+
+        parts[-1].append(token)
+
+    return parts
+
+
+def _closing(tokens: List[tokenize.TokenInfo], start: int) -> int:
+    """Returns index of bracket closing the bracket at start index"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token.type == tokenize.OP:
+            if token.string in '([{':
+                depth += 1
+            elif token.string in ')]}':
+                depth -= 1
+                if depth == 0:
+                    return i
+
+    raise ShallowParseError('Unclosed bracket')
+
+
+def _skip_type_params(tokens: List[tokenize.TokenInfo]) -> int:
+    """
+    Returns index of token following class or function name and its type
+    parameters, if there are any
+    """
+    if len(tokens) > 2 and tokens[2].string == '[':
+        return _closing(tokens, 2) + 1
+
+    return 2
+
+
+def _header_end(tokens: List[tokenize.TokenInfo], start: int) -> int:
+    """Returns index of colon ending compound statement header"""
+    depth = 0
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token.type == tokenize.OP:
+            if token.string in '([{':
+                depth += 1
+            elif token.string in ')]}':
+                depth -= 1
+            elif token.string == ':' and depth == 0:
+                return i
+
+    raise ShallowParseError('Compound statement header without colon')
+
+
+@lru_cache(maxsize=4096)
+def _typing(text: str) -> TypingRecord:
+    """
+    Returns typing annotation record for annotation source text, the same
+    annotations are parsed and rendered once for all modules
+
+    Args:
+        text: str, annotation tokens joined with spaces
+
+    Returns:
+        TypingRecord: typing annotation record
+
+    Raises:
+        ShallowParseError: if text is not an expression
+    """
+
+    try:
+        expression = ast.parse(f'({text})', mode='eval')
+    except SyntaxError as e:
+        raise ShallowParseError(str(e)) from e
+
+    return TypingRecord(render_annotation(expression.body))
+
+
+def _docstring(tokens: List[tokenize.TokenInfo]) -> Optional[str]:
+    """
+    Returns docstring if statement tokens are string literal expression
+
+    Args:
+        tokens: list[TokenInfo], tokens of the first body statement
+
+    Returns:
+        (str | None): docstring text
+    """
+
+    if not tokens:
+        return None
+    elif tokens[0].type == tokenize.OP and tokens[0].string == '(':
+        # Parenthesized expression could be a docstring as well
+        raise ShallowParseError('Parenthesized expression in docstring place')
+
+    strings = []
+    for token in tokens:
+        if token.type != tokenize.STRING:
+            if token.string not in _LINE_END:
+                return None
+
+            break
+
+        prefix = token.string[:token.string.index(token.string[-1])]
+        if 'f' in prefix.lower() or 'b' in prefix.lower():
+            return None
+
+        strings.append(token.string)
+
+    if not strings:
+        return None
+
+    try:
+        return ast.literal_eval(' '.join(strings))
+    except (ValueError, SyntaxError) as e:
+        raise ShallowParseError(str(e)) from e
+
+
+class ShallowExtractor:
+    """
+    Builds compact module records from source tokens, without building AST
+    for function bodies
+
+    Attributes:
+        path: str, path to module
+        docstring_style: (DocstringStyle | None), style of module
+            docstrings, detected for every docstring if None
+    """
+
+    def __init__(
+        self,
+        path: str,
+        docstring_style: Optional[DocstringStyle] = None
+    ):
+        self.path = path
+        self.docstring_style = docstring_style
+
+    def _typing(
+        self,
+        tokens: List[tokenize.TokenInfo]
+    ) -> Optional[TypingRecord]:
+        """Returns typing annotation record for annotation tokens"""
+        if not tokens:
+            return None
+
+        return _typing(' '.join(token.string for token in tokens))
+
+    def _arguments(
+        self,
+        tokens: List[tokenize.TokenInfo]
+    ) -> List[ArgumentRecord]:
+        """
+        Returns records of positional or keyword arguments, the same
+        arguments ast.arguments.args contains
+
+        Args:
+            tokens: list[TokenInfo], tokens between function parentheses
+        """
+
+        arguments: List[ArgumentRecord] = []
+        for parameter in _split(tokens, ','):
+            if not parameter:
+                continue
+
+            first = parameter[0]
+            if first.string == '/':
+                # Arguments before slash are positional only
+                arguments = []
+                continue
+            elif first.string in ('*', '**'):
+                # Keyword only arguments and variadic arguments go next
+                break
+            elif first.type != tokenize.NAME:
+                raise ShallowParseError(f'Unexpected argument {first}')
+            elif any(token.string == 'lambda' for token in parameter):
+                # Commas of lambda arguments outside of brackets can't be
+                # told from arguments separators
+                raise ShallowParseError(f'Lambda in argument {first}')
+
+            annotation: List[tokenize.TokenInfo] = []
+            if len(parameter) > 1 and parameter[1].string == ':':
+                annotation = _split(parameter[2:], '=')[0]
+
+            arguments.append(
+                ArgumentRecord(
+                    name=first.string,
+                    type=self._typing(annotation),
+                    lineno=first.start[0],
+                    path=self.path
+                )
+            )
+
+        return arguments
+
+    def _function(
+        self,
+        tokens: List[tokenize.TokenInfo]
+    ) -> Tuple[FunctionRecord, List[tokenize.TokenInfo]]:
+        """
+        Returns function record for 'def' statement and tokens of the
+        statement body, if it's on the same line
+        """
+
+        name = tokens[1]
+        arguments_start = _skip_type_params(tokens)
+        if (
+            len(tokens) <= arguments_start
+            or tokens[arguments_start].string != '('
+        ):
+            raise ShallowParseError(f'Unsupported function header {name}')
+
+        arguments_end = _closing(tokens, arguments_start)
+        header_end = _header_end(tokens, arguments_end + 1)
+        returns: List[tokenize.TokenInfo] = []
+        if tokens[arguments_end + 1].string == '->':
+            returns = tokens[arguments_end + 2:header_end]
+
+        body = tokens[header_end + 1:]
+        return FunctionRecord(
+            name=name.string,
+            arguments=self._arguments(
+                tokens[arguments_start + 1:arguments_end]
+            ),
+            returns=self._typing(returns),
+            docstring=_docstring(body),
+            lineno=tokens[0].start[0],
+            path=self.path,
+            docstring_style=self.docstring_style
+        ), body
+
+    def _class(
+        self,
+        tokens: List[tokenize.TokenInfo]
+    ) -> Tuple[ClassRecord, List[tokenize.TokenInfo]]:
+        """
+        Returns class record for 'class' statement and tokens of the
+        statement body, if it's on the same line
+        """
+
+        name = tokens[1]
+        inherits = []
+        bases_start = _skip_type_params(tokens)
+        if len(tokens) <= bases_start:
+            raise ShallowParseError(f'Unsupported class header {name}')
+        elif tokens[bases_start].string == '(':
+            bases_end = _closing(tokens, bases_start)
+            header_end = _header_end(tokens, bases_end + 1)
+            for base in _split(tokens[bases_start + 1:bases_end], ','):
+                # Only plain names are bases, like ast.Name nodes
+                if (
+                    len(base) == 1
+                    and base[0].type == tokenize.NAME
+                    and not keyword.iskeyword(base[0].string)
+                ):
+                    inherits.append(base[0].string)
+        elif tokens[bases_start].string == ':':
+            header_end = bases_start
+        else:
+            raise ShallowParseError(f'Unsupported class header {name}')
+
+        body = tokens[header_end + 1:]
+        return ClassRecord(
+            name=name.string,
+            inherits=inherits,
+            methods=[],
+            docstring=_docstring(body),
+            lineno=tokens[0].start[0],
+            path=self.path,
+            docstring_style=self.docstring_style
+        ), body
+
+    def extract(self, source: bytes) -> ModuleRecord:
+        """
+        Extracts module records from source
+
+        Args:
+            source: bytes, Python module source
+
+        Returns:
+            ModuleRecord: module record
+
+        Raises:
+            ShallowParseError: if source contains unsupported code
+        """
+
+        module = ModuleRecord(
+            classes=[],
+            functions=[],
+            docstring=None,
+            path=self.path,
+            docstring_style=self.docstring_style
+        )
+
+        # Element waiting for the docstring and its body indentation level
+        pending: Optional[
+            Tuple[Union[ModuleRecord, ClassRecord, FunctionRecord], int]
+        ] = (module, 0)
+        current_class: Optional[ClassRecord] = None
+
+        for depth, line in _logical_lines(source):
+            if pending is not None:
+                element, body_depth = pending
+                pending = None
+                if depth == body_depth:
+                    element._raw_docstring = _docstring(line)
+
+            first = line[0]
+            if depth == 0:
+                current_class = None
+                if first.string == 'def':
+                    function, body = self._function(line)
+                    module.functions.append(function)
+                    pending = None if body else (function, 1)
+                elif first.string == 'class':
+                    class_def, body = self._class(line)
+                    module.classes.append(class_def)
+                    if not body:
+                        pending = (class_def, 1)
+                        current_class = class_def
+            elif (
+                depth == 1
+                and current_class is not None
+                and first.string == 'def'
+            ):
+                method, body = self._function(line)
+                current_class.methods.append(method)
+                pending = None if body else (method, 2)
+
+        return module
+
+
+def extract(
+    source: bytes,
+    path: str,
+    docstring_style: Optional[DocstringStyle] = None
+) -> ModuleRecord:
+    """
+    Extracts module records from source with tokenize, without building AST
+    for function bodies
+
+    Args:
+        source: bytes, Python module source
+        path: str, path to module
+        docstring_style: (DocstringStyle | None), style of module
+            docstrings, detected for every docstring if None
+
+    Returns:
+        ModuleRecord: module record
+
+    Raises:
+        ShallowParseError: if source contains unsupported code
+    """
+
+    return ShallowExtractor(path, docstring_style).extract(source)
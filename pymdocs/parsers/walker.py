@@ -0,0 +1,266 @@
+import fnmatch
+import os
+from typing import Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+# Directories never containing documented sources, but often heavy
+DEFAULT_EXCLUDE: Tuple[str, ...] = (
+    '.git',
+    '.hg',
+    '.svn',
+    '.tox',
+    '.nox',
+    '.venv',
+    'venv',
+    '.mypy_cache',
+    '.pytest_cache',
+    '__pycache__',
+    'build',
+    'dist',
+    'node_modules',
+    '*.egg-info'
+)
+
+DEFAULT_MAX_DEPTH = 64
+
+
+class SourceFile:
+    """
+    Python module file found by walker
+
+    Attributes:
+        path: str, path to module
+        size: int, file size in bytes
+        mtime_ns: int, file modification time in nanoseconds
+    """
+
+    __slots__ = ('path', 'size', 'mtime_ns')
+
+    def __init__(self, path: str, size: int, mtime_ns: int):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+
+class SourcePackage:
+    """
+    Python package files layout found by walker
+
+    Attributes:
+        path: str, path to package directory
+        modules: list[SourceFile], package modules
+        packages: list[SourcePackage], inner packages
+    """
+
+    __slots__ = ('path', 'modules', 'packages')
+
+    def __init__(
+        self,
+        path: str,
+        modules: List[SourceFile],
+        packages: 'List[SourcePackage]'
+    ):
+        self.path = path
+        self.modules = modules
+        self.packages = packages
+
+    def iter_modules(self) -> Iterator[SourceFile]:
+        """
+        Iterates through all package modules recursively
+
+        Yields:
+            SourceFile: python module file
+        """
+        yield from self.modules
+        for package in self.packages:
+            yield from package.iter_modules()
+
+
+def read_ignore_file(path: str) -> List[str]:
+    """
+    Reads exclude patterns from ignore file, one pattern per line,
+    empty lines and lines starting with '#' are skipped
+
+    Args:
+        path: str, path to ignore file
+
+    Returns:
+        list[str]: exclude patterns
+    """
+
+    with open(path) as f:
+        return [
+            line.strip()
+            for line in f
+            if line.strip() and not line.lstrip().startswith('#')
+        ]
+
+
+class SourceWalker:
+    """
+    Walks through Python sources with os.scandir, skipping excluded paths
+
+    Patterns are matched with fnmatch against entry name and its path
+    relative to walked root, patterns ending with '/' match directories
+    only. Every directory is walked once, even if it's reachable by several
+    symlinks.
+
+    Attributes:
+        exclude: list[str], exclude patterns, including defaults
+        max_depth: int, maximum depth of directories to walk into
+
+    Examples:
+        Walking package
+
+        >> tree = SourceWalker(exclude=['tests/']).walk('./pymdocs')
+        >> [module.path for module in tree.iter_modules()]
+        ['./pymdocs/__init__.py', './pymdocs/__main__.py', ...]
+    """
+
+    def __init__(
+        self,
+        exclude: Sequence[str] = (),
+        ignore_file: Optional[str] = None,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        default_exclude: Sequence[str] = DEFAULT_EXCLUDE
+    ):
+        self.exclude = [
+            pattern + '/'
+            for pattern in default_exclude
+        ] + list(exclude)
+
+        if ignore_file is not None:
+            self.exclude += read_ignore_file(ignore_file)
+
+        self.max_depth = max_depth
+
+    def _is_excluded(self, name: str, relpath: str, is_dir: bool) -> bool:
+        """Checks if entry matches any exclude pattern"""
+        for pattern in self.exclude:
+            if pattern.endswith('/'):
+                if not is_dir:
+                    continue
+
+                pattern = pattern.rstrip('/')
+
+            if (
+                fnmatch.fnmatchcase(name, pattern)
+                or fnmatch.fnmatchcase(relpath, pattern)
+            ):
+                return True
+
+        return False
+
+    def walk(self, path: str) -> Optional[Union[SourceFile, SourcePackage]]:
+        """
+        Collects Python modules layout without parsing them
+
+        Args:
+            path: str, path to Python module or package
+
+        Returns:
+            (SourceFile | SourcePackage | None): module, package layout or
+                None if there are no python modules
+        """
+
+        if os.path.isfile(path):
+            if not path.endswith('.py'):
+                return None
+
+            stat = os.stat(path)
+            return SourceFile(path, stat.st_size, stat.st_mtime_ns)
+        elif os.path.isdir(path):
+            stat = os.stat(path)
+            return self._walk_dir(
+                path,
+                '',
+                0,
+                {(stat.st_dev, stat.st_ino)}
+            )
+
+        return None
+
+    def _walk_dir(
+        self,
+        path: str,
+        relpath: str,
+        depth: int,
+        visited: Set[Tuple[int, int]]
+    ) -> Optional[SourcePackage]:
+        """
+        Collects directory modules layout recursively
+
+        Args:
+            path: str, path to directory
+            relpath: str, path to directory relative to walked root
+            depth: int, directory depth relative to walked root
+            visited: set[tuple[int, int]], (device, inode) of walked
+                directories
+
+        Returns:
+            (SourcePackage | None): package layout or None if there are
+                no python modules
+        """
+
+        try:
+            with os.scandir(path) as entries_iterator:
+                entries = sorted(entries_iterator, key=lambda e: e.name)
+        except OSError:
+            return None
+
+        modules = []
+        packages = []
+
+        for entry in entries:
+            entry_relpath = (
+                f'{relpath}/{entry.name}'
+                if relpath
+                else entry.name
+            )
+
+            try:
+                is_dir = entry.is_dir()
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+
+            if self._is_excluded(entry.name, entry_relpath, is_dir):
+                continue
+
+            if is_file and entry.name.endswith('.py'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                modules.append(
+                    SourceFile(entry.path, stat.st_size, stat.st_mtime_ns)
+                )
+            elif is_dir and depth < self.max_depth:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                # Symlink loops and trees linked twice are walked only once
+                key = (stat.st_dev, stat.st_ino)
+                if key in visited:
+                    continue
+
+                visited.add(key)
+                package = self._walk_dir(
+                    entry.path,
+                    entry_relpath,
+                    depth + 1,
+                    visited
+                )
+                if package is not None:
+                    packages.append(package)
+
+        if modules or packages:
+            return SourcePackage(
+                path=path,
+                modules=modules,
+                packages=packages
+            )
+
+        return None
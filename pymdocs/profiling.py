@@ -0,0 +1,747 @@
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+from itertools import count
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pymdocs.parsers.ast as ast_parser
+import pymdocs.parsers.docstring as doc
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.formatters.markdown_constructor import (
+    MarkdownContainer,
+    MarkdownElement
+)
+from pymdocs.formatters.module_formatter import ModuleFormatter
+from pymdocs.output import _ComparingWriter
+from pymdocs.parsers.walker import SourceWalker
+
+# Phases in order of documentation pipeline
+PHASES = (
+    'walk',
+    'read',
+    'ast.parse',
+    'extract',
+    'docstring parse',
+    'workers',
+    'format',
+    'render',
+    'write'
+)
+
+# Default number of the slowest modules and docstrings in report
+DEFAULT_TOP = 20
+
+# Number of docstring characters kept in report
+_SUMMARY_SIZE = 60
+
+# Marker of attributes inherited by patched class
+_INHERITED = object()
+
+# Modules calling parse_modules imported by name
+_PARSE_MODULES_IMPORTERS = ('pymdocs.parsers.ast', 'pymdocs.incremental')
+
+
+class _Instrument(ABC):
+    """
+    Base class of profilers, pymdocs functions are wrapped only while
+    profiler is installed, so nothing is measured and nothing is slowed down
+    otherwise
+    """
+
+    def __init__(self) -> None:
+        self._patched: List[Tuple[Any, str, Any]] = []
+
+    def _patch(self, owner: Any, name: str, wrapper: Callable) -> None:
+        """Replaces class or module attribute by wrapped one"""
+        original = (
+            owner.__dict__.get(name, _INHERITED)
+            if isinstance(owner, type)
+            else getattr(owner, name)
+        )
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrapper(getattr(owner, name)))
+
+    def _patch_imported(
+        self,
+        module_names: Tuple[str, ...],
+        name: str,
+        wrapper: Callable
+    ) -> None:
+        """Replaces function in loaded modules which imported it"""
+        for module_name in module_names:
+            module = sys.modules.get(module_name)
+            if module is not None:
+                self._patch(module, name, wrapper)
+
+    def _restore(self) -> None:
+        """Restores wrapped functions"""
+        while self._patched:
+            owner, name, original = self._patched.pop()
+            if original is _INHERITED:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+
+    @abstractmethod
+    def install(self) -> None:
+        """Starts measuring, wraps measured functions"""
+
+    @abstractmethod
+    def uninstall(self) -> None:
+        """Stops measuring, restores measured functions"""
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.uninstall()
+
+
+class Profiler(_Instrument):
+    """
+    Measures wall and CPU time of documentation phases, modules and
+    docstrings
+
+    Phases account their own time: time of nested phase, e.g. docstring parse
+    during format, is excluded from the outer one. CPU time is the time of
+    measuring thread, phases running in several threads could sum up to more
+    than total wall time. Modules parsed by worker processes are measured
+    as a whole by "workers" phase.
+
+    Markdown of every module is rendered once more to measure its render
+    time and size, this time is excluded from phases.
+
+    Attributes:
+        top: int, number of the slowest modules and docstrings in report
+        phases: dict[str, list[float]], wall time, CPU time and number of
+            calls by phase name
+        excluded: list[float], wall and CPU time excluded from phases
+        modules: dict[str, dict[str, Any]], timings and output size by
+            module path
+        docstrings: list[tuple], heap of the slowest docstrings
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP):
+        super().__init__()
+        self.top = top
+        self.phases: Dict[str, List[float]] = {
+            phase: [0.0, 0.0, 0]
+            for phase in PHASES
+        }
+        self.excluded = [0.0, 0.0]
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.docstrings: List[Tuple[float, int, Dict[str, Any]]] = []
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counter = count()
+        self._start: Optional[Tuple[float, float]] = None
+        self._total = (0.0, 0.0)
+
+    def _enter(self, phase: Optional[str]) -> None:
+        """Starts phase in the current thread, None excludes time"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        stack.append([phase, time.perf_counter(), time.thread_time(), 0., 0.])
+
+    def _exit(self) -> float:
+        """
+        Finishes the last started phase of the current thread
+
+        Returns:
+            float: wall time of phase including nested phases
+        """
+
+        wall_end = time.perf_counter()
+        cpu_end = time.thread_time()
+
+        stack = self._local.stack
+        phase, wall_start, cpu_start, nested_wall, nested_cpu = stack.pop()
+        wall = wall_end - wall_start
+        cpu = cpu_end - cpu_start
+        if stack:
+            stack[-1][3] += wall
+            stack[-1][4] += cpu
+
+        with self._lock:
+            if phase is None:
+                self.excluded[0] += wall
+                self.excluded[1] += cpu
+            else:
+                totals = self.phases[phase]
+                totals[0] += wall - nested_wall
+                totals[1] += cpu - nested_cpu
+                totals[2] += 1
+
+        return wall
+
+    def _module(self, path: str) -> Dict[str, Any]:
+        """Returns module timings record, must be called under lock"""
+        record = self.modules.get(path)
+        if record is None:
+            record = self.modules[path] = {
+                'name': None,
+                'path': path,
+                'parse': 0.0,
+                'format': 0.0,
+                'render': 0.0,
+                'bytes': 0
+            }
+
+        return record
+
+    def _measure(self, phase: str, function: Callable) -> Callable:
+        """Returns function measured as phase"""
+        def measured(*args, **kwargs):
+            self._enter(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._exit()
+
+        return measured
+
+    def _measure_parse_module(self, function: Callable) -> Callable:
+        """Returns parse_module measuring module parse time"""
+        def parse_module(path, *args, **kwargs):
+            self._local.module = path
+            self._enter('extract')
+            try:
+                return function(path, *args, **kwargs)
+            finally:
+                seconds = self._exit()
+                self._local.module = None
+                with self._lock:
+                    self._module(path)['parse'] += seconds
+
+        return parse_module
+
+    def _measure_docstring_parse(self, function: Callable) -> Callable:
+        """Returns docstring parse keeping the slowest docstrings"""
+        def parse(docstring, *args, **kwargs):
+            self._enter('docstring parse')
+            try:
+                return function(docstring, *args, **kwargs)
+            finally:
+                seconds = self._exit()
+                item = (
+                    seconds,
+                    next(self._counter),
+                    {
+                        'module': getattr(self._local, 'module', None),
+                        'summary': docstring.strip()[:_SUMMARY_SIZE],
+                        'chars': len(docstring),
+                        'seconds': seconds
+                    }
+                )
+                with self._lock:
+                    if len(self.docstrings) < self.top:
+                        heapq.heappush(self.docstrings, item)
+                    elif self.docstrings and item > self.docstrings[0]:
+                        heapq.heapreplace(self.docstrings, item)
+
+        return parse
+
+    def _measure_module_format(self, function: Callable) -> Callable:
+        """
+        Returns ModuleFormatter.format measuring module format time, render
+        time and Markdown size
+        """
+        def format(formatter, module_def, doc_path='', package_name=None):
+            name = (
+                f'{package_name}.{module_def.name}'
+                if package_name
+                else module_def.name
+            )
+            self._local.module = name
+            self._enter('format')
+            try:
+                element = function(
+                    formatter,
+                    module_def,
+                    doc_path,
+                    package_name
+                )
+            finally:
+                format_seconds = self._exit()
+                self._local.module = None
+
+            self._enter(None)
+            try:
+                start = time.perf_counter()
+                size = len(''.join(element.iter_render()).encode())
+                render_seconds = time.perf_counter() - start
+            finally:
+                self._exit()
+
+            with self._lock:
+                record = self._module(module_def.path)
+                record['name'] = name
+                record['format'] += format_seconds
+                record['render'] += render_seconds
+                record['bytes'] = size
+
+            return element
+
+        return format
+
+    def install(self) -> None:
+        """Starts measuring, wraps measured functions"""
+        measure = self._measure
+
+        self._patch(SourceWalker, 'walk', lambda f: measure('walk', f))
+        self._patch(
+            ast_parser,
+            '_read_source',
+            lambda f: measure('read', f)
+        )
+        self._patch(
+            ast_parser,
+            '_parse_source',
+            lambda f: measure('ast.parse', f)
+        )
+        self._patch(ast_parser, 'parse_module', self._measure_parse_module)
+        self._patch(doc, 'parse', self._measure_docstring_parse)
+
+        self._patch_imported(
+            _PARSE_MODULES_IMPORTERS,
+            'parse_modules',
+            lambda f: measure('workers', f)
+        )
+
+        self._patch(Formatter, 'format', lambda f: measure('format', f))
+        self._patch(ModuleFormatter, 'format', self._measure_module_format)
+        self._patch(
+            MarkdownContainer,
+            'render',
+            lambda f: measure('render', f)
+        )
+        self._patch(
+            MarkdownElement,
+            'render_to',
+            lambda f: measure('render', f)
+        )
+        self._patch(_ComparingWriter, 'write', lambda f: measure('write', f))
+        self._patch(_ComparingWriter, 'close', lambda f: measure('write', f))
+
+        self._start = (time.perf_counter(), time.process_time())
+
+    def uninstall(self) -> None:
+        """Stops measuring, restores measured functions"""
+        if self._start is not None:
+            wall_start, cpu_start = self._start
+            self._total = (
+                time.perf_counter() - wall_start,
+                time.process_time() - cpu_start
+            )
+            self._start = None
+
+        self._restore()
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns profile report
+
+        Returns:
+            dict[str, Any]: total, phases, modules times in seconds, the
+                slowest modules and docstrings
+        """
+
+        wall, cpu = self._total
+        modules = sorted(
+            self.modules.values(),
+            key=lambda module: module['path']
+        )
+        slowest = sorted(
+            modules,
+            key=lambda module: (
+                module['parse']
+                + module['format']
+                + module['render']
+            ),
+            reverse=True
+        )
+
+        return {
+            'wall': wall,
+            'cpu': cpu,
+            'phases': {
+                phase: {
+                    'wall': totals[0],
+                    'cpu': totals[1],
+                    'calls': totals[2]
+                }
+                for phase, totals in self.phases.items()
+            },
+            'excluded': {'wall': self.excluded[0], 'cpu': self.excluded[1]},
+            'modules': modules,
+            'slowest_modules': slowest[:self.top],
+            'slowest_docstrings': [
+                item[2]
+                for item in sorted(self.docstrings, reverse=True)
+            ]
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Writes profile report to JSON file
+
+        Args:
+            path: str, path to report file
+        """
+
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+# Pipeline stages of memory report
+MEMORY_STAGES = ('parse', 'format', 'render', 'write')
+
+# Modules calling parse imported by name
+_PARSE_IMPORTERS = ('pymdocs.parsers.ast', 'pymdocs.cli')
+
+
+def _max_rss() -> Optional[int]:
+    """Returns peak resident set size of process in bytes if known"""
+    try:
+        # Resource usage is available on Unix only
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class MemoryProfiler(_Instrument):
+    """
+    Measures memory of documentation stages with tracemalloc: parse, which
+    includes walking sources, format into Markdown elements tree, render and
+    write
+
+    Stages account their own memory: memory allocated by nested stage, e.g.
+    writing while document is streamed, is excluded from the outer one.
+    Peak is the most traced memory while stage runs, retained is memory
+    stage allocated and left allocated when it finished. tracemalloc traces
+    the whole process, so stages are run by one thread at a time and modules
+    written in parallel are measured one by one: threads of split output run
+    serialized while memory is measured, and the report schedule differs
+    from real runs. Report tells it with "serialized" flag and the number of
+    times a thread waited for another one's stage. Peaks are process peaks
+    since the start on Python 3.8, which can't reset them.
+
+    Memory of every module is traced too: definition is memory retained by
+    parsing module, markdown is memory retained by formatting it. Docstrings
+    are parsed while formatting unless definitions are compact, so they are
+    counted as markdown then. Modules parsed by worker processes have no
+    definition size.
+
+    Allocation sites are taken at the end of stage which left the most
+    memory allocated, usually when definitions and Markdown tree are both
+    kept.
+
+    Attributes:
+        top: int, number of allocation sites and the largest modules in
+            report
+        traced_peak: int, the most traced memory while profiler was
+            installed
+        tracing_overhead: int, memory used by tracemalloc itself
+        waits: int, number of times a thread waited for the stage of another
+            thread
+        stages: dict[str, list[int]], peak, retained memory and number of
+            calls by stage name
+        modules: dict[str, dict[str, Any]], memory by module path
+    """
+
+    def __init__(self, top: int = DEFAULT_TOP):
+        super().__init__()
+        self.top = top
+        self.stages: Dict[str, List[int]] = {
+            stage: [0, 0, 0]
+            for stage in MEMORY_STAGES
+        }
+        self.modules: Dict[str, Dict[str, Any]] = {}
+
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._snapshot: Optional[Any] = None
+        self._snapshot_stage: Optional[str] = None
+        self._snapshot_size = -1
+        self._started_tracing = False
+        self._pid = os.getpid()
+        self.traced_peak = 0
+        self.tracing_overhead = 0
+        self.waits = 0
+        self._reset_peak: Optional[Callable[[], None]] = getattr(
+            tracemalloc,
+            'reset_peak',
+            None
+        )
+
+    def _forked(self) -> bool:
+        """
+        Returns True in worker process forked while tracing, measured
+        functions aren't measured there and tracing is stopped
+        """
+        if os.getpid() == self._pid:
+            return False
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+        return True
+
+    def _enter(self, stage: str) -> None:
+        """Starts stage in the current thread"""
+        if not self._lock.acquire(blocking=False):
+            self._lock.acquire()
+            self.waits += 1
+
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            stack[-1][2] = max(stack[-1][2], peak)
+
+        if self._reset_peak is not None:
+            self._reset_peak()
+
+        stack.append([stage, current, current, 0])
+
+    def _exit(self) -> int:
+        """
+        Finishes the last started stage of the current thread
+
+        Returns:
+            int: memory retained by stage including nested stages
+        """
+
+        try:
+            current, peak = tracemalloc.get_traced_memory()
+            stack = self._local.stack
+            stage, start, stage_peak, nested = stack.pop()
+            retained = current - start
+
+            totals = self.stages[stage]
+            totals[0] = max(totals[0], stage_peak, peak)
+            totals[1] += retained - nested
+            totals[2] += 1
+
+            if stack:
+                stack[-1][3] += retained
+                if self._reset_peak is not None:
+                    self._reset_peak()
+            elif current > self._snapshot_size:
+                self._snapshot = tracemalloc.take_snapshot()
+                self._snapshot_stage = stage
+                self._snapshot_size = current
+
+            return retained
+        finally:
+            self._lock.release()
+
+    def _module(self, path: str) -> Dict[str, Any]:
+        """Returns module memory record, must be called under lock"""
+        record = self.modules.get(path)
+        if record is None:
+            record = self.modules[path] = {
+                'name': None,
+                'path': path,
+                'definition': None,
+                'markdown': 0
+            }
+
+        return record
+
+    def _measure(self, stage: str, function: Callable) -> Callable:
+        """Returns function measured as stage"""
+        def measured(*args, **kwargs):
+            if self._forked():
+                return function(*args, **kwargs)
+
+            self._enter(stage)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._exit()
+
+        return measured
+
+    def _measure_parse_module(self, function: Callable) -> Callable:
+        """Returns parse_module measuring module definition memory"""
+        def parse_module(path, *args, **kwargs):
+            if self._forked():
+                return function(path, *args, **kwargs)
+
+            self._enter('parse')
+            try:
+                return function(path, *args, **kwargs)
+            finally:
+                retained = self._exit()
+                with self._lock:
+                    self._module(path)['definition'] = retained
+
+        return parse_module
+
+    def _measure_module_format(self, function: Callable) -> Callable:
+        """Returns ModuleFormatter.format measuring module markdown memory"""
+        def format(formatter, module_def, doc_path='', package_name=None):
+            if self._forked():
+                return function(formatter, module_def, doc_path, package_name)
+
+            self._enter('format')
+            try:
+                return function(formatter, module_def, doc_path, package_name)
+            finally:
+                retained = self._exit()
+                with self._lock:
+                    record = self._module(module_def.path)
+                    record['name'] = (
+                        f'{package_name}.{module_def.name}'
+                        if package_name
+                        else module_def.name
+                    )
+                    record['markdown'] = retained
+
+        return format
+
+    def install(self) -> None:
+        """Starts tracing memory, wraps measured functions"""
+        measure = self._measure
+
+        self._patch_imported(
+            _PARSE_IMPORTERS,
+            'parse',
+            lambda f: measure('parse', f)
+        )
+        self._patch(SourceWalker, 'walk', lambda f: measure('parse', f))
+        self._patch_imported(
+            _PARSE_MODULES_IMPORTERS,
+            'parse_modules',
+            lambda f: measure('parse', f)
+        )
+        self._patch(ast_parser, 'parse_module', self._measure_parse_module)
+        self._patch(Formatter, 'format', lambda f: measure('format', f))
+        self._patch(ModuleFormatter, 'format', self._measure_module_format)
+        self._patch(
+            MarkdownContainer,
+            'render',
+            lambda f: measure('render', f)
+        )
+        self._patch(
+            MarkdownElement,
+            'render_to',
+            lambda f: measure('render', f)
+        )
+        self._patch(_ComparingWriter, 'write', lambda f: measure('write', f))
+        self._patch(_ComparingWriter, 'close', lambda f: measure('write', f))
+
+        self._pid = os.getpid()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def uninstall(self) -> None:
+        """Stops tracing memory, restores measured functions"""
+        self._restore()
+        # Peak is reset by every stage, so the highest stage peak is kept
+        self.traced_peak = max(
+            tracemalloc.get_traced_memory()[1],
+            *(totals[0] for totals in self.stages.values())
+        )
+        self.tracing_overhead = tracemalloc.get_tracemalloc_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Returns memory report
+
+        Returns:
+            dict[str, Any]: memory of stages and modules in bytes, the
+                largest modules and the top allocation sites
+        """
+
+        modules = sorted(
+            self.modules.values(),
+            key=lambda module: module['path']
+        )
+        definitions = [
+            module['definition']
+            for module in modules
+            if module['definition'] is not None
+        ]
+        markdown = [module['markdown'] for module in modules]
+
+        sites = []
+        if self._snapshot is not None:
+            for stat in self._snapshot.statistics('lineno')[:self.top]:
+                frame = stat.traceback[0]
+                sites.append({
+                    'site': f'{frame.filename}:{frame.lineno}',
+                    'size': stat.size,
+                    'count': stat.count
+                })
+
+        return {
+            'max_rss': _max_rss(),
+            'traced_peak': self.traced_peak,
+            'tracing_overhead': self.tracing_overhead,
+            # Stages of different threads were measured one at a time
+            'serialized': True,
+            'waits': self.waits,
+            'stages': {
+                stage: {
+                    'peak': totals[0],
+                    'retained': totals[1],
+                    'calls': totals[2]
+                }
+                for stage, totals in self.stages.items()
+            },
+            'per_module': {
+                'definition': (
+                    sum(definitions) // len(definitions)
+                    if definitions
+                    else None
+                ),
+                'markdown': (
+                    sum(markdown) // len(markdown)
+                    if markdown
+                    else None
+                )
+            },
+            'modules': modules,
+            'largest_modules': sorted(
+                modules,
+                key=lambda module: (
+                    (module['definition'] or 0)
+                    + module['markdown']
+                ),
+                reverse=True
+            )[:self.top],
+            'sites_stage': self._snapshot_stage,
+            'sites': sites
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Writes memory report to JSON file
+
+        Args:
+            path: str, path to report file
+        """
+
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
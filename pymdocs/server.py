@@ -0,0 +1,591 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+import pymdocs.formatters.markdown_constructor as md
+import pymdocs.parsers.docstring as doc
+from pymdocs.cli import DOCSTRING_STYLE_MODES, docstring_options
+from pymdocs.formatters.base import FormatterType
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.formatters.module_formatter import ModuleFormatter
+from pymdocs.formatters.package_formatter import PackageFormatter
+from pymdocs.incremental import iter_documented_modules
+from pymdocs.parsers.ast import (
+    AnyModuleDefinition,
+    parse_module,
+    resolve_docstring_style
+)
+from pymdocs.parsers.docstring import DEFAULT_SAMPLE_SIZE, DocstringStyle
+from pymdocs.parsers.walker import (
+    DEFAULT_EXCLUDE,
+    SourceFile,
+    SourcePackage,
+    SourceWalker
+)
+
+# Path of cache statistics endpoint
+STATS_PATH = '/_stats'
+
+MARKDOWN_CONTENT_TYPE = 'text/markdown; charset=utf-8'
+
+
+class _Layout:
+    """
+    Documented modules and packages of sources at walk time
+
+    Attributes:
+        tree: (SourceFile | SourcePackage), sources layout
+        modules: dict[str, tuple[(str | None), SourceFile]], package name
+            and module file by qualified module name, in documentation
+            order
+        packages: dict[str, list[str]], qualified names of package
+            modules by qualified package name, inner packages included
+        paths: set[str], paths of documented modules
+        walked: float, monotonic time of walk
+    """
+
+    def __init__(self, tree: Union[SourceFile, SourcePackage]):
+        self.tree = tree
+        self.modules: Dict[str, Tuple[Optional[str], SourceFile]] = {}
+        self.packages: Dict[str, List[str]] = {}
+        for package_name, module_file in iter_documented_modules(tree):
+            name = os.path.basename(module_file.path).replace('.py', '')
+            if package_name is not None:
+                name = f'{package_name}.{name}'
+                parts = package_name.split('.')
+                for i in range(1, len(parts) + 1):
+                    self.packages.setdefault(
+                        '.'.join(parts[:i]),
+                        []
+                    ).append(name)
+
+            self.modules[name] = (package_name, module_file)
+
+        self.paths = {
+            module_file.path
+            for _, module_file in self.modules.values()
+        }
+        self.walked = time.monotonic()
+
+
+class _Entry:
+    """
+    Cached module documentation
+
+    Attributes:
+        stat: tuple[int, int], module file modification time and size the
+            entry was built for
+        definition: (ModuleDefinition | ModuleRecord), module definition
+        fragment: str, module Markdown
+    """
+
+    __slots__ = ('stat', 'definition', 'fragment')
+
+    def __init__(
+        self,
+        stat: Tuple[int, int],
+        definition: AnyModuleDefinition,
+        fragment: str
+    ):
+        self.stat = stat
+        self.definition = definition
+        self.fragment = fragment
+
+
+class DocumentationCache:
+    """
+    Renders documentation of modules and packages on demand, keeping module
+    definitions and Markdown in memory until module file changes
+
+    Module file modification time and size are checked on every request,
+    so changed modules are parsed and formatted again, other modules are
+    served from memory. Sources are walked again when layout is older than
+    layout_ttl. Cache could be used by many threads: every module is
+    rendered by one thread at a time, other threads requesting it wait for
+    the result.
+
+    Attributes:
+        source_path: str, path to Python source code
+        formatter: Formatter, markdown formatter
+        walker: SourceWalker, walker collecting package modules
+        compact: bool, extract compact records and release modules AST
+        shallow: bool, extract compact records from tokens without building
+            AST of function bodies
+        docstring_style: (DocstringStyle | None), style of docstrings,
+            sampled once on the first walk if docstring_sample is set
+        docstring_sample: int, number of the first docstrings with sections
+            sampled to pick the style if it isn't pinned
+        layout_ttl: float, seconds sources layout is reused without walking
+        doc_path: str, path of virtual documentation file next to sources,
+            source links are relative to it
+        stats: dict[str, float], cache counters
+    """
+
+    def __init__(
+        self,
+        source_path: str,
+        formatter: Optional[Formatter] = None,
+        walker: Optional[SourceWalker] = None,
+        compact: bool = False,
+        shallow: bool = False,
+        docstring_style: Optional[DocstringStyle] = None,
+        docstring_sample: int = 0,
+        layout_ttl: float = 1.0
+    ):
+        self.source_path = source_path
+        self.formatter = formatter or Formatter()
+        self.walker = walker or SourceWalker()
+        self.compact = compact
+        self.shallow = shallow
+        self.docstring_style = docstring_style
+        self.docstring_sample = docstring_sample
+        self.layout_ttl = layout_ttl
+        self.doc_path = os.path.join(
+            os.path.dirname(os.path.abspath(source_path)),
+            'index.md'
+        )
+        self.stats: Dict[str, float] = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'walks': 0,
+            'render_seconds': 0.0
+        }
+
+        self._lock = threading.Lock()
+        self._walk_lock = threading.Lock()
+        self._layout: Optional[_Layout] = None
+        self._entries: Dict[str, _Entry] = {}
+        self._module_locks: Dict[str, threading.Lock] = {}
+
+    def layout(self) -> _Layout:
+        """
+        Returns sources layout, walks sources if it's outdated
+
+        Sources are walked by one thread at a time without holding the cache
+        lock, other threads get the outdated layout meanwhile, so requests
+        for rendered modules don't wait for the walk. Only the first walk is
+        waited for, as there is no layout yet.
+
+        Raises:
+            ValueError: if source path is not a Python module or package
+        """
+
+        with self._lock:
+            layout = self._layout
+
+        if layout is not None:
+            if not self._outdated(layout):
+                return layout
+            elif not self._walk_lock.acquire(blocking=False):
+                return layout
+        else:
+            self._walk_lock.acquire()
+
+        try:
+            # Layout could be walked while waiting for the lock
+            with self._lock:
+                current = self._layout
+
+            if current is not None and not self._outdated(current):
+                return current
+
+            tree = self.walker.walk(self.source_path)
+            if tree is None:
+                raise ValueError(
+                    f'{self.source_path} is not a python package or module'
+                )
+
+            if current is None:
+                self.docstring_style = resolve_docstring_style(
+                    tree,
+                    self.docstring_style,
+                    self.docstring_sample,
+                    self.shallow
+                )
+
+            layout = _Layout(tree)
+            with self._lock:
+                self._layout = layout
+                self.stats['walks'] += 1
+
+                # Removed modules are dropped from cache
+                for path in set(self._entries) - layout.paths:
+                    del self._entries[path]
+                    self._module_locks.pop(path, None)
+
+            return layout
+        finally:
+            self._walk_lock.release()
+
+    def _outdated(self, layout: _Layout) -> bool:
+        """Checks if layout is walked more than layout_ttl seconds ago"""
+        return time.monotonic() - layout.walked >= self.layout_ttl
+
+    def module(self, name: str) -> Optional[str]:
+        """
+        Returns module Markdown, module is parsed and formatted if it isn't
+        cached or its file has changed
+
+        Args:
+            name: str, qualified module name
+
+        Returns:
+            (str | None): module Markdown, None if module isn't documented
+        """
+
+        module = self.layout().modules.get(name)
+        if module is None:
+            return None
+
+        package_name, module_file = module
+        path = module_file.path
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stat == key:
+                self.stats['hits'] += 1
+                return entry.fragment
+
+            module_lock = self._module_locks.setdefault(
+                path,
+                threading.Lock()
+            )
+
+        with module_lock:
+            # Module could be rendered while waiting for the lock
+            with self._lock:
+                entry = self._entries.get(path)
+                if entry is not None and entry.stat == key:
+                    self.stats['hits'] += 1
+                    return entry.fragment
+
+            start = time.perf_counter()
+            definition = parse_module(
+                path,
+                compact=self.compact,
+                shallow=self.shallow,
+                docstring_style=self.docstring_style
+            )
+            module_formatter: ModuleFormatter = (
+                self.formatter.formatters[FormatterType.MODULE]
+            )
+            fragment = module_formatter.format(
+                definition,
+                self.doc_path,
+                package_name
+            ).render()
+
+            with self._lock:
+                self.stats['misses'] += 1
+                if entry is not None:
+                    self.stats['invalidations'] += 1
+
+                self.stats['render_seconds'] += time.perf_counter() - start
+                self._entries[path] = _Entry(key, definition, fragment)
+
+        return fragment
+
+    def package(self, name: str) -> Optional[str]:
+        """
+        Returns documentation of package modules, inner packages included,
+        only changed modules are rendered again
+
+        Args:
+            name: str, qualified package name
+
+        Returns:
+            (str | None): package Markdown, None if package has no
+                documented modules
+        """
+
+        module_names = self.layout().packages.get(name)
+        if module_names is None:
+            return None
+
+        module_formatter: ModuleFormatter = (
+            self.formatter.formatters[FormatterType.MODULE]
+        )
+        package_formatter: PackageFormatter = (
+            self.formatter.formatters[FormatterType.PACKAGE]
+        )
+
+        modules_md: List[Tuple[md.MarkdownElement, md.Link]] = []
+        for module_name in module_names:
+            fragment = self.module(module_name)
+            if fragment is not None:
+                modules_md.append((
+                    md.StringLiteral(fragment),
+                    module_formatter.module_link(module_name)
+                ))
+
+        return package_formatter.format_document(name, modules_md).render()
+
+    def index(self) -> str:
+        """
+        Returns index page with links to packages and modules pages, nothing
+        is rendered
+
+        Returns:
+            str: index Markdown
+        """
+
+        layout = self.layout()
+        module_formatter: ModuleFormatter = (
+            self.formatter.formatters[FormatterType.MODULE]
+        )
+        package_formatter: PackageFormatter = (
+            self.formatter.formatters[FormatterType.PACKAGE]
+        )
+
+        root_name = os.path.basename(layout.tree.path).replace('.py', '')
+        return package_formatter.format_contents(
+            root_name,
+            [
+                module_formatter.module_file_link(name, f'{name}.md')
+                for name in [*layout.packages, *layout.modules]
+            ]
+        ).render()
+
+    def source(self, relpath: str) -> Optional[bytes]:
+        """
+        Returns source code of documented module, source links of
+        documentation point to them
+
+        Args:
+            relpath: str, module path relative to documentation path
+
+        Returns:
+            (bytes | None): module source, None if it isn't documented
+                module
+        """
+
+        path = os.path.normpath(
+            os.path.join(os.path.dirname(self.doc_path), relpath)
+        )
+        if path not in {
+            os.path.abspath(module_path)
+            for module_path in self.layout().paths
+        }:
+            return None
+
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Returns cache counters
+
+        Returns:
+            dict[str, Any]: numbers of cached modules, cache hits, misses,
+                invalidations by changed files and walks, total render
+                time and parsed docstrings cache counters
+        """
+
+        with self._lock:
+            info: Dict[str, Any] = {
+                'modules': len(self._entries),
+                **self.stats
+            }
+
+        info['docstrings'] = doc.cache_info()
+        return info
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves documentation pages of server documentation cache"""
+
+    server: '_Server'
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = unquote(urlsplit(self.path).path)
+        docs = self.server.docs
+
+        try:
+            if path == STATS_PATH:
+                self._send(
+                    json.dumps(docs.cache_info(), indent=2).encode(),
+                    'application/json'
+                )
+                return
+            elif path in ('/', '/index.md'):
+                self._send(docs.index().encode(), MARKDOWN_CONTENT_TYPE)
+                return
+            elif path.endswith('.md'):
+                name = path[1:-len('.md')]
+                text = docs.module(name)
+                if text is None:
+                    text = docs.package(name)
+
+                if text is not None:
+                    self._send(text.encode(), MARKDOWN_CONTENT_TYPE)
+                    return
+            elif path.endswith('.py'):
+                source = docs.source(path[1:])
+                if source is not None:
+                    self._send(source, 'text/plain; charset=utf-8')
+                    return
+        except (OSError, SyntaxError, ValueError) as e:
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            return
+
+        self.send_error(HTTPStatus.NOT_FOUND)
+
+    def _send(self, body: bytes, content_type: str) -> None:
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    """HTTP server, every request is handled by its own thread"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        docs: DocumentationCache
+    ):
+        self.docs = docs
+        super().__init__(address, _Handler)
+
+
+def serve(
+    docs: DocumentationCache,
+    host: str = '127.0.0.1',
+    port: int = 8000
+) -> None:
+    """
+    Serves documentation until interrupted
+
+    Pages: "/" lists packages and modules, "/NAME.md" is documentation of
+    module or package by qualified name, "/_stats" is cache statistics in
+    JSON, source links lead to module sources.
+
+    Args:
+        docs: DocumentationCache, documentation cache
+        host: str, address to listen, local only by default
+        port: int, port to listen, 8000 by default
+    """
+
+    with _Server((host, port), docs) as server:
+        print(
+            f'Serving {docs.source_path} at '
+            f'http://{host}:{server.server_address[1]}/',
+            file=sys.stderr
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='pymdocs serve',
+        description=(
+            'Serves documentation rendered on request, unchanged modules are '
+            'served from memory'
+        )
+    )
+
+    parser.add_argument(
+        'SOURCE_PATH',
+        help='Path to Python source code'
+    )
+
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen'
+    )
+
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8000,
+        help='Port to listen, 0 picks a free port'
+    )
+
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Keep compact definitions instead of modules AST, saves memory'
+    )
+
+    parser.add_argument(
+        '--shallow',
+        action='store_true',
+        help=(
+            'Read only signatures and docstrings from tokens, skipping '
+            'function bodies, implies --compact'
+        )
+    )
+
+    parser.add_argument(
+        '--docstring-style',
+        choices=DOCSTRING_STYLE_MODES + [
+            style.name.lower()
+            for style in DocstringStyle
+        ],
+        default='detect',
+        help=(
+            'Docstring style: detect style of every docstring, pick one style '
+            'by the first docstrings (auto) or use the given style'
+        )
+    )
+
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='PATTERN',
+        help=(
+            'Glob pattern of source paths to skip, could be used several '
+            'times'
+        )
+    )
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.SOURCE_PATH):
+        parser.error(f'Source path {args.SOURCE_PATH} doesn\'t exist')
+
+    docstring_style, docstring_sample = docstring_options(
+        args.docstring_style,
+        DEFAULT_SAMPLE_SIZE
+    )
+
+    docs = DocumentationCache(
+        args.SOURCE_PATH,
+        walker=SourceWalker(
+            exclude=args.exclude,
+            default_exclude=DEFAULT_EXCLUDE
+        ),
+        compact=args.compact,
+        shallow=args.shallow,
+        docstring_style=docstring_style,
+        docstring_sample=docstring_sample
+    )
+
+    try:
+        docs.layout()
+    except ValueError as e:
+        parser.error(str(e))
+
+    serve(docs, args.host, args.port)
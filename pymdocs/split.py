@@ -0,0 +1,192 @@
+import os
+import re
+from typing import List, Optional, Set, Tuple, Union
+
+from pymdocs.formatters.base import FormatterType
+from pymdocs.formatters.common_formatter import Formatter
+from pymdocs.formatters.module_formatter import ModuleFormatter
+from pymdocs.formatters.package_formatter import PackageFormatter
+from pymdocs.output import save
+from pymdocs.parsers.ast import AnyModuleDefinition, PackageDefinition
+
+# Name of documentation file with links to modules documentation files
+INDEX_FILE_NAME = 'index.md'
+
+# Link to module documentation file in the same directory
+_FILE_LINK_PATTERN = re.compile(r'\]\(([^()/\\]+\.md)\)')
+
+
+def module_file_name(module_name: str) -> str:
+    """
+    Returns name of module documentation file
+
+    Args:
+        module_name: str, qualified module name
+
+    Returns:
+        str: file name
+    """
+    return f'{module_name}.md'
+
+
+class SplitWriter:
+    """
+    Writes documentation of every module to its own file in documentation
+    directory, together with index file linking them
+
+    Modules are formatted, rendered and written by a pool of threads, one
+    module per task, so markdown of only the modules being written is kept
+    in memory. Files which already have the same content aren't rewritten,
+    so their modification times are kept, changed files are replaced
+    atomically. Files of modules listed by the previous index file but not
+    by the new one are removed, other files of the directory are kept.
+
+    Attributes:
+        doc_dir: str, path to documentation directory
+        formatter: Formatter, markdown formatter
+        workers: (int | None), number of threads, ThreadPoolExecutor
+            default if None, modules are written one by one if 1
+        check: bool, only compare documentation with existing files,
+            nothing is written
+    """
+
+    def __init__(
+        self,
+        doc_dir: str,
+        formatter: Optional[Formatter] = None,
+        workers: Optional[int] = None,
+        check: bool = False
+    ):
+        self.doc_dir = doc_dir
+        self.formatter = formatter or Formatter()
+        self.workers = workers
+        self.check = check
+
+    def write(
+        self,
+        definition: Union[PackageDefinition, AnyModuleDefinition]
+    ) -> List[str]:
+        """
+        Writes modules documentation files and index file
+
+        Args:
+            definition: (PackageDefinition | ModuleDefinition |
+                ModuleRecord), package or module definition
+
+        Returns:
+            list[str]: paths of files which content differs from
+                documentation and of stale module files, they are written
+                or removed unless check is set
+        """
+
+        module_formatter: ModuleFormatter = (
+            self.formatter.formatters[FormatterType.MODULE]
+        )
+        package_formatter: PackageFormatter = (
+            self.formatter.formatters[FormatterType.PACKAGE]
+        )
+
+        modules: List[Tuple[str, Optional[str], AnyModuleDefinition]] = (
+            [
+                (f'{package_name}.{module_def.name}', package_name, module_def)
+                for package_name, module_def
+                in package_formatter.iter_modules(definition)
+            ]
+            if isinstance(definition, PackageDefinition)
+            else [(definition.name, None, definition)]
+        )
+
+        if not self.check:
+            os.makedirs(self.doc_dir, exist_ok=True)
+
+        index_path = os.path.join(self.doc_dir, INDEX_FILE_NAME)
+        file_names = [
+            module_file_name(module_name)
+            for module_name, _, _ in modules
+        ]
+        stale = sorted(self._listed_files(index_path) - set(file_names))
+        index = package_formatter.format_contents(
+            definition.name,
+            [
+                module_formatter.module_file_link(module_name, file_name)
+                for (module_name, _, _), file_name in zip(modules, file_names)
+            ]
+        )
+        changed = (
+            [index_path]
+            if save(index, index_path, self.check)
+            else []
+        )
+        changed.extend(
+            path
+            for path in (
+                os.path.join(self.doc_dir, file_name)
+                for file_name in stale
+            )
+            if self._remove(path)
+        )
+
+        if self.workers == 1 or len(modules) < 2:
+            paths = [self._write_module(*module) for module in modules]
+        else:
+            # Thread pool is imported only when modules are written in
+            # parallel
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                paths = list(executor.map(
+                    lambda module: self._write_module(*module),
+                    modules
+                ))
+
+        changed.extend(path for path in paths if path is not None)
+        return changed
+
+    @staticmethod
+    def _listed_files(index_path: str) -> Set[str]:
+        """Returns names of module files linked by existing index file"""
+        try:
+            with open(index_path) as f:
+                return set(_FILE_LINK_PATTERN.findall(f.read()))
+        except OSError:
+            return set()
+
+    def _remove(self, path: str) -> bool:
+        """
+        Removes stale module file, nothing is removed if check is set
+
+        Returns:
+            bool: True if file exists
+        """
+
+        if self.check:
+            return os.path.exists(path)
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return False
+
+        return True
+
+    def _write_module(
+        self,
+        module_name: str,
+        package_name: Optional[str],
+        module_def: AnyModuleDefinition
+    ) -> Optional[str]:
+        """
+        Formats module and writes its documentation file if it has changed
+
+        Returns:
+            (str | None): path of changed file, None if file is unchanged
+        """
+
+        module_formatter: ModuleFormatter = (
+            self.formatter.formatters[FormatterType.MODULE]
+        )
+
+        # Source links are relative to the module documentation file
+        path = os.path.join(self.doc_dir, module_file_name(module_name))
+        document = module_formatter.format(module_def, path, package_name)
+        return path if save(document, path, self.check) else None
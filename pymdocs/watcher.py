@@ -0,0 +1,124 @@
+import sys
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from pymdocs.incremental import IncrementalBuilder
+from pymdocs.parsers.walker import SourceFile, SourcePackage
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class Watcher:
+    """
+    Regenerates documentation when Python sources change
+
+    Sources are polled with the builder walker, snapshot of modules
+    modification times and sizes is compared with the previous one. Bursts
+    of changes are debounced: documentation is regenerated once sources stay
+    unchanged for debounce time. Builder keeps markdown of unchanged modules
+    in memory, so only changed modules are parsed and formatted again.
+
+    Attributes:
+        builder: IncrementalBuilder, documentation builder
+        interval: float, seconds between sources polls
+        debounce: float, seconds sources have to stay unchanged
+    """
+
+    def __init__(
+        self,
+        builder: IncrementalBuilder,
+        interval: float = 0.5,
+        debounce: float = 0.2
+    ):
+        self.builder = builder
+        self.interval = interval
+        self.debounce = debounce
+
+    def snapshot(
+        self
+    ) -> Tuple[Optional[Union[SourceFile, SourcePackage]], Snapshot]:
+        """
+        Walks sources and collects modules modification times and sizes
+
+        Returns:
+            tuple[(SourceFile | SourcePackage | None), dict[str, tuple[int,
+                int]]]: sources layout and modification time and size by
+                module path
+        """
+
+        tree = self.builder.walker.walk(self.builder.source_path)
+        if tree is None:
+            return None, {}
+
+        files = (
+            [tree]
+            if isinstance(tree, SourceFile)
+            else tree.iter_modules()
+        )
+
+        return tree, {
+            module_file.path: (module_file.mtime_ns, module_file.size)
+            for module_file in files
+        }
+
+    def regenerate(
+        self,
+        tree: Optional[Union[SourceFile, SourcePackage]] = None
+    ) -> None:
+        """
+        Builds documentation and reports regeneration latency to stderr
+
+        Args:
+            tree: (SourceFile | SourcePackage | None), sources layout
+        """
+
+        start = time.perf_counter()
+        try:
+            changes = self.builder.build(tree)
+        except Exception as e:
+            # Sources could be broken while being edited, watching goes on
+            print(
+                f'Failed to regenerate documentation: {e!r}',
+                file=sys.stderr
+            )
+            return
+
+        elapsed = (time.perf_counter() - start) * 1000
+        print(
+            f'{self.builder.doc_path} regenerated in {elapsed:.1f} ms, '
+            f'{len(changes)} modules changed',
+            file=sys.stderr
+        )
+
+    def watch(self, cycles: Optional[int] = None) -> None:
+        """
+        Regenerates documentation on every sources change until interrupted
+
+        Args:
+            cycles: (int | None), number of polls before return, polls
+                forever if None
+        """
+
+        tree, snapshot = self.snapshot()
+        self.regenerate(tree)
+
+        while cycles is None or cycles > 0:
+            if cycles is not None:
+                cycles -= 1
+
+            time.sleep(self.interval)
+            tree, current = self.snapshot()
+            if current == snapshot:
+                continue
+
+            # Waiting for the end of changes burst, e.g. saving several files
+            while True:
+                time.sleep(self.debounce)
+                tree, latest = self.snapshot()
+                if latest == current:
+                    break
+
+                current = latest
+
+            snapshot = current
+            self.regenerate(tree)
@@ -15,9 +15,9 @@ def get_readme():
 setup(
     name='pymdocs',
     description='Library generating markdown code reference',
-    version='0.1.0',
-    packages=find_packages(),  # list of all packages
-    python_requires='>=3.7',  # any python greater than 3.7
+    version='0.2.0',
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
+    python_requires='>=3.8',  # any python greater than 3.8
     include_package_data=True,
     author='Evgenii Panteleev',
     long_description=get_readme(),